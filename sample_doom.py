@@ -29,10 +29,7 @@ def set_logger():
 
 
 if __name__ == "__main__":
-    with open("./assets/pywasm3-doom-demo/wasidoom.wasm", "rb") as f:
-        wasm = f.read()
-
-    data = WasmLoader().load(wasm)
+    data = WasmLoader().load_file("./assets/pywasm3-doom-demo/wasidoom.wasm")
     optimizer = WasmOptimizer().optimize(data)
 
     screen = Screen()
@@ -54,5 +51,6 @@ if __name__ == "__main__":
 
     np.seterr(all="ignore")
     assert set_logger()
-    execute.start(b"_start", [])
+    with ins:
+        execute.start(b"_start", [])
     # exec.start(b"main", [])
@@ -51,13 +51,10 @@ class Env(WasiBase):
 
 
 if __name__ == "__main__":
-    with open("./assets/execute/target/wasm32-wasi/release/http_server.wasm", "rb") as f:
-        wasm = f.read()
-
     np.seterr(all="ignore")
     assert set_logger()
 
-    data = WasmLoader().load(wasm)
+    data = WasmLoader().load_file("./assets/execute/target/wasm32-wasi/release/http_server.wasm")
     optimizer = WasmOptimizer().optimize(data)
 
     files = FS()
@@ -71,5 +68,6 @@ if __name__ == "__main__":
     env_ins.init(exec)
     ins.init(exec=exec, fs=files)
 
-    exec.start(b"_start", [])
+    with ins:
+        exec.start(b"_start", [])
     # exec.start(b"main", [])
@@ -28,13 +28,10 @@ def set_logger():
 
 
 if __name__ == "__main__":
-    with open("./assets/mewz/examples/hello_world/target/wasm32-wasi/release/hello_world.wasm", "rb") as f:
-        wasm = f.read()
-
     np.seterr(all="ignore")
     assert set_logger()
 
-    data = WasmLoader().load(wasm)
+    data = WasmLoader().load_file("./assets/mewz/examples/hello_world/target/wasm32-wasi/release/hello_world.wasm")
     optimizer = WasmOptimizer().optimize(data)
 
     ins = Wasi()
@@ -44,5 +41,6 @@ if __name__ == "__main__":
     exec = WasmExec(optimizer, export + dummy)
     ins.init(exec=exec)
 
-    exec.start(b"_start", [])
+    with ins:
+        exec.start(b"_start", [])
     # exec.start(b"main", [])
@@ -28,13 +28,10 @@ def set_logger():
 
 
 if __name__ == "__main__":
-    with open("./assets/wasm_http_server/target/wasm32-wasi/release/http_server.wasm", "rb") as f:
-        wasm = f.read()
-
     np.seterr(all="ignore")
     assert set_logger()
 
-    data = WasmLoader().load(wasm)
+    data = WasmLoader().load_file("./assets/wasm_http_server/target/wasm32-wasi/release/http_server.wasm")
     optimizer = WasmOptimizer().optimize(data)
 
     files = FS()
@@ -46,5 +43,6 @@ if __name__ == "__main__":
     exec = WasmExec(optimizer, export + dummy)
     ins.init(exec=exec, fs=files)
 
-    exec.start(b"_start", [])
+    with ins:
+        exec.start(b"_start", [])
     # exec.start(b"main", [])
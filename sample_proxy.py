@@ -50,13 +50,10 @@ def proxy(name: str, path: str = ""):
 
 
 if __name__ == "__main__":
-    with open("./assets/wasm_static_file_server/target/wasm32-wasi/release/static_file_server.wasm", "rb") as f:
-        wasm = f.read()
-
     np.seterr(all="ignore")
     assert set_logger()
 
-    data = WasmLoader().load(wasm)
+    data = WasmLoader().load_file("./assets/wasm_static_file_server/target/wasm32-wasi/release/static_file_server.wasm")
     optimizer = WasmOptimizer().optimize(data)
 
     files = FS()
@@ -95,4 +92,5 @@ if __name__ == "__main__":
     exec = WasmExec(optimizer, export + dummy)
     ins.init(exec=exec, fs=files)
 
-    exec.start(b"_start", [])
+    with ins:
+        exec.start(b"_start", [])
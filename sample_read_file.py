@@ -29,13 +29,10 @@ def set_logger():
 
 
 if __name__ == "__main__":
-    with open("./assets/read_file.wasm", "rb") as f:
-        wasm = f.read()
-
     np.seterr(all="ignore")
     assert set_logger()
 
-    data = WasmLoader().load(wasm)
+    data = WasmLoader().load_file("./assets/read_file.wasm")
     optimizer = WasmOptimizer().optimize(data)
 
     text = "Hello, World!"
@@ -50,5 +47,6 @@ if __name__ == "__main__":
     exec = WasmExec(optimizer, export)
     ins.init(exec=exec, fs=files)
 
-    exec.start(b"_start", [])
+    with ins:
+        exec.start(b"_start", [])
     # exec.start(b"main", [])
@@ -19,11 +19,9 @@ if __name__ == "__main__":
 
     # 引数を解析してWasmバイナリを読み込む
     args = sys.argv
-    with open(args[1], "rb") as f:
-        wasm = f.read()
 
     # Wasmバイナリを読み込んで実行する
-    data = WasmLoader().load(wasm)
+    data = WasmLoader().load_file(args[1])
     optimizer = WasmOptimizer().optimize(data)
     res = WasmExec(optimizer).start(field=b"_start", param=[])
     logging.info(f"result: {res}")
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import BinaryIO, Optional, Union
 
 
 class ByteReader:
@@ -82,3 +82,73 @@ class ByteReader:
     def __repr__(self):
         """デバッグ用の文字列表現を返す"""
         return f"ByteReader({self.data})"
+
+
+class ByteStreamReader:
+    """ファイルオブジェクトからバイト列を逐次読み取るためのクラス"""
+
+    SKIP_CHUNK = 64 * 1024
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.pending: Optional[int] = None
+        self.offset = 0
+
+    def read_byte(self) -> int:
+        """次のバイトを読み取る"""
+        self.offset += 1
+        if self.pending is not None:
+            byte, self.pending = self.pending, None
+            return byte
+        data = self.file.read(1)
+        if not data:
+            raise EOFError("unexpected end of stream")
+        return data[0]
+
+    def read_bytes(self, n: int) -> ByteReader:
+        """nバイトを読み取り、ByteReaderとして返す"""
+        self.offset += n
+        head = b""
+        if self.pending is not None and n > 0:
+            head, self.pending = bytes([self.pending]), None
+            n -= 1
+        data = head + self.file.read(n)
+        if len(data) != len(head) + n:
+            raise EOFError("unexpected end of stream")
+        return ByteReader(data)
+
+    def read_leb128(self) -> int:
+        """LEB128形式の数値を読み取る"""
+        result = 0
+        shift = 0
+        while True:
+            byte = self.read_byte()
+            result |= (byte & 0x7F) << shift
+            shift += 7
+            if byte & 0x80 == 0:
+                break
+        return result
+
+    def skip(self, n: int):
+        """nバイトを読み飛ばす。シーク可能なら読み込まずに移動する"""
+        self.offset += n
+        if self.pending is not None and n > 0:
+            self.pending = None
+            n -= 1
+        if self.file.seekable():
+            self.file.seek(n, 1)
+            return
+        while n > 0:
+            data = self.file.read(min(n, self.SKIP_CHUNK))
+            if not data:
+                raise EOFError("unexpected end of stream")
+            n -= len(data)
+
+    def has_next(self) -> bool:
+        """まだ読み取れるバイトが残っているかどうかを返す"""
+        if self.pending is None:
+            data = self.file.read(1)
+            if not data:
+                return False
+            self.pending = data[0]
+        return True
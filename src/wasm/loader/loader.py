@@ -1,7 +1,9 @@
+import io
 import logging
-from typing import TypeVar
+import os
+from typing import BinaryIO, TypeVar, Union
 
-from src.tools.byte import ByteReader
+from src.tools.byte import ByteReader, ByteStreamReader
 from src.tools.logger import NestedLogger
 from src.wasm.loader.helper import CodeSectionSpecHelper
 from src.wasm.loader.spec import BlockType
@@ -16,13 +18,16 @@ from src.wasm.loader.struct import (
     ImportSection,
     MemorySection,
     ModeActive,
+    NameSection,
     StartSection,
     TableSection,
     TypeSection,
     WasmSections,
 )
+from src.wasm.type.numeric.base import NumericType
 from src.wasm.type.numeric.numpy.float import F32, F64
 from src.wasm.type.numeric.numpy.int import I32, I64, SignedI32, SignedI64
+from src.wasm.type.numeric.numpy.v128 import V128
 
 
 class WasmLoader:
@@ -31,10 +36,40 @@ class WasmLoader:
     logger = NestedLogger(logging.getLogger(__name__))
     T = TypeVar("T")
 
+    SECTIONS = {
+        1: "type_section",
+        2: "import_section",
+        3: "function_section",
+        4: "table_section",
+        5: "memory_section",
+        6: "global_section",
+        7: "export_section",
+        8: "start_section",
+        9: "element_section",
+        10: "code_section",
+        11: "data_section",
+    }
+
+    def __init__(self):
+        # 定数の即値は不変なので、同じ値は1つのインスタンスを共有する
+        self.consts: dict[tuple[type, Union[int, bytes]], NumericType] = {}
+
     @logger.logger
     def load(self, bin: bytes) -> WasmSections:
         """Wasmバイナリを読み込んで解析する"""
-        data = ByteReader(bin)
+        return self.load_file(io.BytesIO(bin))
+
+    @logger.logger
+    def load_file(self, file: Union[str, os.PathLike, BinaryIO]) -> WasmSections:
+        """ファイルパスまたはバイナリファイルオブジェクトからWasmバイナリを読み込んで解析する
+
+        セクションは1つずつ読み込み、カスタムセクションと未知のセクションは読み込まずに読み飛ばす。
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                return self.load_file(f)
+
+        data = ByteStreamReader(file)
 
         # マジックナンバーとバージョン番号を確認
         if data.read_bytes(4) != bytes([0, 97, 115, 109]):
@@ -49,32 +84,16 @@ class WasmLoader:
         while data.has_next():
             id = data.read_byte()
             size = data.read_leb128()
-            section = data.read_bytes(size)
             assert self.logger.debug(f"id: {id}, size: {size}")
-            if id == 2:
-                res.extend(self.import_section(section))
-            elif id == 1:
-                res.extend(self.type_section(section))
-            elif id == 3:
-                res.extend(self.function_section(section))
-            elif id == 4:
-                res.extend(self.table_section(section))
-            elif id == 5:
-                res.extend(self.memory_section(section))
-            elif id == 6:
-                res.extend(self.global_section(section))
-            elif id == 8:
-                res.extend(self.start_section(section))
-            elif id == 9:
-                res.extend(self.element_section(section))
-            elif id == 10:
-                res.extend(self.code_section(section))
-            elif id == 7:
-                res.extend(self.export_section(section))
-            elif id == 11:
-                res.extend(self.data_section(section))
-            else:
+            if id == 0:
+                res.extend(self.custom_section(data, size))
+                continue
+            if id not in self.SECTIONS:
                 assert self.logger.error(f"unknown id: {id}")
+                data.skip(size)
+                continue
+            section = data.read_bytes(size)
+            res.extend(getattr(self, self.SECTIONS[id])(section))
 
         sections = WasmSections(
             import_section=[x for x in res if isinstance(x, ImportSection)],
@@ -88,11 +107,30 @@ class WasmLoader:
             code_section=[x for x in res if isinstance(x, CodeSection)],
             export_section=[x for x in res if isinstance(x, ExportSection)],
             data_section=[x for x in res if isinstance(x, DataSection)],
+            name_section=[x for x in res if isinstance(x, NameSection)],
         )
 
         # 解析結果を返す
         return sections
 
+    @logger.logger
+    def custom_section(self, data: ByteStreamReader, size: int) -> list[NameSection]:
+        """Custom Sectionを読み込む
+
+        name セクションのみ中身を保持し、解析は WasmNameIndex で必要になった時に行う。
+        それ以外のカスタムセクションは読み飛ばす。
+        """
+        start = data.offset
+        name = data.read_bytes(data.read_leb128())
+        rest = size - (data.offset - start)
+        assert self.logger.debug(f"custom section: {name.data!r}")
+
+        if name == b"name":
+            return [NameSection(data=data.read_bytes(rest))]
+
+        data.skip(rest)
+        return []
+
     @logger.logger
     def import_section(self, data: ByteReader) -> list:
         """Import Sectionを読み込む"""
@@ -377,7 +415,8 @@ class WasmLoader:
         while stack >= 0:
             opcode = data.read_byte()
             if CodeSectionSpecHelper.is_prefix(opcode):
-                opcode = (opcode << 8) | data.read_byte()
+                # プレフィックスに続く命令番号は LEB128 で表される
+                opcode = (opcode << 8) | data.read_leb128()
 
             fn = CodeSectionSpecHelper.mapped(opcode)
             block_type = CodeSectionSpecHelper.get_block_type(opcode)
@@ -393,14 +432,14 @@ class WasmLoader:
             for annotation in annotations:
                 if annotation == int:  # noqa: E721
                     args.append(data.read_leb128())
-                elif annotation == I32:
-                    args.append(I32.astype(SignedI32.from_int(data.read_sleb128())))
-                elif annotation == I64:
-                    args.append(I64.astype(SignedI64.from_int(data.read_sleb128())))
+                elif annotation == I32 or annotation == I64:
+                    args.append(self.const(annotation, data.read_sleb128()))
                 elif annotation == F32:
-                    args.append(F32.from_bits(data.read_f32()))
+                    args.append(self.const(F32, data.read_f32()))
                 elif annotation == F64:
-                    args.append(F64.from_bits(data.read_f64()))
+                    args.append(self.const(F64, data.read_f64()))
+                elif annotation == V128:
+                    args.append(self.const(V128, data.read_bytes(16).data))
                 elif annotation == list[int]:
                     count = data.read_leb128()
                     args.append([data.read_byte() for _ in range(count + 1)])
@@ -411,6 +450,20 @@ class WasmLoader:
             res.append(instruction)
         return res[:-1]
 
+    def const(self, type: type[NumericType], value: Union[int, bytes]) -> NumericType:
+        """定数の即値を生成する"""
+        key = (type, value)
+        res = self.consts.get(key)
+        if res is None:
+            if type is I32:
+                res = I32.astype(SignedI32.from_int(value))
+            elif type is I64:
+                res = I64.astype(SignedI64.from_int(value))
+            else:
+                res = type.from_bits(value)
+            self.consts[key] = res
+        return res
+
     @logger.logger
     def code_section_local(self, data: ByteReader) -> list[int]:
         """Code Sectionのローカル変数を読み込む"""
@@ -0,0 +1,63 @@
+from typing import Optional
+
+from src.tools.byte import ByteReader
+
+
+class WasmNameIndex:
+    """Name Sectionから関数名とローカル変数名を引くためのクラス
+
+    サブセクションは最初に参照された時に解析し、以降は辞書から引く。
+    """
+
+    MODULE = 0
+    FUNCTION = 1
+    LOCAL = 2
+
+    def __init__(self, data: Optional[ByteReader] = None):
+        self.data = data
+        self.subsections: Optional[dict[int, bytes]] = None
+        self.functions: Optional[dict[int, str]] = None
+        self.locals: Optional[dict[int, dict[int, str]]] = None
+
+    def get_subsection(self, id: int) -> Optional[ByteReader]:
+        """サブセクションのデータを取得する"""
+        if self.subsections is None:
+            self.subsections = {}
+            data = self.data.copy() if self.data is not None else ByteReader(b"")
+            while data.has_next():
+                sub_id = data.read_byte()
+                size = data.read_leb128()
+                self.subsections[sub_id] = data.read_bytes(size).data
+        sub = self.subsections.get(id)
+        return ByteReader(sub) if sub is not None else None
+
+    @staticmethod
+    def read_name(data: ByteReader) -> str:
+        return data.read_bytes(data.read_leb128()).data.decode("utf-8", errors="replace")
+
+    @classmethod
+    def read_name_map(cls, data: ByteReader) -> dict[int, str]:
+        return {data.read_leb128(): cls.read_name(data) for _ in range(data.read_leb128())}
+
+    def module(self) -> Optional[str]:
+        """モジュール名を取得する"""
+        data = self.get_subsection(self.MODULE)
+        return self.read_name(data) if data is not None else None
+
+    def function(self, index: int) -> Optional[str]:
+        """関数名を取得する"""
+        if self.functions is None:
+            data = self.get_subsection(self.FUNCTION)
+            self.functions = self.read_name_map(data) if data is not None else {}
+        return self.functions.get(index)
+
+    def local(self, function: int, index: int) -> Optional[str]:
+        """ローカル変数名を取得する"""
+        if self.locals is None:
+            data = self.get_subsection(self.LOCAL)
+            self.locals = {}
+            if data is not None:
+                for _ in range(data.read_leb128()):
+                    function_index = data.read_leb128()
+                    self.locals[function_index] = self.read_name_map(data)
+        return self.locals.get(function, {}).get(index)
@@ -4,6 +4,7 @@ from typing import Callable
 
 from src.wasm.type.numeric.numpy.float import F32, F64
 from src.wasm.type.numeric.numpy.int import I32, I64
+from src.wasm.type.numeric.numpy.v128 import V128
 
 
 class BlockType(Enum):
@@ -105,6 +106,16 @@ class CodeSectionSpec(ABC):
     def call_indirect(self, index: int, elm_index: int):
         pass
 
+    @abstractmethod
+    @Metadata.opcode(0x12)
+    def return_call(self, index: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0x13)
+    def return_call_indirect(self, index: int, elm_index: int):
+        pass
+
     @abstractmethod
     @Metadata.opcode(0x1A)
     def drop(self):
@@ -1051,3 +1062,1185 @@ class CodeSectionSpec(ABC):
     @Metadata.opcode(0xFC11)
     def table_fill(self, index: int):
         pass
+
+    # Vector Instructions
+
+    @abstractmethod
+    @Metadata.opcode(0xFD00)
+    def v128_load(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD01)
+    def v128_load8x8_s(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD02)
+    def v128_load8x8_u(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD03)
+    def v128_load16x4_s(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD04)
+    def v128_load16x4_u(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD05)
+    def v128_load32x2_s(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD06)
+    def v128_load32x2_u(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD07)
+    def v128_load8_splat(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD08)
+    def v128_load16_splat(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD09)
+    def v128_load32_splat(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD0A)
+    def v128_load64_splat(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD0B)
+    def v128_store(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD0C)
+    def v128_const(self, value: V128):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD0D)
+    def i8x16_shuffle(self, lanes: V128):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD0E)
+    def i8x16_swizzle(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD0F)
+    def i8x16_splat(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD10)
+    def i16x8_splat(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD11)
+    def i32x4_splat(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD12)
+    def i64x2_splat(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD13)
+    def f32x4_splat(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD14)
+    def f64x2_splat(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD15)
+    def i8x16_extract_lane_s(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD16)
+    def i8x16_extract_lane_u(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD17)
+    def i8x16_replace_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD18)
+    def i16x8_extract_lane_s(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD19)
+    def i16x8_extract_lane_u(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD1A)
+    def i16x8_replace_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD1B)
+    def i32x4_extract_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD1C)
+    def i32x4_replace_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD1D)
+    def i64x2_extract_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD1E)
+    def i64x2_replace_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD1F)
+    def f32x4_extract_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD20)
+    def f32x4_replace_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD21)
+    def f64x2_extract_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD22)
+    def f64x2_replace_lane(self, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD23)
+    def i8x16_eq(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD24)
+    def i8x16_ne(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD25)
+    def i8x16_lt_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD26)
+    def i8x16_lt_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD27)
+    def i8x16_gt_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD28)
+    def i8x16_gt_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD29)
+    def i8x16_le_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD2A)
+    def i8x16_le_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD2B)
+    def i8x16_ge_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD2C)
+    def i8x16_ge_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD2D)
+    def i16x8_eq(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD2E)
+    def i16x8_ne(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD2F)
+    def i16x8_lt_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD30)
+    def i16x8_lt_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD31)
+    def i16x8_gt_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD32)
+    def i16x8_gt_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD33)
+    def i16x8_le_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD34)
+    def i16x8_le_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD35)
+    def i16x8_ge_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD36)
+    def i16x8_ge_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD37)
+    def i32x4_eq(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD38)
+    def i32x4_ne(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD39)
+    def i32x4_lt_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD3A)
+    def i32x4_lt_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD3B)
+    def i32x4_gt_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD3C)
+    def i32x4_gt_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD3D)
+    def i32x4_le_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD3E)
+    def i32x4_le_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD3F)
+    def i32x4_ge_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD40)
+    def i32x4_ge_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD41)
+    def f32x4_eq(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD42)
+    def f32x4_ne(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD43)
+    def f32x4_lt(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD44)
+    def f32x4_gt(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD45)
+    def f32x4_le(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD46)
+    def f32x4_ge(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD47)
+    def f64x2_eq(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD48)
+    def f64x2_ne(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD49)
+    def f64x2_lt(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD4A)
+    def f64x2_gt(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD4B)
+    def f64x2_le(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD4C)
+    def f64x2_ge(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD4D)
+    def v128_not(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD4E)
+    def v128_and(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD4F)
+    def v128_andnot(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD50)
+    def v128_or(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD51)
+    def v128_xor(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD52)
+    def v128_bitselect(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD53)
+    def v128_any_true(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD54)
+    def v128_load8_lane(self, align: int, offset: int, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD55)
+    def v128_load16_lane(self, align: int, offset: int, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD56)
+    def v128_load32_lane(self, align: int, offset: int, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD57)
+    def v128_load64_lane(self, align: int, offset: int, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD58)
+    def v128_store8_lane(self, align: int, offset: int, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD59)
+    def v128_store16_lane(self, align: int, offset: int, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD5A)
+    def v128_store32_lane(self, align: int, offset: int, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD5B)
+    def v128_store64_lane(self, align: int, offset: int, lane: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD5C)
+    def v128_load32_zero(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD5D)
+    def v128_load64_zero(self, align: int, offset: int):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD5E)
+    def f32x4_demote_f64x2_zero(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD5F)
+    def f64x2_promote_low_f32x4(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD60)
+    def i8x16_abs(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD61)
+    def i8x16_neg(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD62)
+    def i8x16_popcnt(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD63)
+    def i8x16_all_true(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD64)
+    def i8x16_bitmask(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD65)
+    def i8x16_narrow_i16x8_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD66)
+    def i8x16_narrow_i16x8_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD67)
+    def f32x4_ceil(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD68)
+    def f32x4_floor(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD69)
+    def f32x4_trunc(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD6A)
+    def f32x4_nearest(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD6B)
+    def i8x16_shl(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD6C)
+    def i8x16_shr_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD6D)
+    def i8x16_shr_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD6E)
+    def i8x16_add(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD6F)
+    def i8x16_add_sat_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD70)
+    def i8x16_add_sat_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD71)
+    def i8x16_sub(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD72)
+    def i8x16_sub_sat_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD73)
+    def i8x16_sub_sat_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD74)
+    def f64x2_ceil(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD75)
+    def f64x2_floor(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD76)
+    def i8x16_min_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD77)
+    def i8x16_min_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD78)
+    def i8x16_max_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD79)
+    def i8x16_max_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD7A)
+    def f64x2_trunc(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD7B)
+    def i8x16_avgr_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD7C)
+    def i16x8_extadd_pairwise_i8x16_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD7D)
+    def i16x8_extadd_pairwise_i8x16_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD7E)
+    def i32x4_extadd_pairwise_i16x8_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD7F)
+    def i32x4_extadd_pairwise_i16x8_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD80)
+    def i16x8_abs(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD81)
+    def i16x8_neg(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD82)
+    def i16x8_q15mulr_sat_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD83)
+    def i16x8_all_true(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD84)
+    def i16x8_bitmask(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD85)
+    def i16x8_narrow_i32x4_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD86)
+    def i16x8_narrow_i32x4_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD87)
+    def i16x8_extend_low_i8x16_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD88)
+    def i16x8_extend_high_i8x16_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD89)
+    def i16x8_extend_low_i8x16_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD8A)
+    def i16x8_extend_high_i8x16_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD8B)
+    def i16x8_shl(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD8C)
+    def i16x8_shr_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD8D)
+    def i16x8_shr_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD8E)
+    def i16x8_add(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD8F)
+    def i16x8_add_sat_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD90)
+    def i16x8_add_sat_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD91)
+    def i16x8_sub(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD92)
+    def i16x8_sub_sat_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD93)
+    def i16x8_sub_sat_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD94)
+    def f64x2_nearest(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD95)
+    def i16x8_mul(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD96)
+    def i16x8_min_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD97)
+    def i16x8_min_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD98)
+    def i16x8_max_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD99)
+    def i16x8_max_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD9B)
+    def i16x8_avgr_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD9C)
+    def i16x8_extmul_low_i8x16_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD9D)
+    def i16x8_extmul_high_i8x16_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD9E)
+    def i16x8_extmul_low_i8x16_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFD9F)
+    def i16x8_extmul_high_i8x16_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDA0)
+    def i32x4_abs(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDA1)
+    def i32x4_neg(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDA3)
+    def i32x4_all_true(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDA4)
+    def i32x4_bitmask(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDA7)
+    def i32x4_extend_low_i16x8_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDA8)
+    def i32x4_extend_high_i16x8_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDA9)
+    def i32x4_extend_low_i16x8_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDAA)
+    def i32x4_extend_high_i16x8_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDAB)
+    def i32x4_shl(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDAC)
+    def i32x4_shr_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDAD)
+    def i32x4_shr_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDAE)
+    def i32x4_add(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDB1)
+    def i32x4_sub(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDB5)
+    def i32x4_mul(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDB6)
+    def i32x4_min_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDB7)
+    def i32x4_min_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDB8)
+    def i32x4_max_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDB9)
+    def i32x4_max_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDBA)
+    def i32x4_dot_i16x8_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDBC)
+    def i32x4_extmul_low_i16x8_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDBD)
+    def i32x4_extmul_high_i16x8_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDBE)
+    def i32x4_extmul_low_i16x8_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDBF)
+    def i32x4_extmul_high_i16x8_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDC0)
+    def i64x2_abs(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDC1)
+    def i64x2_neg(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDC3)
+    def i64x2_all_true(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDC4)
+    def i64x2_bitmask(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDC7)
+    def i64x2_extend_low_i32x4_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDC8)
+    def i64x2_extend_high_i32x4_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDC9)
+    def i64x2_extend_low_i32x4_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDCA)
+    def i64x2_extend_high_i32x4_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDCB)
+    def i64x2_shl(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDCC)
+    def i64x2_shr_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDCD)
+    def i64x2_shr_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDCE)
+    def i64x2_add(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDD1)
+    def i64x2_sub(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDD5)
+    def i64x2_mul(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDD6)
+    def i64x2_eq(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDD7)
+    def i64x2_ne(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDD8)
+    def i64x2_lt_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDD9)
+    def i64x2_gt_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDDA)
+    def i64x2_le_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDDB)
+    def i64x2_ge_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDDC)
+    def i64x2_extmul_low_i32x4_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDDD)
+    def i64x2_extmul_high_i32x4_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDDE)
+    def i64x2_extmul_low_i32x4_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDDF)
+    def i64x2_extmul_high_i32x4_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE0)
+    def f32x4_abs(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE1)
+    def f32x4_neg(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE3)
+    def f32x4_sqrt(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE4)
+    def f32x4_add(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE5)
+    def f32x4_sub(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE6)
+    def f32x4_mul(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE7)
+    def f32x4_div(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE8)
+    def f32x4_min(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDE9)
+    def f32x4_max(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDEA)
+    def f32x4_pmin(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDEB)
+    def f32x4_pmax(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDEC)
+    def f64x2_abs(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDED)
+    def f64x2_neg(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDEF)
+    def f64x2_sqrt(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF0)
+    def f64x2_add(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF1)
+    def f64x2_sub(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF2)
+    def f64x2_mul(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF3)
+    def f64x2_div(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF4)
+    def f64x2_min(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF5)
+    def f64x2_max(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF6)
+    def f64x2_pmin(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF7)
+    def f64x2_pmax(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF8)
+    def i32x4_trunc_sat_f32x4_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDF9)
+    def i32x4_trunc_sat_f32x4_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDFA)
+    def f32x4_convert_i32x4_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDFB)
+    def f32x4_convert_i32x4_u(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDFC)
+    def i32x4_trunc_sat_f64x2_s_zero(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDFD)
+    def i32x4_trunc_sat_f64x2_u_zero(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDFE)
+    def f64x2_convert_low_i32x4_s(self):
+        pass
+
+    @abstractmethod
+    @Metadata.opcode(0xFDFF)
+    def f64x2_convert_low_i32x4_u(self):
+        pass
@@ -124,6 +124,13 @@ class DataSection:
     active: Optional["ModeActive"] = field(metadata={"description": "Activeの場合のデータ"})
 
 
+@dataclass
+class NameSection:
+    """Name Section(カスタムセクション)のデータ構造"""
+
+    data: ByteReader = field(metadata={"description": "未解析のサブセクション"})
+
+
 @dataclass
 class WasmSections:
     import_section: list[ImportSection]
@@ -137,3 +144,4 @@ class WasmSections:
     code_section: list[CodeSection]
     export_section: list[ExportSection]
     data_section: list[DataSection]
+    name_section: list[NameSection] = field(default_factory=list)
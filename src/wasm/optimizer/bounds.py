@@ -0,0 +1,105 @@
+from typing import Optional, Sequence
+
+from src.wasm.optimizer.struct import CodeInstructionInBounds, CodeInstructionOptimize
+
+
+class WasmBoundsPass:
+    """メモリアクセスのうち範囲内であることが証明できる命令を検出する最適化パス
+
+    次のいずれかを満たすload/storeを `CodeInstructionInBounds` に置き換える。
+
+    - アドレスが定数で、アクセスの終端が初期メモリサイズ以下
+    - アドレスがローカル変数で、同じ命令列の中で先に同じ変数からより広い範囲へのアクセスが行われている
+
+    メモリは縮まないため、一度範囲内だったアクセスは以降も範囲内になる。
+    """
+
+    I32_CONST = 0x41
+    LOCAL_GET = 0x20
+    LOCAL_SET = 0x21
+    LOCAL_TEE = 0x22
+
+    # opcode → アクセスするバイト数
+    LOAD = {
+        0x28: 4, 0x29: 8, 0x2A: 4, 0x2B: 8,
+        0x2C: 1, 0x2D: 1, 0x2E: 2, 0x2F: 2,
+        0x30: 1, 0x31: 1, 0x32: 2, 0x33: 2, 0x34: 4, 0x35: 4,
+    }  # fmt: skip
+    STORE = {
+        0x36: 4, 0x37: 8, 0x38: 4, 0x39: 8,
+        0x3A: 1, 0x3B: 2, 0x3C: 1, 0x3D: 2, 0x3E: 4,
+    }  # fmt: skip
+
+    # スタックから値を取らずに1つだけ積む命令
+    VALUE = {0x20, 0x23, 0x41, 0x42, 0x43, 0x44}
+
+    def __init__(self, memory_size: int):
+        self.memory_size = memory_size
+        self.cache: dict[tuple[int, ...], CodeInstructionInBounds] = {}
+
+    def run(self, code: Sequence[CodeInstructionOptimize]) -> list[CodeInstructionOptimize]:
+        """命令列を走査して範囲チェックが不要な命令を置き換える"""
+        res: list[CodeInstructionOptimize] = []
+        # ローカル変数 → 範囲内であることを確認済みのアドレスからの距離
+        checked: dict[int, int] = {}
+
+        for instruction in code:
+            opcode = instruction.opcode
+            if instruction.child or instruction.else_child:
+                instruction = CodeInstructionOptimize(
+                    opcode=opcode,
+                    args=instruction.args,
+                    child=self.run(instruction.child),
+                    else_child=self.run(instruction.else_child),
+                )
+                # 子の命令列でローカル変数が書き換わる可能性がある
+                checked.clear()
+            elif opcode == self.LOCAL_SET or opcode == self.LOCAL_TEE:
+                checked.pop(instruction.args[0], None)
+            elif opcode in self.LOAD or opcode in self.STORE:
+                instruction = self.access(res, instruction, checked)
+            res.append(instruction)
+        return res
+
+    def access(
+        self,
+        res: list[CodeInstructionOptimize],
+        instruction: CodeInstructionOptimize,
+        checked: dict[int, int],
+    ) -> CodeInstructionOptimize:
+        opcode = instruction.opcode
+        if opcode in self.LOAD:
+            address = self.address(res, 1)
+            size = self.LOAD[opcode]
+        else:
+            address = self.address(res, 2)
+            size = self.STORE[opcode]
+        if address is None:
+            return instruction
+
+        end = instruction.args[1] + size
+        if address.opcode == self.I32_CONST:
+            in_bounds = int(address.args[0]) + end <= self.memory_size
+        else:
+            index = address.args[0]
+            in_bounds = end <= checked.get(index, -1)
+            checked[index] = max(end, checked.get(index, -1))
+
+        return self.in_bounds(instruction) if in_bounds else instruction
+
+    def address(self, res: list[CodeInstructionOptimize], depth: int) -> Optional[CodeInstructionOptimize]:
+        """アドレスを積む命令が定数かローカル変数の場合にその命令を返す"""
+        if len(res) < depth or any(x.opcode not in self.VALUE for x in res[-depth:]):
+            return None
+        address = res[-depth]
+        if address.opcode == self.I32_CONST or address.opcode == self.LOCAL_GET:
+            return address
+        return None
+
+    def in_bounds(self, instruction: CodeInstructionOptimize) -> CodeInstructionInBounds:
+        key = (instruction.opcode, *instruction.args)
+        res = self.cache.get(key)
+        if res is None:
+            res = CodeInstructionInBounds(opcode=instruction.opcode, args=instruction.args)
+            self.cache[key] = res
+        return res
@@ -0,0 +1,171 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.wasm.loader.helper import CodeSectionSpecHelper
+from src.wasm.optimizer.struct import CodeInstructionOptimize
+from src.wasm.type.numeric.base import NumericType
+from src.wasm.type.numeric.numpy.float import F32, F64
+from src.wasm.type.numeric.numpy.int import I32, I64
+
+
+class WasmFoldPass:
+    """定数畳み込みと到達不能コードの削除を行う最適化パス
+
+    畳み込みの計算にはランタイムの命令実装をそのまま使うため、実行時と結果が一致する。
+    トラップする可能性のある命令(除算、浮動小数点からの変換など)は畳み込まない。
+    """
+
+    UNREACHABLE = 0x00
+    NOP = 0x01
+    BLOCK = 0x02
+    LOOP = 0x03
+    IF = 0x04
+    BR = 0x0C
+    BR_IF = 0x0D
+    BR_TABLE = 0x0E
+    RETURN = 0x0F
+    RETURN_CALL = 0x12
+    RETURN_CALL_INDIRECT = 0x13
+    DROP = 0x1A
+    LOCAL_GET = 0x20
+    GLOBAL_GET = 0x23
+    EMPTY_BLOCK_TYPE = 0x40
+
+    CONST = {I32: 0x41, I64: 0x42, F32: 0x43, F64: 0x44}
+    CONST_OPCODE = set(CONST.values())
+
+    # 以降の命令が実行されない命令
+    TERMINATOR = {UNREACHABLE, BR, BR_TABLE, RETURN, RETURN_CALL, RETURN_CALL_INDIRECT}
+
+    # 副作用がなく、結果を drop するなら消せる命令
+    PURE = {*CONST_OPCODE, LOCAL_GET, GLOBAL_GET}
+
+    FOLD_UNARY = {
+        # i32.eqz, i32.clz, i32.ctz, i32.popcnt
+        0x45, 0x67, 0x68, 0x69,
+        # i64.eqz, i64.clz, i64.ctz, i64.popcnt
+        0x50, 0x79, 0x7A, 0x7B,
+        # f32.abs, f32.neg, f64.abs, f64.neg
+        0x8B, 0x8C, 0x99, 0x9A,
+        # i32.wrap_i64, i64.extend_i32_s, i64.extend_i32_u
+        0xA7, 0xAC, 0xAD,
+        # f32.convert_*, f32.demote_f64, f64.convert_*, f64.promote_f32
+        0xB2, 0xB3, 0xB4, 0xB5, 0xB6, 0xB7, 0xB8, 0xB9, 0xBA, 0xBB,
+        # *.reinterpret_*
+        0xBC, 0xBD, 0xBE, 0xBF,
+        # *.extendN_s
+        0xC0, 0xC1, 0xC2, 0xC3, 0xC4,
+    }  # fmt: skip
+
+    FOLD_BINARY = {
+        # i32 の比較
+        *range(0x46, 0x50),
+        # i64 の比較
+        *range(0x51, 0x5B),
+        # f32, f64 の比較
+        *range(0x5B, 0x67),
+        # i32.add, i32.sub, i32.mul
+        0x6A, 0x6B, 0x6C,
+        # i32.and ... i32.rotr
+        *range(0x71, 0x79),
+        # i64.add, i64.sub, i64.mul
+        0x7C, 0x7D, 0x7E,
+        # i64.and ... i64.rotr
+        *range(0x83, 0x8B),
+        # f32.add, f32.sub, f32.mul, f32.copysign
+        0x92, 0x93, 0x94, 0x98,
+        # f64.add, f64.sub, f64.mul, f64.copysign
+        0xA0, 0xA1, 0xA2, 0xA6,
+    }  # fmt: skip
+
+    def run(self, code: Sequence[CodeInstructionOptimize]) -> list[CodeInstructionOptimize]:
+        """命令列を最適化する"""
+        res: list[CodeInstructionOptimize] = []
+        for instruction in code:
+            self.push(res, self.instruction(instruction))
+            if res and res[-1].opcode in self.TERMINATOR:
+                break
+        return res
+
+    def instruction(self, instruction: CodeInstructionOptimize) -> CodeInstructionOptimize:
+        """子命令を持つ命令は子命令を最適化する"""
+        if not instruction.child and not instruction.else_child:
+            return instruction
+        return CodeInstructionOptimize(
+            opcode=instruction.opcode,
+            args=instruction.args,
+            child=self.run(instruction.child),
+            else_child=self.run(instruction.else_child),
+        )
+
+    def push(self, res: list[CodeInstructionOptimize], instruction: CodeInstructionOptimize):
+        """直前の命令と合わせて簡約しながら命令を追加する"""
+        opcode = instruction.opcode
+
+        if opcode == self.NOP:
+            return
+
+        if opcode in (self.BLOCK, self.LOOP) and self.is_empty_block(instruction):
+            return
+
+        if opcode == self.IF:
+            if self.is_const(res, I32):
+                cond = res.pop().args[0]
+                code = instruction.child if cond else instruction.else_child
+                block = CodeInstructionOptimize(opcode=self.BLOCK, args=instruction.args, child=code)
+                return self.push(res, block)
+            if self.is_empty_block(instruction):
+                return self.push(res, CodeInstructionOptimize(opcode=self.DROP))
+
+        if opcode == self.BR_IF and self.is_const(res, I32):
+            cond = res.pop().args[0]
+            if cond:
+                res.append(CodeInstructionOptimize(opcode=self.BR, args=instruction.args))
+            return
+
+        if opcode == self.DROP and res and res[-1].opcode in self.PURE:
+            res.pop()
+            return
+
+        if opcode in self.FOLD_UNARY and len(res) >= 1 and res[-1].opcode in self.CONST_OPCODE:
+            value = self.evaluate(opcode, [res[-1].args[0]])
+            if value is not None:
+                res[-1] = value
+                return
+
+        if opcode in self.FOLD_BINARY and len(res) >= 2:
+            if res[-1].opcode in self.CONST_OPCODE and res[-2].opcode in self.CONST_OPCODE:
+                value = self.evaluate(opcode, [res[-2].args[0], res[-1].args[0]])
+                if value is not None:
+                    res[-2:] = [value]
+                    return
+
+        res.append(instruction)
+
+    def is_const(self, res: list[CodeInstructionOptimize], type: type[NumericType]) -> bool:
+        return len(res) > 0 and res[-1].opcode == self.CONST[type]
+
+    def is_empty_block(self, instruction: CodeInstructionOptimize) -> bool:
+        empty = not instruction.child and not instruction.else_child
+        return empty and instruction.args[0] == self.EMPTY_BLOCK_TYPE
+
+    def evaluate(self, opcode: int, args: list[NumericType]) -> Optional[CodeInstructionOptimize]:
+        """ランタイムの命令実装で定数を計算し、結果の const 命令を返す"""
+        from src.wasm.runtime.code_exec import CodeSectionBlock
+        from src.wasm.runtime.stack import NumericStack
+
+        block = CodeSectionBlock(env=None, locals=[], stack=NumericStack(value=list(args)))  # type: ignore
+        try:
+            with np.errstate(all="ignore"):
+                CodeSectionSpecHelper.bind(block, opcode)()
+        except Exception:
+            return None
+
+        if len(block.stack) != 1:
+            return None
+        value = block.stack.any()
+        const = self.CONST.get(type(value))
+        if const is None:
+            return None
+        return CodeInstructionOptimize(opcode=const, args=[value])
@@ -0,0 +1,147 @@
+from typing import Optional, Sequence
+
+from src.wasm.optimizer.struct import CodeInstructionByteLoop, CodeInstructionOptimize
+
+
+class WasmIdiomPass:
+    """1バイトずつコピー/フィルするループを検出する最適化パス
+
+    bulk memory を使わずにコンパイルされたモジュールに現れる、次の形のループを `CodeInstructionByteLoop` に置き換える。
+
+        block
+          loop
+            local.get $i, <limit>, i32.ge_u, br_if 1
+            <dst> + $i, <src> + $i, i32.load8_u, i32.store8    (コピー)
+            <dst> + $i, <value>, i32.store8                    (フィル)
+            local.get $i, i32.const 1, i32.add, local.set $i
+            br 0
+          end
+        end
+
+    `<limit>`, `<dst>`, `<src>`, `<value>` は `$i` 以外の `local.get` か `i32.const` に限る。
+    """
+
+    BLOCK = 0x02
+    LOOP = 0x03
+    BR = 0x0C
+    BR_IF = 0x0D
+    LOCAL_GET = 0x20
+    LOCAL_SET = 0x21
+    I32_CONST = 0x41
+    I32_EQZ = 0x45
+    I32_LT_U = 0x49
+    I32_LE_U = 0x4D
+    I32_GE_U = 0x4F
+    I32_ADD = 0x6A
+    I32_LOAD8 = {0x2C, 0x2D}
+    I32_STORE8 = 0x3A
+    EMPTY_BLOCK_TYPE = 0x40
+
+    def run(self, code: Sequence[CodeInstructionOptimize]) -> list[CodeInstructionOptimize]:
+        """命令列を走査してループを置き換える"""
+        res: list[CodeInstructionOptimize] = []
+        for instruction in code:
+            if instruction.child or instruction.else_child:
+                instruction = self.byte_loop(instruction) or CodeInstructionOptimize(
+                    opcode=instruction.opcode,
+                    args=instruction.args,
+                    child=self.run(instruction.child),
+                    else_child=self.run(instruction.else_child),
+                )
+            res.append(instruction)
+        return res
+
+    def byte_loop(self, block: CodeInstructionOptimize) -> Optional[CodeInstructionByteLoop]:
+        if block.opcode != self.BLOCK or block.args[0] != self.EMPTY_BLOCK_TYPE or len(block.child) != 1:
+            return None
+        loop = block.child[0]
+        if loop.opcode != self.LOOP or loop.args[0] != self.EMPTY_BLOCK_TYPE:
+            return None
+        code = loop.child
+
+        # 終了条件
+        head = self.exit(code)
+        if head is None:
+            return None
+        index, limit, pos = head
+
+        # ループ変数の更新と末尾の br 0
+        tail = [x.opcode for x in code[-5:]]
+        if tail != [self.LOCAL_GET, self.I32_CONST, self.I32_ADD, self.LOCAL_SET, self.BR] or len(code) < pos + 5:
+            return None
+        if code[-5].args[0] != index or code[-4].args[0].value != 1 or code[-2].args[0] != index:
+            return None
+        if code[-1].args[0] != 0:
+            return None
+        body = code[pos:-5]
+
+        # 本体
+        if len(body) < 2 or body[-1].opcode != self.I32_STORE8:
+            return None
+        dst = self.address(body, index)
+        if dst is None:
+            return None
+        dst_base, pos = dst
+        src_base, src_offset, value = None, 0, None
+        if body[-2].opcode in self.I32_LOAD8:
+            src = self.address(body[pos:-2], index)
+            if src is None or src[1] != len(body) - pos - 2:
+                return None
+            src_base, src_offset = src[0], body[-2].args[1]
+        elif len(body) == pos + 2 and self.is_operand(body[pos], index):
+            value = body[pos]
+        else:
+            return None
+
+        res = CodeInstructionByteLoop(opcode=block.opcode, args=block.args, child=block.child)
+        res.index = index
+        res.limit = limit
+        res.dst = dst_base
+        res.dst_offset = body[-1].args[1]
+        res.src = src_base
+        res.src_offset = src_offset
+        res.value = value
+        return res
+
+    def exit(self, code: Sequence[CodeInstructionOptimize]) -> Optional[tuple[int, CodeInstructionOptimize, int]]:
+        """先頭の終了条件を解析し、(ループ変数, 上限, 次の命令の位置)を返す"""
+        ops = [x.opcode for x in code[:5]]
+        if ops[:4] == [self.LOCAL_GET, self.LOCAL_GET, self.I32_GE_U, self.BR_IF] or ops[:4] == [
+            self.LOCAL_GET,
+            self.I32_CONST,
+            self.I32_GE_U,
+            self.BR_IF,
+        ]:
+            # i >= limit
+            index, limit, pos = code[0].args[0], code[1], 4
+        elif len(ops) == 5 and ops[2:] == [self.I32_LT_U, self.I32_EQZ, self.BR_IF] and ops[0] == self.LOCAL_GET:
+            # !(i < limit)
+            index, limit, pos = code[0].args[0], code[1], 5
+        elif len(ops) >= 4 and ops[1:4] == [self.LOCAL_GET, self.I32_LE_U, self.BR_IF]:
+            # limit <= i
+            index, limit, pos = code[1].args[0], code[0], 4
+        else:
+            return None
+        if code[pos - 1].args[0] != 1 or not self.is_operand(limit, index):
+            return None
+        return index, limit, pos
+
+    def address(self, code: Sequence[CodeInstructionOptimize], index: int):
+        """先頭の `<base> + $i` を解析し、(base, 次の命令の位置)を返す。base が無い場合は None"""
+        if len(code) >= 1 and self.is_index(code[0], index) and (len(code) < 3 or code[2].opcode != self.I32_ADD):
+            return None, 1
+        if len(code) >= 3 and code[2].opcode == self.I32_ADD:
+            if self.is_index(code[1], index) and self.is_operand(code[0], index):
+                return code[0], 3
+            if self.is_index(code[0], index) and self.is_operand(code[1], index):
+                return code[1], 3
+        return None
+
+    def is_index(self, instruction: CodeInstructionOptimize, index: int) -> bool:
+        return instruction.opcode == self.LOCAL_GET and instruction.args[0] == index
+
+    def is_operand(self, instruction: CodeInstructionOptimize, index: int) -> bool:
+        """ループ中に値が変わらない `local.get` か `i32.const` か"""
+        if instruction.opcode == self.LOCAL_GET:
+            return instruction.args[0] != index
+        return instruction.opcode == self.I32_CONST
@@ -13,11 +13,15 @@ from src.wasm.loader.struct import (
     ImportSection,
     MemorySection,
     ModeActive,
+    NameSection,
     StartSection,
     TableSection,
     TypeSection,
     WasmSections,
 )
+from src.wasm.optimizer.bounds import WasmBoundsPass
+from src.wasm.optimizer.fold import WasmFoldPass
+from src.wasm.optimizer.idiom import WasmIdiomPass
 from src.wasm.optimizer.struct import (
     CodeInstructionOptimize,
     CodeSectionOptimize,
@@ -29,6 +33,7 @@ from src.wasm.optimizer.struct import (
     ImportSectionOptimize,
     MemorySectionOptimize,
     ModeActiveOptimize,
+    NameSectionOptimize,
     StartSectionOptimize,
     TableSectionOptimize,
     TypeSectionOptimize,
@@ -38,10 +43,16 @@ from src.wasm.type.base import AnyType
 from src.wasm.type.numeric.base import NumericType
 from src.wasm.type.numeric.numpy.float import F32, F64
 from src.wasm.type.numeric.numpy.int import I32, I64
+from src.wasm.type.numeric.numpy.v128 import V128
 from src.wasm.type.ref.base import ExternRef, FuncRef, RefType
 
 
 class WasmOptimizer:
+    def __init__(self, fold: bool = True):
+        self.fold = fold
+        self.memory_size = 0
+        self.leaf_cache: dict[tuple[int, ...], CodeInstructionOptimize] = {}
+
     @staticmethod
     def get_type(type: int):
         if type == 0x7F:
@@ -52,6 +63,8 @@ class WasmOptimizer:
             return F32
         if type == 0x7C:
             return F64
+        if type == 0x7B:
+            return V128
         if type == 0x40:
             return None
         if type == 0x6F:
@@ -71,6 +84,8 @@ class WasmOptimizer:
             return 0x7D
         if type is F64:
             return 0x7C
+        if type is V128:
+            return 0x7B
         raise Exception(f"invalid type: {type}")
 
     @staticmethod
@@ -89,6 +104,8 @@ class WasmOptimizer:
             return F32
         if type == 0x7C:
             return F64
+        if type == 0x7B:
+            return V128
         raise Exception(f"invalid type: {type:02X}")
 
     @staticmethod
@@ -101,6 +118,8 @@ class WasmOptimizer:
             return F32
         if type == 0x7C:
             return F64
+        if type == 0x7B:
+            return V128
         if type == 0x6F:
             return ExternRef
         if type == 0x70:
@@ -116,6 +135,8 @@ class WasmOptimizer:
         raise Exception(f"invalid type: {type:02X}")
 
     def optimize(self, sections: "WasmSections") -> "WasmSectionsOptimize":
+        if sections.memory_section:
+            self.memory_size = sections.memory_section[0].limits_min * 64 * 1024
         opt = WasmSectionsOptimize(
             import_section=[self.import_section(x) for x in sections.import_section],
             type_section=[self.type_section(x) for x in sections.type_section],
@@ -128,6 +149,7 @@ class WasmOptimizer:
             code_section=[self.code_section(x) for x in sections.code_section],
             export_section=[self.export_section(x) for x in sections.export_section],
             data_section=[self.data_section(x) for x in sections.data_section],
+            name_section=[self.name_section(x) for x in sections.name_section],
         )
         return opt
 
@@ -191,8 +213,13 @@ class WasmOptimizer:
         )
 
     def code_section(self, section: "CodeSection") -> "CodeSectionOptimize":
+        data = self.expr(section.data)
+        if self.fold:
+            data = WasmFoldPass().run(data)
+        data = WasmBoundsPass(self.memory_size).run(data)
+        data = WasmIdiomPass().run(data)
         res = CodeSectionOptimize(
-            data=self.expr(section.data),
+            data=data,
             local=section.local,
         )
         return res
@@ -213,7 +240,7 @@ class WasmOptimizer:
                         opcode=o.opcode,
                         args=o.args,
                         child=child[0],
-                        else_child=child[1] if len(child) > 1 else [],
+                        else_child=child[1] if len(child) > 1 else (),
                     )
                     res[-1].append(instruction)
                 elif block_type == BlockType.END:
@@ -221,17 +248,27 @@ class WasmOptimizer:
                 elif block_type == BlockType.ELSE:
                     res.append([])
                 else:
-                    instruction = CodeInstructionOptimize(
-                        opcode=o.opcode,
-                        args=o.args,
-                        child=[],
-                        else_child=[],
-                    )
-                    res[-1].append(instruction)
+                    res[-1].append(self.leaf(o))
             return res
 
         return child_fn()[0]
 
+    def leaf(self, data: CodeInstruction) -> CodeInstructionOptimize:
+        """子を持たない命令を生成する
+
+        引数が整数か定数のみの命令は不変なので、同じ opcode と引数の命令は1つのインスタンスを共有する。
+        定数はローダーで同じ値が同じインスタンスになっているため、インスタンスの id で比較する。
+        """
+        if not all(type(x) is int or isinstance(x, NumericType) for x in data.args):
+            return CodeInstructionOptimize(opcode=data.opcode, args=data.args)
+
+        key = (data.opcode, *[x if type(x) is int else id(x) for x in data.args])
+        instruction = self.leaf_cache.get(key)
+        if instruction is None:
+            instruction = CodeInstructionOptimize(opcode=data.opcode, args=data.args)
+            self.leaf_cache[key] = instruction
+        return instruction
+
     def export_section(self, section: "ExportSection") -> "ExportSectionOptimize":
         return ExportSectionOptimize(
             field_name=section.field_name,
@@ -244,3 +281,8 @@ class WasmOptimizer:
             active=self.mode_active(section.active) if section.active is not None else None,
             init=section.init,
         )
+
+    def name_section(self, section: "NameSection") -> "NameSectionOptimize":
+        return NameSectionOptimize(
+            data=section.data,
+        )
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence
 
 from src.tools.byte import ByteReader
 from src.wasm.loader.helper import ArgumentType, CodeSectionSpecHelper
@@ -85,14 +85,33 @@ class ModeActiveOptimize:
     offset: list["CodeInstructionOptimize"] = field(metadata={"description": "オフセット"})
 
 
-@dataclass
 class CodeInstructionOptimize:
-    """Code Sectionの命令セット"""
+    """Code Sectionの命令セット
+
+    命令数が多いモジュールでもメモリを圧迫しないよう `__slots__` で保持する。
+    引数と子命令は tuple で持ち、子を持たない命令は空の tuple を共有する。
+    """
+
+    __slots__ = ("opcode", "args", "child", "else_child")
+
+    EMPTY: tuple = ()
+
+    opcode: int
+    args: tuple[ArgumentType, ...]
+    child: tuple["CodeInstructionOptimize", ...]
+    else_child: tuple["CodeInstructionOptimize", ...]
 
-    opcode: int = field(metadata={"description": "命令コード"})
-    args: list[ArgumentType] = field(metadata={"description": "命令の引数"})
-    child: list["CodeInstructionOptimize"] = field(metadata={"description": "子命令"})
-    else_child: list["CodeInstructionOptimize"] = field(metadata={"description": "子命令"})
+    def __init__(
+        self,
+        opcode: int,
+        args: Sequence[ArgumentType] = EMPTY,
+        child: Sequence["CodeInstructionOptimize"] = EMPTY,
+        else_child: Sequence["CodeInstructionOptimize"] = EMPTY,
+    ):
+        self.opcode = opcode
+        self.args = tuple(args) or self.EMPTY
+        self.child = tuple(child) or self.EMPTY
+        self.else_child = tuple(else_child) or self.EMPTY
 
     def __str__(self):
         return self.__repr__()
@@ -100,7 +119,35 @@ class CodeInstructionOptimize:
     def __repr__(self):
         cls_name = self.__class__.__name__
         name = CodeSectionSpecHelper.mapped(self.opcode).__name__
-        return f"{cls_name}(opcode={self.opcode:02X}, name={name}, args={self.args})"
+        return f"{cls_name}(opcode={self.opcode:02X}, name={name}, args={list(self.args)})"
+
+
+class CodeInstructionInBounds(CodeInstructionOptimize):
+    """アクセス先がメモリの範囲内であることが証明されたload/store命令
+
+    実行時の範囲チェックを省略できる。
+    """
+
+    __slots__ = ()
+
+
+class CodeInstructionByteLoop(CodeInstructionOptimize):
+    """1バイトずつコピー/フィルするループであることが分かったblock命令
+
+    実行時にアクセス範囲がすべてメモリ内であれば、ループを回さずに memory.copy/memory.fill でまとめて処理する。
+    そうでなければ子命令のループをそのまま実行する。
+    アドレスや値は `local.get` か `i32.const` の命令で持つ。
+    """
+
+    __slots__ = ("index", "limit", "dst", "dst_offset", "src", "src_offset", "value")
+
+    index: int
+    limit: CodeInstructionOptimize
+    dst: Optional[CodeInstructionOptimize]
+    dst_offset: int
+    src: Optional[CodeInstructionOptimize]
+    src_offset: int
+    value: Optional[CodeInstructionOptimize]
 
 
 @dataclass
@@ -128,6 +175,13 @@ class DataSectionOptimize:
     active: Optional["ModeActiveOptimize"] = field(metadata={"description": "Activeの場合のデータ"})
 
 
+@dataclass
+class NameSectionOptimize:
+    """Name Section(カスタムセクション)のデータ構造"""
+
+    data: ByteReader = field(metadata={"description": "未解析のサブセクション"})
+
+
 @dataclass
 class WasmSectionsOptimize:
     import_section: list["ImportSectionOptimize"]
@@ -141,3 +195,4 @@ class WasmSectionsOptimize:
     code_section: list[CodeSectionOptimize]
     export_section: list[ExportSectionOptimize]
     data_section: list["DataSectionOptimize"]
+    name_section: list["NameSectionOptimize"] = field(default_factory=list)
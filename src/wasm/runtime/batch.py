@@ -0,0 +1,464 @@
+import logging
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+
+import numpy as np
+
+from src.tools.logger import NestedLogger
+from src.wasm.loader.helper import CodeSectionSpecHelper
+from src.wasm.optimizer.struct import CodeInstructionOptimize
+from src.wasm.runtime.simd import CodeSectionBlockSimd
+from src.wasm.type.base import AnyType
+from src.wasm.type.numeric.numpy.float import F32, F64
+from src.wasm.type.numeric.numpy.int import I32, I64
+
+if TYPE_CHECKING:
+    from src.wasm.runtime.exec import WasmExec
+
+
+class WasmBatchFallback(Exception):
+    """バッチ実行できない命令に到達したことを表す"""
+
+
+class BatchLabel:
+    """分岐先のラベル
+
+    分岐したレーンと、そのレーンが持ち出した値を保持する。
+    """
+
+    __slots__ = ("arity", "taken", "values")
+
+    def __init__(self, arity: int, size: int):
+        self.arity = arity
+        self.taken = np.zeros(size, dtype=np.bool_)
+        self.values: Optional[list[np.ndarray]] = None
+
+    def merge(self, mask: np.ndarray, stack: list[np.ndarray]):
+        """mask のレーンがこのラベルへ分岐したことを記録する"""
+        values = stack[len(stack) - self.arity :]
+        if self.values is None:
+            self.values = list(values)
+        else:
+            self.values = [np.where(mask, v, o) for v, o in zip(values, self.values)]
+        self.taken = self.taken | mask
+
+
+def u32(value: np.ndarray) -> np.ndarray:
+    return value.astype(np.uint32)
+
+
+def s32(value: np.ndarray) -> np.ndarray:
+    return value.view(np.int32)
+
+
+def s64(value: np.ndarray) -> np.ndarray:
+    return value.view(np.int64)
+
+
+def div_s(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """0方向に丸める符号付き除算(トラップするレーンの値は不定)"""
+    safe = np.where((b == 0) | (b == -1), 1, b).astype(a.dtype)
+    return np.where(b == -1, -a, (a - np.fmod(a, safe)) // safe)
+
+
+def rem_s(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """被除数の符号を持つ符号付き剰余(トラップするレーンの値は不定)"""
+    safe = np.where((b == 0) | (b == -1), 1, b).astype(a.dtype)
+    return np.fmod(a, safe)
+
+
+def nonzero(b: np.ndarray) -> np.ndarray:
+    return np.where(b == 0, 1, b).astype(b.dtype)
+
+
+def rotl(a: np.ndarray, b: np.ndarray, bits: int) -> np.ndarray:
+    k = (b % bits).astype(a.dtype)
+    return (a << k) | (a >> ((bits - k) % bits).astype(a.dtype))
+
+
+def rotr(a: np.ndarray, b: np.ndarray, bits: int) -> np.ndarray:
+    k = (b % bits).astype(a.dtype)
+    return (a >> k) | (a << ((bits - k) % bits).astype(a.dtype))
+
+
+class WasmBatchExec:
+    """1つの関数を複数の引数でまとめて実行する
+
+    値はスカラーではなく入力数分の NumPy 配列で持ち、命令の解釈を全入力で1回にまとめる。
+    分岐はレーンごとのマスクで扱い、分岐したレーンは分岐先のラベルに合流するまで実行しない。
+    書き込みなどの副作用を持つ命令やトラップに到達した場合は `WasmBatchFallback` を送出する。
+    実行途中に副作用は起こさないため、呼び出し側は入力ごとの実行にやり直せる。
+    """
+
+    logger = NestedLogger(logging.getLogger(__name__))
+
+    DTYPE: dict[int, type[np.generic]] = {0x7F: np.uint32, 0x7E: np.uint64, 0x7D: np.float32, 0x7C: np.float64}
+    TYPE: dict[type[np.generic], type[AnyType]] = {np.uint32: I32, np.uint64: I64, np.float32: F32, np.float64: F64}
+    VALUE_DTYPE: dict[type[AnyType], type[np.generic]] = {v: k for k, v in TYPE.items()}
+
+    # (サイズ, メモリ上の型, 結果の型)
+    LOAD: dict[int, tuple[int, type[np.generic], type[np.generic]]] = {
+        0x28: (4, np.uint32, np.uint32),
+        0x29: (8, np.uint64, np.uint64),
+        0x2A: (4, np.float32, np.float32),
+        0x2B: (8, np.float64, np.float64),
+        0x2C: (1, np.int8, np.uint32),
+        0x2D: (1, np.uint8, np.uint32),
+        0x2E: (2, np.int16, np.uint32),
+        0x2F: (2, np.uint16, np.uint32),
+        0x30: (1, np.int8, np.uint64),
+        0x31: (1, np.uint8, np.uint64),
+        0x32: (2, np.int16, np.uint64),
+        0x33: (2, np.uint16, np.uint64),
+        0x34: (4, np.int32, np.uint64),
+        0x35: (4, np.uint32, np.uint64),
+    }
+
+    UNARY: dict[int, Callable[[np.ndarray], np.ndarray]] = {
+        0x45: lambda a: u32(a == 0),
+        0x50: lambda a: u32(a == 0),
+        0x8B: np.abs,
+        0x8C: np.negative,
+        0x8D: np.ceil,
+        0x8E: np.floor,
+        0x8F: np.trunc,
+        0x90: np.rint,
+        0x91: np.sqrt,
+        0x99: np.abs,
+        0x9A: np.negative,
+        0x9B: np.ceil,
+        0x9C: np.floor,
+        0x9D: np.trunc,
+        0x9E: np.rint,
+        0x9F: np.sqrt,
+        0xA7: lambda a: a.astype(np.uint32),
+        0xAC: lambda a: s32(a).astype(np.int64).view(np.uint64),
+        0xAD: lambda a: a.astype(np.uint64),
+        0xB2: lambda a: s32(a).astype(np.float32),
+        0xB3: lambda a: a.astype(np.float32),
+        0xB6: lambda a: a.astype(np.float32),
+        0xB7: lambda a: s32(a).astype(np.float64),
+        0xB8: lambda a: a.astype(np.float64),
+        0xB9: lambda a: s64(a).astype(np.float64),
+        0xBB: lambda a: a.astype(np.float64),
+        0xBC: lambda a: a.view(np.uint32),
+        0xBD: lambda a: a.view(np.uint64),
+        0xBE: lambda a: a.view(np.float32),
+        0xBF: lambda a: a.view(np.float64),
+        0xC0: lambda a: a.astype(np.int8).astype(np.int32).view(np.uint32),
+        0xC1: lambda a: a.astype(np.int16).astype(np.int32).view(np.uint32),
+        0xC2: lambda a: a.astype(np.int8).astype(np.int64).view(np.uint64),
+        0xC3: lambda a: a.astype(np.int16).astype(np.int64).view(np.uint64),
+        0xC4: lambda a: a.astype(np.int32).astype(np.int64).view(np.uint64),
+    }
+
+    BINARY: dict[int, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+        # i32 の比較
+        0x46: lambda a, b: u32(a == b),
+        0x47: lambda a, b: u32(a != b),
+        0x48: lambda a, b: u32(s32(a) < s32(b)),
+        0x49: lambda a, b: u32(a < b),
+        0x4A: lambda a, b: u32(s32(a) > s32(b)),
+        0x4B: lambda a, b: u32(a > b),
+        0x4C: lambda a, b: u32(s32(a) <= s32(b)),
+        0x4D: lambda a, b: u32(a <= b),
+        0x4E: lambda a, b: u32(s32(a) >= s32(b)),
+        0x4F: lambda a, b: u32(a >= b),
+        # i64 の比較
+        0x51: lambda a, b: u32(a == b),
+        0x52: lambda a, b: u32(a != b),
+        0x53: lambda a, b: u32(s64(a) < s64(b)),
+        0x54: lambda a, b: u32(a < b),
+        0x55: lambda a, b: u32(s64(a) > s64(b)),
+        0x56: lambda a, b: u32(a > b),
+        0x57: lambda a, b: u32(s64(a) <= s64(b)),
+        0x58: lambda a, b: u32(a <= b),
+        0x59: lambda a, b: u32(s64(a) >= s64(b)),
+        0x5A: lambda a, b: u32(a >= b),
+        # f32, f64 の比較
+        0x5B: lambda a, b: u32(a == b),
+        0x5C: lambda a, b: u32(a != b),
+        0x5D: lambda a, b: u32(a < b),
+        0x5E: lambda a, b: u32(a > b),
+        0x5F: lambda a, b: u32(a <= b),
+        0x60: lambda a, b: u32(a >= b),
+        0x61: lambda a, b: u32(a == b),
+        0x62: lambda a, b: u32(a != b),
+        0x63: lambda a, b: u32(a < b),
+        0x64: lambda a, b: u32(a > b),
+        0x65: lambda a, b: u32(a <= b),
+        0x66: lambda a, b: u32(a >= b),
+        # i32 の演算
+        0x6A: lambda a, b: a + b,
+        0x6B: lambda a, b: a - b,
+        0x6C: lambda a, b: a * b,
+        0x6D: lambda a, b: div_s(s32(a), s32(b)).view(np.uint32),
+        0x6E: lambda a, b: a // nonzero(b),
+        0x6F: lambda a, b: rem_s(s32(a), s32(b)).view(np.uint32),
+        0x70: lambda a, b: a % nonzero(b),
+        0x71: lambda a, b: a & b,
+        0x72: lambda a, b: a | b,
+        0x73: lambda a, b: a ^ b,
+        0x74: lambda a, b: a << (b % 32),
+        0x75: lambda a, b: (s32(a) >> (b % 32).astype(np.int32)).view(np.uint32),
+        0x76: lambda a, b: a >> (b % 32),
+        0x77: lambda a, b: rotl(a, b, 32),
+        0x78: lambda a, b: rotr(a, b, 32),
+        # i64 の演算
+        0x7C: lambda a, b: a + b,
+        0x7D: lambda a, b: a - b,
+        0x7E: lambda a, b: a * b,
+        0x7F: lambda a, b: div_s(s64(a), s64(b)).view(np.uint64),
+        0x80: lambda a, b: a // nonzero(b),
+        0x81: lambda a, b: rem_s(s64(a), s64(b)).view(np.uint64),
+        0x82: lambda a, b: a % nonzero(b),
+        0x83: lambda a, b: a & b,
+        0x84: lambda a, b: a | b,
+        0x85: lambda a, b: a ^ b,
+        0x86: lambda a, b: a << (b % 64),
+        0x87: lambda a, b: (s64(a) >> (b % 64).astype(np.int64)).view(np.uint64),
+        0x88: lambda a, b: a >> (b % 64),
+        0x89: lambda a, b: rotl(a, b, 64),
+        0x8A: lambda a, b: rotr(a, b, 64),
+        # f32 の演算
+        0x92: lambda a, b: a + b,
+        0x93: lambda a, b: a - b,
+        0x94: lambda a, b: a * b,
+        0x95: lambda a, b: a / b,
+        0x96: CodeSectionBlockSimd.float_min,
+        0x97: CodeSectionBlockSimd.float_max,
+        0x98: np.copysign,
+        # f64 の演算
+        0xA0: lambda a, b: a + b,
+        0xA1: lambda a, b: a - b,
+        0xA2: lambda a, b: a * b,
+        0xA3: lambda a, b: a / b,
+        0xA4: CodeSectionBlockSimd.float_min,
+        0xA5: CodeSectionBlockSimd.float_max,
+        0xA6: np.copysign,
+    }
+
+    # トラップするレーンを返す
+    TRAP: dict[int, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+        0x6D: lambda a, b: (b == 0) | ((a == 0x80000000) & (b == 0xFFFFFFFF)),
+        0x6E: lambda a, b: b == 0,
+        0x6F: lambda a, b: b == 0,
+        0x70: lambda a, b: b == 0,
+        0x7F: lambda a, b: (b == 0) | ((a == 1 << 63) & (b == (1 << 64) - 1)),
+        0x80: lambda a, b: b == 0,
+        0x81: lambda a, b: b == 0,
+        0x82: lambda a, b: b == 0,
+    }
+
+    # レーンごとに既存の命令実装で計算する命令(clz, 浮動小数点からの変換など)
+    LANE_UNARY = {
+        0x67, 0x68, 0x69, 0x79, 0x7A, 0x7B,
+        *range(0xA8, 0xAC), *range(0xAE, 0xB2), 0xB4, 0xB5, 0xBA,
+        *range(0xFC00, 0xFC08),
+    }  # fmt: skip
+
+    def __init__(self, env: "WasmExec", size: int):
+        self.env = env
+        self.size = size
+        self.imports = len([x for x in env.sections.import_section if x.kind == 0x00])
+
+    def run(self, index: int, params: Sequence[Sequence[AnyType]]) -> list[list[AnyType]]:
+        """引数の組ごとの戻り値を返す"""
+        _, fn_type = self.env.get_function(index)
+        args = [np.array([p[i].value for p in params], dtype=self.dtype(t)) for i, t in enumerate(fn_type.params)]
+        try:
+            with np.errstate(all="ignore"):
+                res = self.call(index, args, np.ones(self.size, dtype=np.bool_))
+        except RecursionError as e:
+            # 深い再帰はホストのスタックが尽きるため、通常の実行に任せる
+            raise WasmBatchFallback("call stack exhausted") from e
+        return [[self.TYPE[x.dtype.type](x[i]) for x in res] for i in range(self.size)]
+
+    def dtype(self, type: int) -> type[np.generic]:
+        if type not in self.DTYPE:
+            raise WasmBatchFallback(f"type: {type:02X}")
+        return self.DTYPE[type]
+
+    def call(self, index: int, args: list[np.ndarray], mask: np.ndarray) -> list[np.ndarray]:
+        if index < self.imports:
+            raise WasmBatchFallback(f"import function: {index}")
+        self.checkpoint()
+        fn, fn_type = self.env.get_function(index)
+        assert self.logger.debug(f"function: {self.env.get_function_name(index)}")
+
+        locals = [*args, *[np.zeros(self.size, dtype=self.dtype(x)) for x in fn.local]]
+        label = BatchLabel(len(fn_type.returns), self.size)
+        stack: list[np.ndarray] = []
+        end = self.seq(fn.data, mask, stack, locals, [label])
+        _, res = self.join([(end, stack)], label)
+        return res
+
+    def checkpoint(self):
+        """関数の呼び出しとループの繰り返しごとに、中断要求と実行期限を確認する
+
+        燃料はレーンごとに数えられないため、燃料を制限している場合は通常の実行に任せる。
+        """
+        if self.env.metered:
+            if self.env.fuel is not None:
+                raise WasmBatchFallback("fuel")
+            self.env.checkpoint(0)
+
+    def join(
+        self, parts: list[tuple[np.ndarray, list[np.ndarray]]], label: BatchLabel
+    ) -> tuple[np.ndarray, list[np.ndarray]]:
+        """ブロックの終端まで到達したレーンと、ラベルへ分岐したレーンの値を合流させる"""
+        mask, res = label.taken, label.values
+        for end, stack in parts:
+            if not end.any():
+                continue
+            values = stack[len(stack) - label.arity :]
+            res = values if res is None else [np.where(end, v, o) for v, o in zip(values, res)]
+            mask = mask | end
+        return mask, res if res is not None else []
+
+    def seq(
+        self,
+        code: Sequence[CodeInstructionOptimize],
+        mask: np.ndarray,
+        stack: list[np.ndarray],
+        locals: list[np.ndarray],
+        labels: list[BatchLabel],
+    ) -> np.ndarray:
+        """命令列を実行し、終端まで到達したレーンを返す"""
+        for data in code:
+            res = self.instruction(data, mask, stack, locals, labels)
+            if res is not None:
+                mask = res
+                if not mask.any():
+                    break
+        return mask
+
+    def block(self, data: CodeInstructionOptimize, mask, stack, locals, labels) -> np.ndarray:
+        params, returns = self.env.get_type(data.args[0])
+        label = BatchLabel(len(returns or []), self.size)
+        if data.opcode == 0x04:
+            cond = stack.pop() != 0
+            inner = [stack.pop() for _ in params][::-1]
+            parts = []
+            for m, code in ((mask & cond, data.child), (mask & ~cond, data.else_child)):
+                if m.any():
+                    s = list(inner)
+                    parts.append((self.seq(code, m, s, locals, [*labels, label]), s))
+        else:
+            inner = [stack.pop() for _ in params][::-1]
+            parts = [(self.seq(data.child, mask, inner, locals, [*labels, label]), inner)]
+        mask, res = self.join(parts, label)
+        stack.extend(res)
+        return mask
+
+    def loop(self, data: CodeInstructionOptimize, mask, stack, locals, labels) -> np.ndarray:
+        params, returns = self.env.get_type(data.args[0])
+        inner = [stack.pop() for _ in params][::-1]
+        parts = []
+        while True:
+            label = BatchLabel(len(params), self.size)
+            end = self.seq(data.child, mask, inner, locals, [*labels, label])
+            parts.append((end, inner))
+            if not label.taken.any():
+                break
+            self.checkpoint()
+            mask, inner = label.taken, list(label.values or [])
+        mask, res = self.join(parts, BatchLabel(len(returns or []), self.size))
+        stack.extend(res)
+        return mask
+
+    def instruction(self, data: CodeInstructionOptimize, mask, stack, locals, labels) -> Optional[np.ndarray]:
+        """命令を実行し、実行を続けるレーンが変わった場合はそのマスクを返す"""
+        opcode, args = data.opcode, data.args
+
+        if opcode in self.BINARY:
+            b, a = stack.pop(), stack.pop()
+            if opcode in self.TRAP and (mask & self.TRAP[opcode](a, b)).any():
+                raise WasmBatchFallback(f"trap: {opcode:02X}")
+            stack.append(self.BINARY[opcode](a, b))
+        elif opcode in self.UNARY:
+            stack.append(self.UNARY[opcode](stack.pop()))
+        elif opcode == 0x20:
+            stack.append(locals[args[0]])
+        elif opcode == 0x21 or opcode == 0x22:
+            value = stack.pop() if opcode == 0x21 else stack[-1]
+            locals[args[0]] = value if mask.all() else np.where(mask, value, locals[args[0]])
+        elif 0x41 <= opcode <= 0x44:
+            value = args[0]
+            stack.append(np.full(self.size, value.value, dtype=self.VALUE_DTYPE[type(value)]))
+        elif opcode in self.LOAD:
+            stack.append(self.load(opcode, args[1], stack.pop(), mask))
+        elif opcode == 0x02 or opcode == 0x04:
+            return self.block(data, mask, stack, locals, labels)
+        elif opcode == 0x03:
+            return self.loop(data, mask, stack, locals, labels)
+        elif opcode == 0x0C:
+            labels[-1 - args[0]].merge(mask, stack)
+            return mask & False
+        elif opcode == 0x0D:
+            taken = mask & (stack.pop() != 0)
+            if taken.any():
+                labels[-1 - args[0]].merge(taken, stack)
+                return mask & ~taken
+        elif opcode == 0x0E:
+            index, count = stack.pop(), args[0]
+            for i, depth in enumerate(count):
+                taken = mask & ((index == i) if i < len(count) - 1 else (index >= i))
+                if taken.any():
+                    labels[-1 - depth].merge(taken, stack)
+            return mask & False
+        elif opcode == 0x0F:
+            labels[0].merge(mask, stack)
+            return mask & False
+        elif opcode == 0x10 or opcode == 0x12:
+            _, fn_type = self.env.get_function(args[0])
+            params = [stack.pop() for _ in fn_type.params][::-1]
+            stack.extend(self.call(args[0], params, mask))
+            if opcode == 0x12:
+                labels[0].merge(mask, stack)
+                return mask & False
+        elif opcode == 0x00:
+            raise WasmBatchFallback("trap: unreachable")
+        elif opcode == 0x01:
+            pass
+        elif opcode == 0x1A:
+            stack.pop()
+        elif opcode == 0x1B or opcode == 0x1C:
+            c, b, a = stack.pop(), stack.pop(), stack.pop()
+            stack.append(np.where(c != 0, a, b))
+        elif opcode == 0x23:
+            value = self.env.globals[args[0]].get()
+            if type(value) not in self.VALUE_DTYPE:
+                raise WasmBatchFallback(f"global: {value}")
+            stack.append(np.full(self.size, value.value, dtype=self.VALUE_DTYPE[type(value)]))
+        elif opcode in self.LANE_UNARY:
+            stack.append(self.lanes(data, mask, [stack.pop()]))
+        else:
+            raise WasmBatchFallback(f"instruction: {CodeSectionSpecHelper.mapped(opcode).__name__}")
+
+    def load(self, opcode: int, offset: int, addr: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """レーンごとのアドレスからまとめて読み込む"""
+        size, src, dst = self.LOAD[opcode]
+        addr = np.where(mask, addr.astype(np.int64) + offset, 0)
+        if (addr + size > len(self.env.memory)).any():
+            raise WasmBatchFallback("trap: out of bounds memory access")
+        index = addr[:, None] + np.arange(size)
+        value = np.ascontiguousarray(self.env.memory[index]).view(src).reshape(self.size)
+        if np.issubdtype(src, np.signedinteger):
+            return value.astype(np.int32 if dst is np.uint32 else np.int64).view(dst)
+        return value.astype(dst)
+
+    def lanes(self, data: CodeInstructionOptimize, mask: np.ndarray, args: list[np.ndarray]) -> np.ndarray:
+        """実行中のレーンだけ、1つずつ既存の命令実装で計算する"""
+        res: Optional[np.ndarray] = None
+        for i in np.flatnonzero(mask):
+            block = self.env.get_block(locals=[], stack=[self.TYPE[x.dtype.type](x[i]) for x in args])
+            try:
+                block.run_instruction(data)
+            except Exception as e:
+                raise WasmBatchFallback(f"trap: {e}") from e
+            value = block.stack.any()
+            if res is None:
+                res = np.zeros(self.size, dtype=self.VALUE_DTYPE[type(value)])
+            res[i] = value.value
+        assert res is not None
+        return res
@@ -1,5 +1,7 @@
 from math import trunc
+from typing import Any, Callable
 
+from src.wasm.optimizer.struct import CodeInstructionInBounds
 from src.wasm.runtime.check.check import TypeCheck
 from src.wasm.runtime.code_exec import CodeSectionBlock
 from src.wasm.runtime.error.error import (
@@ -13,7 +15,6 @@ from src.wasm.runtime.error.error import (
     WasmUninitializedElementError,
     WasmUnreachableError,
 )
-from src.wasm.runtime.error.helper import NumpyErrorHelper
 from src.wasm.type.numeric.numpy.int import I16, I32, I64, SignedI32, SignedI64
 
 
@@ -22,6 +23,18 @@ class CodeSectionBlockDebug(CodeSectionBlock):
         raise WasmUnreachableError()
 
     def call_indirect(self, index: int, elm_index: int):
+        return self.indirect(index, elm_index, super().call_indirect)
+
+    def return_call(self, index: int):
+        _, fn_type = self.env.get_function(index)
+        TypeCheck.type_check(self.stack.value[len(self.stack.value) - len(fn_type.params) :], fn_type.params)
+        return super().return_call(index)
+
+    def return_call_indirect(self, index: int, elm_index: int):
+        return self.indirect(index, elm_index, super().return_call_indirect)
+
+    def indirect(self, index: int, elm_index: int, call: Callable[[int, int], Any]):
+        """テーブルの要素と型を検証してから call_indirect/return_call_indirect を実行する"""
         fn_type_params, fn_type_returns = self.env.get_type(index)
         a = self.stack.int(read_only=True)
 
@@ -36,7 +49,7 @@ class CodeSectionBlockDebug(CodeSectionBlock):
             b, fn_type = self.env.get_function(int(element[a]))
             TypeCheck.list_check(fn_type.params, fn_type_params)
             TypeCheck.list_check(fn_type.returns, fn_type_returns or [])
-            return super().call_indirect(index, elm_index)
+            return call(index, elm_index)
         except IndexError:
             raise WasmUndefinedElementError()
         except TypeError:
@@ -54,294 +67,196 @@ class CodeSectionBlockDebug(CodeSectionBlock):
         except IndexError:
             raise WasmOutOfBoundsTableAccessError()
 
-    @NumpyErrorHelper.seterr("raise")
-    def i32_load(self, align: int, offset: int):
-        try:
-            return super().i32_load(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
+    def check_memory(self, offset: int, size: int, key: int = -1):
+        """load/storeのアクセス先がメモリの範囲内か確認する
+
+        最適化で範囲内と証明された命令は確認を省略する。
+        """
+        if self.instruction.__class__ is CodeInstructionInBounds:
+            return
+        addr = self.stack.int(read_only=True, key=key)
+        if addr + offset + size > len(self.env.memory):
             raise WasmOutOfBoundsMemoryAccessError()
 
-    @NumpyErrorHelper.seterr("raise")
+    def i32_load(self, align: int, offset: int):
+        self.check_memory(offset, 4)
+        return super().i32_load(align, offset)
+
     def i64_load(self, align: int, offset: int):
-        try:
-            return super().i64_load(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 8)
+        return super().i64_load(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def f32_load(self, align: int, offset: int):
-        try:
-            return super().f32_load(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 4)
+        return super().f32_load(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def f64_load(self, align: int, offset: int):
-        try:
-            return super().f64_load(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 8)
+        return super().f64_load(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_load8_s(self, align: int, offset: int):
-        try:
-            return super().i32_load8_s(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 1)
+        return super().i32_load8_s(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_load8_u(self, align: int, offset: int):
-        try:
-            return super().i32_load8_u(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 1)
+        return super().i32_load8_u(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_load16_s(self, align: int, offset: int):
-        try:
-            return super().i32_load16_s(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 2)
+        return super().i32_load16_s(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_load16_u(self, align: int, offset: int):
-        try:
-            return super().i32_load16_u(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 2)
+        return super().i32_load16_u(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_load8_s(self, align: int, offset: int):
-        try:
-            return super().i64_load8_s(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 1)
+        return super().i64_load8_s(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_load8_u(self, align: int, offset: int):
-        try:
-            return super().i64_load8_u(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 1)
+        return super().i64_load8_u(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_load16_s(self, align: int, offset: int):
-        try:
-            return super().i64_load16_s(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 2)
+        return super().i64_load16_s(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_load16_u(self, align: int, offset: int):
-        try:
-            return super().i64_load16_u(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 2)
+        return super().i64_load16_u(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_load32_s(self, align: int, offset: int):
-        try:
-            return super().i64_load32_s(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 4)
+        return super().i64_load32_s(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_load32_u(self, align: int, offset: int):
-        try:
-            return super().i64_load32_u(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 4)
+        return super().i64_load32_u(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_store(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 4:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().i32_store(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 4, key=-2)
+        return super().i32_store(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_store(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 8:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().i64_store(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 8, key=-2)
+        return super().i64_store(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def f32_store(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 4:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().f32_store(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 4, key=-2)
+        return super().f32_store(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def f64_store(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 8:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().f64_store(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 8, key=-2)
+        return super().f64_store(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_store8(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 1:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().i32_store8(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 1, key=-2)
+        return super().i32_store8(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_store16(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 2:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().i32_store16(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 2, key=-2)
+        return super().i32_store16(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_store8(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 1:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().i64_store8(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 1, key=-2)
+        return super().i64_store8(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_store16(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 2:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().i64_store16(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 2, key=-2)
+        return super().i64_store16(align, offset)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_store32(self, align: int, offset: int):
-        addr = self.stack.int(read_only=True, key=-2)
-        try:
-            if len(self.env.memory) < addr + offset + 4:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().i64_store32(align, offset)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
-            raise WasmOutOfBoundsMemoryAccessError()
+        self.check_memory(offset, 4, key=-2)
+        return super().i64_store32(align, offset)
+
+    def v128_load(self, align: int, offset: int):
+        self.check_memory(offset, 16)
+        return super().v128_load(align, offset)
+
+    def v128_load8x8_s(self, align: int, offset: int):
+        self.check_memory(offset, 8)
+        return super().v128_load8x8_s(align, offset)
+
+    def v128_load8x8_u(self, align: int, offset: int):
+        self.check_memory(offset, 8)
+        return super().v128_load8x8_u(align, offset)
+
+    def v128_load16x4_s(self, align: int, offset: int):
+        self.check_memory(offset, 8)
+        return super().v128_load16x4_s(align, offset)
+
+    def v128_load16x4_u(self, align: int, offset: int):
+        self.check_memory(offset, 8)
+        return super().v128_load16x4_u(align, offset)
+
+    def v128_load32x2_s(self, align: int, offset: int):
+        self.check_memory(offset, 8)
+        return super().v128_load32x2_s(align, offset)
+
+    def v128_load32x2_u(self, align: int, offset: int):
+        self.check_memory(offset, 8)
+        return super().v128_load32x2_u(align, offset)
+
+    def v128_load8_splat(self, align: int, offset: int):
+        self.check_memory(offset, 1)
+        return super().v128_load8_splat(align, offset)
+
+    def v128_load16_splat(self, align: int, offset: int):
+        self.check_memory(offset, 2)
+        return super().v128_load16_splat(align, offset)
+
+    def v128_load32_splat(self, align: int, offset: int):
+        self.check_memory(offset, 4)
+        return super().v128_load32_splat(align, offset)
+
+    def v128_load64_splat(self, align: int, offset: int):
+        self.check_memory(offset, 8)
+        return super().v128_load64_splat(align, offset)
+
+    def v128_store(self, align: int, offset: int):
+        self.check_memory(offset, 16, key=-2)
+        return super().v128_store(align, offset)
+
+    def v128_load8_lane(self, align: int, offset: int, lane: int):
+        self.check_memory(offset, 1, key=-2)
+        return super().v128_load8_lane(align, offset, lane)
+
+    def v128_load16_lane(self, align: int, offset: int, lane: int):
+        self.check_memory(offset, 2, key=-2)
+        return super().v128_load16_lane(align, offset, lane)
+
+    def v128_load32_lane(self, align: int, offset: int, lane: int):
+        self.check_memory(offset, 4, key=-2)
+        return super().v128_load32_lane(align, offset, lane)
+
+    def v128_load64_lane(self, align: int, offset: int, lane: int):
+        self.check_memory(offset, 8, key=-2)
+        return super().v128_load64_lane(align, offset, lane)
+
+    def v128_store8_lane(self, align: int, offset: int, lane: int):
+        self.check_memory(offset, 1, key=-2)
+        return super().v128_store8_lane(align, offset, lane)
+
+    def v128_store16_lane(self, align: int, offset: int, lane: int):
+        self.check_memory(offset, 2, key=-2)
+        return super().v128_store16_lane(align, offset, lane)
+
+    def v128_store32_lane(self, align: int, offset: int, lane: int):
+        self.check_memory(offset, 4, key=-2)
+        return super().v128_store32_lane(align, offset, lane)
+
+    def v128_store64_lane(self, align: int, offset: int, lane: int):
+        self.check_memory(offset, 8, key=-2)
+        return super().v128_store64_lane(align, offset, lane)
+
+    def v128_load32_zero(self, align: int, offset: int):
+        self.check_memory(offset, 4)
+        return super().v128_load32_zero(align, offset)
+
+    def v128_load64_zero(self, align: int, offset: int):
+        self.check_memory(offset, 8)
+        return super().v128_load64_zero(align, offset)
 
     def memory_grow(self, index: int):
         a = self.stack.int(read_only=True)
@@ -354,93 +269,65 @@ class CodeSectionBlockDebug(CodeSectionBlock):
         else:
             return super().memory_grow(index)
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_div_s(self):
-        b = self.stack.i64(read_only=True)
-        try:
-            return super().i64_div_s()
-        except FloatingPointError:
-            if b == I64.from_int(0):
-                raise WasmIntegerDivideByZeroError()
-            else:
-                raise WasmIntegerOverflowError()
+        b, a = self.stack.i64(read_only=True), self.stack.i64(read_only=True, key=-2)
+        if b.value == 0:
+            raise WasmIntegerDivideByZeroError()
+        if SignedI64.astype(a).value == SignedI64.get_min() and SignedI64.astype(b).value == -1:
+            raise WasmIntegerOverflowError()
+        return super().i64_div_s()
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_div_u(self):
         b = self.stack.i64(read_only=True)
-        try:
-            return super().i64_div_u()
-        except FloatingPointError:
-            if b == I64.from_int(0):
-                raise WasmIntegerDivideByZeroError()
-            else:
-                raise WasmIntegerOverflowError()
+        if b.value == 0:
+            raise WasmIntegerDivideByZeroError()
+        return super().i64_div_u()
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_rem_s(self):
         b = self.stack.i64(read_only=True)
-        try:
-            return super().i64_rem_s()
-        except FloatingPointError:
-            if b == I64.from_int(0):
-                raise WasmIntegerDivideByZeroError()
-            else:
-                self.stack.push(I64.from_int(0))
+        if b.value == 0:
+            raise WasmIntegerDivideByZeroError()
+        if SignedI64.astype(b).value == -1:
+            self.stack.i64(), self.stack.i64()
+            self.stack.push(I64.from_int(0))
+            return
+        return super().i64_rem_s()
 
-    @NumpyErrorHelper.seterr("raise")
     def i64_rem_u(self):
         b = self.stack.i64(read_only=True)
-        try:
-            return super().i64_rem_u()
-        except FloatingPointError:
-            if b == I64.from_int(0):
-                raise WasmIntegerDivideByZeroError()
-            else:
-                self.stack.push(I64.from_int(0))
+        if b.value == 0:
+            raise WasmIntegerDivideByZeroError()
+        return super().i64_rem_u()
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_div_s(self):
-        b = self.stack.i32(read_only=True)
-        try:
-            return super().i32_div_s()
-        except FloatingPointError:
-            if b == I32.from_int(0):
-                raise WasmIntegerDivideByZeroError()
-            else:
-                raise WasmIntegerOverflowError()
+        b, a = self.stack.i32(read_only=True), self.stack.i32(read_only=True, key=-2)
+        if b.value == 0:
+            raise WasmIntegerDivideByZeroError()
+        if SignedI32.astype(a).value == SignedI32.get_min() and SignedI32.astype(b).value == -1:
+            raise WasmIntegerOverflowError()
+        return super().i32_div_s()
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_div_u(self):
         b = self.stack.i32(read_only=True)
-        try:
-            return super().i32_div_u()
-        except FloatingPointError:
-            if b == I32.from_int(0):
-                raise WasmIntegerDivideByZeroError()
-            else:
-                raise WasmIntegerOverflowError()
+        if b.value == 0:
+            raise WasmIntegerDivideByZeroError()
+        return super().i32_div_u()
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_rem_s(self):
         b = self.stack.i32(read_only=True)
-        try:
-            return super().i32_rem_s()
-        except FloatingPointError:
-            if b == I32.from_int(0):
-                raise WasmIntegerDivideByZeroError()
-            else:
-                self.stack.push(I32.from_int(0))
+        if b.value == 0:
+            raise WasmIntegerDivideByZeroError()
+        if SignedI32.astype(b).value == -1:
+            self.stack.i32(), self.stack.i32()
+            self.stack.push(I32.from_int(0))
+            return
+        return super().i32_rem_s()
 
-    @NumpyErrorHelper.seterr("raise")
     def i32_rem_u(self):
         b = self.stack.i32(read_only=True)
-        try:
-            return super().i32_rem_u()
-        except FloatingPointError:
-            if b == I32.from_int(0):
-                raise WasmIntegerDivideByZeroError()
-            else:
-                self.stack.push(I32.from_int(0))
+        if b.value == 0:
+            raise WasmIntegerDivideByZeroError()
+        return super().i32_rem_u()
 
     def i32_trunc_f32_s(self):
         a = self.stack.f32(read_only=True)
@@ -530,67 +417,35 @@ class CodeSectionBlockDebug(CodeSectionBlock):
             else:
                 raise WasmIntegerOverflowError()
 
-    @NumpyErrorHelper.seterr("raise")
     def memory_init(self, index: int, index2: int):
         c, b, a = (
-            self.stack.i32(read_only=True, key=-1),
-            self.stack.i32(read_only=True, key=-2),
-            self.stack.i32(read_only=True, key=-3),
+            self.stack.int(read_only=True, key=-1),
+            self.stack.int(read_only=True, key=-2),
+            self.stack.int(read_only=True, key=-3),
         )
-        memory = self.env.init_memory[index]
-        try:
-            if I32.from_int(len(self.env.memory)) < a + c:
-                raise WasmOutOfBoundsMemoryAccessError()
-            elif I32.from_int(len(memory)) < b + c:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().memory_init(index, index2)
-        except IndexError:
+        if a + c > len(self.env.memory):
             raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
+        if b + c > len(self.env.init_memory[index]):
             raise WasmOutOfBoundsMemoryAccessError()
+        return super().memory_init(index, index2)
 
-    @NumpyErrorHelper.seterr("raise")
     def memory_copy(self, index: int, index2: int):
         c, b, a = (
-            self.stack.i32(read_only=True, key=-1),
-            self.stack.i32(read_only=True, key=-2),
-            self.stack.i32(read_only=True, key=-3),
+            self.stack.int(read_only=True, key=-1),
+            self.stack.int(read_only=True, key=-2),
+            self.stack.int(read_only=True, key=-3),
         )
-        try:
-            if I32.from_int(len(self.env.memory)) < a + c:
-                raise WasmOutOfBoundsMemoryAccessError()
-            elif I32.from_int(len(self.env.memory)) < b + c:
-                raise WasmOutOfBoundsMemoryAccessError()
-            elif I32.from_int(len(self.env.memory)) < a + c:
-                raise WasmOutOfBoundsMemoryAccessError()
-            elif I32.from_int(len(self.env.memory)) < b + c:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().memory_copy(index, index2)
-        except IndexError:
+        if a + c > len(self.env.memory):
             raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
+        if b + c > len(self.env.memory):
             raise WasmOutOfBoundsMemoryAccessError()
+        return super().memory_copy(index, index2)
 
-    @NumpyErrorHelper.seterr("raise")
     def memory_fill(self, index: int):
-        c, a = self.stack.i32(read_only=True, key=-1), self.stack.i32(read_only=True, key=-3)
-        try:
-            if I32.from_int(len(self.env.memory)) < a + c:
-                raise WasmOutOfBoundsMemoryAccessError()
-            else:
-                return super().memory_fill(index)
-        except IndexError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except ValueError:
-            raise WasmOutOfBoundsMemoryAccessError()
-        except FloatingPointError:
+        c, a = self.stack.int(read_only=True, key=-1), self.stack.int(read_only=True, key=-3)
+        if a + c > len(self.env.memory):
             raise WasmOutOfBoundsMemoryAccessError()
+        return super().memory_fill(index)
 
     def table_init(self, index: int, index2: int):
         c, b, a = (
@@ -626,17 +481,14 @@ class CodeSectionBlockDebug(CodeSectionBlock):
         except IndexError:
             raise WasmOutOfBoundsTableAccessError()
 
-    @NumpyErrorHelper.seterr("raise")
     def table_grow(self, index: int):
-        a = self.stack.i32(read_only=True)
+        a = self.stack.int(read_only=True)
         table_type, table = self.env.get_table(index)
-        try:
-            if I32.from_int(table_type.limits_max or I32.get_max()) < I32.from_int(len(table)) + a:
-                self.stack.push(I32.astype(SignedI32.from_int(-1)))
-            else:
-                return super().table_grow(index)
-        except FloatingPointError:
+        if (table_type.limits_max or I32.get_max()) < len(table) + a:
+            self.stack.int(), self.stack.ref()
             self.stack.push(I32.astype(SignedI32.from_int(-1)))
+        else:
+            return super().table_grow(index)
 
     def table_fill(self, index: int):
         c, a = self.stack.i32(read_only=True, key=-1), self.stack.i32(read_only=True, key=-3)
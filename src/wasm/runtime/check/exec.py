@@ -1,11 +1,11 @@
 from src.wasm.optimizer.struct import CodeInstructionOptimize
 from src.wasm.runtime.check.check import TypeCheck
 from src.wasm.runtime.check.code_exec import CodeSectionBlockDebug
+from src.wasm.runtime.check.stack import NumericStackDebug
 from src.wasm.runtime.error.error import (
     WasmCallStackExhaustedError,
 )
 from src.wasm.runtime.exec import WasmExec
-from src.wasm.runtime.stack import NumericStack
 from src.wasm.type.base import AnyType
 
 
@@ -38,5 +38,5 @@ class WasmExecCheck(WasmExec):
         return CodeSectionBlockDebug(
             env=self,
             locals=locals,
-            stack=NumericStack(value=stack),
+            stack=NumericStackDebug(value=stack),
         )
@@ -0,0 +1,45 @@
+from typing import TypeVar
+
+from src.wasm.runtime.error.error import WasmTypeMismatchError
+from src.wasm.runtime.stack import NumericStack
+from src.wasm.type.base import AnyType
+from src.wasm.type.numeric.numpy.float import F32, F64
+from src.wasm.type.numeric.numpy.int import I32, I64
+from src.wasm.type.numeric.numpy.v128 import V128
+from src.wasm.type.ref.base import RefType
+
+
+class NumericStackDebug(NumericStack):
+    """取り出す値の型を確認するスタック"""
+
+    T = TypeVar("T", bound=AnyType)
+
+    def __pop(self, value: type[T], read_only=False, key=-1) -> T:
+        item = self.any(read_only, key)
+        if not isinstance(item, value):
+            raise WasmTypeMismatchError()
+        return item
+
+    def bool(self, read_only=False, key=-1) -> bool:
+        return bool(self.__pop(I32, read_only, key))
+
+    def int(self, read_only=False, key=-1) -> int:
+        return int(self.__pop(I32, read_only, key))
+
+    def i32(self, read_only=False, key=-1) -> I32:
+        return self.__pop(I32, read_only, key)
+
+    def i64(self, read_only=False, key=-1) -> I64:
+        return self.__pop(I64, read_only, key)
+
+    def f32(self, read_only=False, key=-1) -> F32:
+        return self.__pop(F32, read_only, key)
+
+    def f64(self, read_only=False, key=-1) -> F64:
+        return self.__pop(F64, read_only, key)
+
+    def v128(self, read_only=False, key=-1) -> V128:
+        return self.__pop(V128, read_only, key)
+
+    def ref(self, read_only=False, key=-1) -> RefType:
+        return self.__pop(RefType, read_only, key)
@@ -1,15 +1,18 @@
 import sys
 from math import ceil, floor, trunc
+from typing import Optional
 
 from src.wasm.optimizer.optimizer import WasmOptimizer
+from src.wasm.optimizer.struct import CodeInstructionByteLoop, CodeInstructionOptimize
 from src.wasm.runtime.check.check import TypeCheck
-from src.wasm.runtime.run import CodeSectionRun
+from src.wasm.runtime.run import WasmTailCall
+from src.wasm.runtime.simd import CodeSectionBlockSimd
 from src.wasm.type.numeric.numpy.float import F32, F64
 from src.wasm.type.numeric.numpy.int import I8, I16, I32, I64, SignedI8, SignedI16, SignedI32, SignedI64
 from src.wasm.type.ref.base import FuncRef
 
 
-class CodeSectionBlock(CodeSectionRun):
+class CodeSectionBlock(CodeSectionBlockSimd):
     def unreachable(self):
         print("unreachable")
         sys.exit(1)
@@ -18,6 +21,9 @@ class CodeSectionBlock(CodeSectionRun):
         pass
 
     def block(self, block_type: int):
+        if self.instruction.__class__ is CodeInstructionByteLoop and self.byte_loop(self.instruction):
+            return
+
         fn_type_params, fn_type_returns = self.env.get_type(block_type)
         block_stack = [self.stack.any() for _ in fn_type_params][::-1]
         TypeCheck.type_check(block_stack, fn_type_params)
@@ -39,6 +45,46 @@ class CodeSectionBlock(CodeSectionRun):
         if isinstance(br, int) and br > 0:
             return br - 1
 
+    def byte_loop(self, loop: CodeInstructionByteLoop) -> bool:
+        """1バイトずつのコピー/フィルを memory.copy/memory.fill でまとめて実行する
+
+        範囲外アクセスでトラップする場合や、コピー先がコピー元に前方で重なる場合は False を返す。
+        """
+        i, n = int(self.locals[loop.index].value), self.operand(loop.limit)
+        if i >= n:
+            return True
+
+        count = n - i
+        dst = self.operand(loop.dst) + i + loop.dst_offset
+        if dst + count > len(self.env.memory):
+            return False
+        # 燃料が足りない場合は元のループを実行し、同じ繰り返しでトラップさせる
+        if self.env.fuel is not None and self.env.fuel < count:
+            return False
+        if loop.value is None:
+            src = self.operand(loop.src) + i + loop.src_offset
+            # 前方に重なると書き込んだバイトを再び読み込むため、memory.copy とは結果が異なる
+            if src + count > len(self.env.memory) or src < dst < src + count:
+                return False
+            self.stack.extend([I32.from_int(dst), I32.from_int(src), I32.from_int(count)])
+            self.memory_copy(0, 0)
+        else:
+            value = self.locals[loop.value.args[0]] if loop.value.opcode == 0x20 else loop.value.args[0]
+            self.stack.extend([I32.from_int(dst), value, I32.from_int(count)])
+            self.memory_fill(0)
+        if self.env.fuel is not None:
+            self.env.consume_fuel(count)
+        self.locals[loop.index] = I32.from_int(n)
+        return True
+
+    def operand(self, instruction: Optional[CodeInstructionOptimize]) -> int:
+        """`local.get` か `i32.const` の値を返す。None は0とする"""
+        if instruction is None:
+            return 0
+        if instruction.opcode == 0x20:
+            return int(self.locals[instruction.args[0]].value)
+        return int(instruction.args[0].value)
+
     def loop(self, block_type: int):
         fn_type_params, fn_type_returns = self.env.get_type(block_type)
         block_stack = [self.stack.any() for _ in fn_type_params][::-1]
@@ -49,6 +95,8 @@ class CodeSectionBlock(CodeSectionRun):
             if isinstance(br, list):
                 return br
             elif br == 0:
+                if self.env.metered:
+                    self.env.checkpoint(1)
                 block_stack = [block.stack.any() for _ in fn_type_params][::-1]
                 TypeCheck.type_check(block_stack, fn_type_params)
             else:
@@ -111,6 +159,8 @@ class CodeSectionBlock(CodeSectionRun):
     def call(self, index: int):
         _, fn_type = self.env.get_function(index)
         param = [self.stack.any() for _ in fn_type.params][::-1]
+        if index < self.env.import_count and self.env.metered:
+            self.env.checkpoint(self.env.fuel_host_call)
         res = self.env.functions[index](param)
         self.stack.extend(res)
 
@@ -119,6 +169,16 @@ class CodeSectionBlock(CodeSectionRun):
         table = self.env.tables[elm_index]
         self.call(int(table[a]))
 
+    def return_call(self, index: int):
+        _, fn_type = self.env.get_function(index)
+        param = [self.stack.any() for _ in fn_type.params][::-1]
+        return WasmTailCall(index, param)
+
+    def return_call_indirect(self, index: int, elm_index: int):
+        a = self.stack.int()
+        table = self.env.tables[elm_index]
+        return self.return_call(int(table[a]))
+
     def drop(self):
         self.stack.any()
 
@@ -264,6 +324,8 @@ class CodeSectionBlock(CodeSectionRun):
     def memory_grow(self, index: int):
         a = self.stack.int()
         b = len(self.env.memory) // 64 // 1024
+        if self.env.fuel is not None:
+            self.env.consume_fuel(self.env.fuel_memory_grow * a)
         self.env.memory.grow(64 * 1024 * a)
         self.stack.push(I32.from_int(b))
 
@@ -281,7 +343,7 @@ class CodeSectionBlock(CodeSectionRun):
 
     def i32_eqz(self):
         a = self.stack.i32()
-        self.stack.push(a == I32.from_int(0))
+        self.stack.push(I32.from_bool(a.value == 0))
 
     def i32_eq(self):
         b, a = self.stack.i32(), self.stack.i32()
@@ -329,7 +391,7 @@ class CodeSectionBlock(CodeSectionRun):
 
     def i64_eqz(self):
         a = self.stack.i64()
-        self.stack.push(a == I64.from_int(0))
+        self.stack.push(I32.from_bool(a.value == 0))
 
     def i64_eq(self):
         b, a = self.stack.i64(), self.stack.i64()
@@ -67,6 +67,14 @@ class WasmOutOfBoundsTableAccessError(WasmRuntimeError):
     MESSAGE = "out of bounds table access"
 
 
+class WasmOutOfFuelError(WasmRuntimeError):
+    MESSAGE = "all fuel consumed"
+
+
+class WasmInterruptedError(WasmRuntimeError):
+    MESSAGE = "interrupted"
+
+
 class WasmUnimplementedError(WasmError):
     def __init__(self, message: str):
         super().__init__()
@@ -1,7 +1,11 @@
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from typing import Callable, Optional, TypeVar
 
 from src.tools.logger import NestedLogger
+from src.wasm.loader.name import WasmNameIndex
 from src.wasm.optimizer.optimizer import WasmOptimizer
 from src.wasm.optimizer.struct import (
     CodeInstructionOptimize,
@@ -11,8 +15,11 @@ from src.wasm.optimizer.struct import (
     TypeSectionOptimize,
     WasmSectionsOptimize,
 )
+from src.wasm.runtime.batch import WasmBatchExec, WasmBatchFallback
 from src.wasm.runtime.code_exec import CodeSectionBlock
+from src.wasm.runtime.error.error import WasmInterruptedError, WasmOutOfFuelError
 from src.wasm.runtime.export import WasmExport, WasmExportFunction, WasmExportGlobal, WasmExportMemory, WasmExportTable
+from src.wasm.runtime.run import WasmTailCall
 from src.wasm.runtime.stack import NumericStack
 from src.wasm.type.base import AnyType
 from src.wasm.type.bytes.numpy.base import NumpyBytesType
@@ -32,10 +39,25 @@ class WasmExec:
         self.init()
 
     def init(self):
+        # 燃料。None の場合は制限しない
+        self.fuel: Optional[int] = None
+        self.fuel_host_call = 0
+        self.fuel_memory_grow = 0
+        # 実行期限 (time.monotonic) と、他のスレッドからの中断要求
+        self.deadline: Optional[float] = None
+        self.interrupted = False
+        # 燃料・実行期限・中断要求のいずれかがある場合に `checkpoint` を呼ぶ
+        self.metered = False
+        # 実行中の `start`/`map` の数。中断要求は実行中の呼び出しにだけ届ける
+        self.running = 0
+        self.lock = threading.Lock()
+
         self.functions: list[Callable[[list[AnyType]], list[AnyType]]] = []
         self.globals: list[GlobalsType] = []
+        self.names = WasmNameIndex(self.sections.name_section[0].data if self.sections.name_section else None)
 
         self.import_init()
+        self.import_count = len(self.functions)
         for i in range(len(self.functions), len(self.functions) + len(self.sections.function_section)):
             self.functions.append(lambda x, self=self, i=i: self.run(i, x))
         memory_size = self.sections.memory_section[0].limits_min if self.sections.memory_section else 0
@@ -140,16 +162,87 @@ class WasmExec:
             #     self.drop_elem[i] = True
 
     @logger.logger
-    def start(self, field: bytes, param: list[AnyType]) -> list[AnyType]:
-        """エントリーポイントを実行する"""
+    def start(
+        self, field: bytes, param: list[AnyType], fuel: Optional[int] = None, timeout: Optional[float] = None
+    ) -> list[AnyType]:
+        """エントリーポイントを実行する
 
-        assert self.logger.info(f"field: {field.decode()}")
+        `fuel` を指定すると、関数の呼び出しとループの繰り返しごとに1ずつ消費し、
+        尽きると `WasmOutOfFuelError` を送出する。ホスト関数の呼び出しと memory.grow の1ページごとには、
+        それぞれ `fuel_host_call`, `fuel_memory_grow` を追加で消費する。
+        残りの燃料は実行後 (トラップした場合も含む) に `fuel` で参照できる。
+
+        `timeout` (秒) を指定すると、期限を過ぎた後のループの繰り返しか関数の呼び出しで
+        `WasmInterruptedError` を送出する。
+        """
+
+        assert self.logger.info(f"field: {field.decode()}, fuel: {fuel}, timeout: {timeout}")
 
         # エントリーポイントの関数を取得する
         start = [fn for fn in self.sections.export_section if fn.field_name == field][0]
         assert start.kind == 0x00
 
-        return self.functions[start.index](param)
+        with self.call(fuel, timeout):
+            return self.functions[start.index](param)
+
+    @logger.logger
+    def map(self, field: bytes, params: list[list[AnyType]], timeout: Optional[float] = None) -> list[list[AnyType]]:
+        """エントリーポイントを複数の引数でまとめて実行する
+
+        引数の組ごとの戻り値を返す。メモリへの書き込みやインポート関数の呼び出し、
+        トラップなどバッチで実行できない場合は、引数の組ごとに `start` と同様に実行する。
+        `timeout` と `interrupt` は `start` と同じく、全ての引数の組をまとめた実行に対して働く。
+        """
+
+        assert self.logger.info(f"field: {field.decode()}, size: {len(params)}, timeout: {timeout}")
+
+        start = [fn for fn in self.sections.export_section if fn.field_name == field][0]
+        assert start.kind == 0x00
+
+        if len(params) == 0:
+            return []
+        with self.call(None, timeout):
+            try:
+                return WasmBatchExec(self, len(params)).run(start.index, params)
+            except WasmBatchFallback as e:
+                assert self.logger.debug(f"fallback: {e}")
+                return [self.functions[start.index](x) for x in params]
+
+    @contextmanager
+    def call(self, fuel: Optional[int], timeout: Optional[float]):
+        """`start`/`map` の間、燃料と実行期限を設定する
+
+        ホスト関数から呼び出された場合は、外側の燃料と実行期限の範囲で実行し、消費した燃料を外側から差し引く。
+        中断要求は一番外側の呼び出しが終わるまで残し、終わると取り消す。
+        そのため、終わった後に届いた要求が次の呼び出しを中断することはない。
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            outer = (self.fuel, self.deadline) if self.running else None
+            if outer is not None:
+                if self.fuel is not None:
+                    fuel = self.fuel if fuel is None else min(fuel, self.fuel)
+                if self.deadline is not None:
+                    deadline = self.deadline if deadline is None else min(deadline, self.deadline)
+            self.running += 1
+            self.fuel, self.deadline = fuel, deadline
+            self.metered = fuel is not None or deadline is not None or self.interrupted
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.running -= 1
+                if outer is None:
+                    self.interrupted = False
+                    self.metered = False
+                else:
+                    outer_fuel, self.deadline = outer
+                    if outer_fuel is not None:
+                        assert fuel is not None and self.fuel is not None
+                        self.fuel = outer_fuel - (fuel - self.fuel)
+                    else:
+                        self.fuel = None
+                    self.metered = self.fuel is not None or self.deadline is not None or self.interrupted
 
     @logger.logger
     def get_global(self, field: bytes) -> GlobalsType:
@@ -163,16 +256,57 @@ class WasmExec:
 
         return self.globals[start.index]
 
-    def run(self, index: int, param: list[AnyType]):
-        fn, fn_type = self.get_function(index)
+    def consume_fuel(self, amount: int):
+        """燃料を消費する。足りない場合は消費せずにトラップする"""
+        if self.fuel is not None:
+            if self.fuel < amount:
+                raise WasmOutOfFuelError()
+            self.fuel -= amount
+
+    def interrupt(self):
+        """実行中の関数を中断する
+
+        他のスレッドやタイマーから呼び出すと、次のループの繰り返しか関数の呼び出しで `WasmInterruptedError` を送出する。
+        実行中の呼び出しが無い場合は何もしない。
+        """
+        with self.lock:
+            if self.running:
+                self.interrupted = True
+                self.metered = True
+
+    def checkpoint(self, fuel: int):
+        """ループの繰り返しと関数の呼び出しごとに、中断要求と実行期限を確認して燃料を消費する"""
+        if self.interrupted:
+            raise WasmInterruptedError()
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise WasmInterruptedError()
+        self.consume_fuel(fuel)
 
-        # ローカル変数とExecインスタンスを生成
-        locals_param = [WasmOptimizer.get_any_type(x).from_null() for x in fn.local]
-        locals = [*param, *locals_param]
-        block = self.get_block(locals=locals, stack=[])
+    def run(self, index: int, param: list[AnyType]):
+        while True:
+            if self.metered:
+                self.checkpoint(1)
+            fn, fn_type = self.get_function(index)
+            assert self.logger.debug(f"function: {self.get_function_name(index)}")
+
+            # ローカル変数とExecインスタンスを生成
+            locals_param = [WasmOptimizer.get_any_type(x).from_null() for x in fn.local]
+            locals = [*param, *locals_param]
+            block = self.get_block(locals=locals, stack=[])
+
+            # 実行
+            res = block.run(fn.data)
+            if res.__class__ is not WasmTailCall:
+                break
+
+            # return_call はホストのスタックを伸ばさず、このフレームで呼び出し先を実行する
+            assert isinstance(res, WasmTailCall)
+            index, param = res.index, list(res)
+            if index < self.import_count:
+                if self.metered:
+                    self.checkpoint(self.fuel_host_call)
+                return self.functions[index](param)
 
-        # 実行
-        res = block.run(fn.data)
         if isinstance(res, list):
             returns = [res.pop() for _ in fn_type.returns][::-1]
         else:
@@ -203,6 +337,12 @@ class WasmExec:
         code = self.sections.code_section[index]
         return code, type
 
+    def get_function_name(self, index: int) -> str:
+        """関数のインデックスから関数名を取得する。Name Sectionが無い場合はインデックスを返す"""
+
+        name = self.names.function(index)
+        return name if name is not None else f"func[{index}]"
+
     def get_type(self, index: int) -> tuple[list[int], Optional[list[int]]]:
         """関数のインデックスからCode SectionとType Sectionを取得する"""
 
@@ -14,6 +14,17 @@ if TYPE_CHECKING:
     from src.wasm.runtime.exec import WasmExec
 
 
+class WasmTailCall(list):
+    """return_call で呼び出す関数と、その引数
+
+    return と同じく list としてブロックを抜け、呼び出し元の `WasmExec.run` で同じフレームのまま実行する。
+    """
+
+    def __init__(self, index: int, param: list[AnyType]):
+        super().__init__(param)
+        self.index = index
+
+
 class CodeSectionRun(CodeSectionSpec):
     logger = NestedLogger(logging.getLogger(__name__))
 
@@ -0,0 +1,1042 @@
+import numpy as np
+
+from src.wasm.runtime.run import CodeSectionRun
+from src.wasm.type.numeric.numpy.float import F32, F64
+from src.wasm.type.numeric.numpy.int import I32, I64
+from src.wasm.type.numeric.numpy.v128 import V128
+
+
+class CodeSectionBlockSimd(CodeSectionRun):
+    """Vector Instructions(0xFDプレフィックス)の実装
+
+    16バイトの値をレーンの配列として NumPy で一括に演算する。
+    """
+
+    @staticmethod
+    def bitmask(value: np.ndarray) -> I32:
+        """各レーンの最上位ビットを並べた値を返す"""
+        return I32.from_int(int(np.dot(value < 0, 1 << np.arange(len(value)))))
+
+    @staticmethod
+    def float_min(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """NaNを伝播し、-0と+0では-0を返すmin"""
+        return np.where(a == b, np.where(np.signbit(a), a, b), np.minimum(a, b))
+
+    @staticmethod
+    def float_max(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """NaNを伝播し、-0と+0では+0を返すmax"""
+        return np.where(a == b, np.where(np.signbit(a), b, a), np.maximum(a, b))
+
+    @staticmethod
+    def trunc_sat(value: np.ndarray, dtype: type[np.integer]) -> np.ndarray:
+        """NaNを0にし、範囲外の値を飽和させて整数に変換する"""
+        info = np.iinfo(dtype)
+        value = value.astype(np.float64)
+        return np.where(np.isnan(value), 0, np.clip(np.trunc(value), info.min, info.max)).astype(dtype)
+
+    def load_lane(self, offset: int, lane: int, size: int):
+        b, addr = self.stack.v128(), self.stack.int()
+        value = b.value.copy()
+        value[lane * size : (lane + 1) * size] = self.env.memory[addr + offset : addr + offset + size]
+        self.stack.push(V128(value))
+
+    def store_lane(self, offset: int, lane: int, size: int):
+        b, addr = self.stack.v128(), self.stack.int()
+        self.env.memory[addr + offset : addr + offset + size] = b.value[lane * size : (lane + 1) * size]
+
+    # Vector Memory Instructions
+
+    def v128_load(self, align: int, offset: int):
+        addr = self.stack.int()
+        self.stack.push(V128.from_bits(self.env.memory[addr + offset : addr + offset + 16]))
+
+    def v128_load8x8_s(self, align: int, offset: int):
+        addr = self.stack.int()
+        data = self.env.memory[addr + offset : addr + offset + 8].view(np.int8)
+        self.stack.push(V128.from_lanes(data.astype(np.int16)))
+
+    def v128_load8x8_u(self, align: int, offset: int):
+        addr = self.stack.int()
+        data = self.env.memory[addr + offset : addr + offset + 8].view(np.uint8)
+        self.stack.push(V128.from_lanes(data.astype(np.uint16)))
+
+    def v128_load16x4_s(self, align: int, offset: int):
+        addr = self.stack.int()
+        data = self.env.memory[addr + offset : addr + offset + 8].view(np.int16)
+        self.stack.push(V128.from_lanes(data.astype(np.int32)))
+
+    def v128_load16x4_u(self, align: int, offset: int):
+        addr = self.stack.int()
+        data = self.env.memory[addr + offset : addr + offset + 8].view(np.uint16)
+        self.stack.push(V128.from_lanes(data.astype(np.uint32)))
+
+    def v128_load32x2_s(self, align: int, offset: int):
+        addr = self.stack.int()
+        data = self.env.memory[addr + offset : addr + offset + 8].view(np.int32)
+        self.stack.push(V128.from_lanes(data.astype(np.int64)))
+
+    def v128_load32x2_u(self, align: int, offset: int):
+        addr = self.stack.int()
+        data = self.env.memory[addr + offset : addr + offset + 8].view(np.uint32)
+        self.stack.push(V128.from_lanes(data.astype(np.uint64)))
+
+    def v128_load8_splat(self, align: int, offset: int):
+        addr = self.stack.int()
+        self.stack.push(V128.from_lanes(np.tile(self.env.memory[addr + offset : addr + offset + 1], 16)))
+
+    def v128_load16_splat(self, align: int, offset: int):
+        addr = self.stack.int()
+        self.stack.push(V128.from_lanes(np.tile(self.env.memory[addr + offset : addr + offset + 2], 8)))
+
+    def v128_load32_splat(self, align: int, offset: int):
+        addr = self.stack.int()
+        self.stack.push(V128.from_lanes(np.tile(self.env.memory[addr + offset : addr + offset + 4], 4)))
+
+    def v128_load64_splat(self, align: int, offset: int):
+        addr = self.stack.int()
+        self.stack.push(V128.from_lanes(np.tile(self.env.memory[addr + offset : addr + offset + 8], 2)))
+
+    def v128_store(self, align: int, offset: int):
+        b, addr = self.stack.v128(), self.stack.int()
+        self.env.memory[addr + offset : addr + offset + 16] = b.value
+
+    def v128_load8_lane(self, align: int, offset: int, lane: int):
+        self.load_lane(offset, lane, 1)
+
+    def v128_load16_lane(self, align: int, offset: int, lane: int):
+        self.load_lane(offset, lane, 2)
+
+    def v128_load32_lane(self, align: int, offset: int, lane: int):
+        self.load_lane(offset, lane, 4)
+
+    def v128_load64_lane(self, align: int, offset: int, lane: int):
+        self.load_lane(offset, lane, 8)
+
+    def v128_store8_lane(self, align: int, offset: int, lane: int):
+        self.store_lane(offset, lane, 1)
+
+    def v128_store16_lane(self, align: int, offset: int, lane: int):
+        self.store_lane(offset, lane, 2)
+
+    def v128_store32_lane(self, align: int, offset: int, lane: int):
+        self.store_lane(offset, lane, 4)
+
+    def v128_store64_lane(self, align: int, offset: int, lane: int):
+        self.store_lane(offset, lane, 8)
+
+    def v128_load32_zero(self, align: int, offset: int):
+        addr = self.stack.int()
+        data = self.env.memory[addr + offset : addr + offset + 4]
+        self.stack.push(V128.from_lanes(np.concatenate([data, np.zeros(12, dtype=np.uint8)])))
+
+    def v128_load64_zero(self, align: int, offset: int):
+        addr = self.stack.int()
+        data = self.env.memory[addr + offset : addr + offset + 8]
+        self.stack.push(V128.from_lanes(np.concatenate([data, np.zeros(8, dtype=np.uint8)])))
+
+    # Vector Lane Instructions
+
+    def v128_const(self, value: V128):
+        self.stack.push(value)
+
+    def i8x16_shuffle(self, lanes: V128):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128(np.concatenate([a.value, b.value])[lanes.value]))
+
+    def i8x16_swizzle(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.value[np.minimum(b.value, 15)]
+        self.stack.push(V128(np.where(b.value < 16, data, np.uint8(0))))
+
+    def i8x16_splat(self):
+        a = self.stack.i32()
+        self.stack.push(V128.from_lanes(np.full(16, int(a) & 0xFF, dtype=np.uint8)))
+
+    def i16x8_splat(self):
+        a = self.stack.i32()
+        self.stack.push(V128.from_lanes(np.full(8, int(a) & 0xFFFF, dtype=np.uint16)))
+
+    def i32x4_splat(self):
+        a = self.stack.i32()
+        self.stack.push(V128.from_lanes(np.full(4, a.value, dtype=np.uint32)))
+
+    def i64x2_splat(self):
+        a = self.stack.i64()
+        self.stack.push(V128.from_lanes(np.full(2, a.value, dtype=np.uint64)))
+
+    def f32x4_splat(self):
+        a = self.stack.f32()
+        self.stack.push(V128.from_lanes(np.full(4, a.value, dtype=np.float32)))
+
+    def f64x2_splat(self):
+        a = self.stack.f64()
+        self.stack.push(V128.from_lanes(np.full(2, a.value, dtype=np.float64)))
+
+    def i8x16_extract_lane_s(self, lane: int):
+        a = self.stack.v128()
+        self.stack.push(I32.from_int(int(a.lanes(np.int8)[lane]) & 0xFFFFFFFF))
+
+    def i8x16_extract_lane_u(self, lane: int):
+        a = self.stack.v128()
+        self.stack.push(I32.from_int(int(a.lanes(np.uint8)[lane])))
+
+    def i8x16_replace_lane(self, lane: int):
+        b, a = self.stack.i32(), self.stack.v128()
+        value = a.value.copy()
+        value[lane] = int(b) & 0xFF
+        self.stack.push(V128(value))
+
+    def i16x8_extract_lane_s(self, lane: int):
+        a = self.stack.v128()
+        self.stack.push(I32.from_int(int(a.lanes(np.int16)[lane]) & 0xFFFFFFFF))
+
+    def i16x8_extract_lane_u(self, lane: int):
+        a = self.stack.v128()
+        self.stack.push(I32.from_int(int(a.lanes(np.uint16)[lane])))
+
+    def i16x8_replace_lane(self, lane: int):
+        b, a = self.stack.i32(), self.stack.v128()
+        value = a.lanes(np.uint16).copy()
+        value[lane] = int(b) & 0xFFFF
+        self.stack.push(V128.from_lanes(value))
+
+    def i32x4_extract_lane(self, lane: int):
+        a = self.stack.v128()
+        self.stack.push(I32(a.lanes(np.uint32)[lane]))
+
+    def i32x4_replace_lane(self, lane: int):
+        b, a = self.stack.i32(), self.stack.v128()
+        value = a.lanes(np.uint32).copy()
+        value[lane] = b.value
+        self.stack.push(V128.from_lanes(value))
+
+    def i64x2_extract_lane(self, lane: int):
+        a = self.stack.v128()
+        self.stack.push(I64(a.lanes(np.uint64)[lane]))
+
+    def i64x2_replace_lane(self, lane: int):
+        b, a = self.stack.i64(), self.stack.v128()
+        value = a.lanes(np.uint64).copy()
+        value[lane] = b.value
+        self.stack.push(V128.from_lanes(value))
+
+    def f32x4_extract_lane(self, lane: int):
+        a = self.stack.v128()
+        self.stack.push(F32(a.lanes(np.float32)[lane]))
+
+    def f32x4_replace_lane(self, lane: int):
+        b, a = self.stack.f32(), self.stack.v128()
+        value = a.lanes(np.float32).copy()
+        value[lane] = b.value
+        self.stack.push(V128.from_lanes(value))
+
+    def f64x2_extract_lane(self, lane: int):
+        a = self.stack.v128()
+        self.stack.push(F64(a.lanes(np.float64)[lane]))
+
+    def f64x2_replace_lane(self, lane: int):
+        b, a = self.stack.f64(), self.stack.v128()
+        value = a.lanes(np.float64).copy()
+        value[lane] = b.value
+        self.stack.push(V128.from_lanes(value))
+
+    # Vector Comparison Instructions
+
+    def i8x16_eq(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint8) == b.lanes(np.uint8), np.int8))
+
+    def i8x16_ne(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint8) != b.lanes(np.uint8), np.int8))
+
+    def i8x16_lt_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int8) < b.lanes(np.int8), np.int8))
+
+    def i8x16_lt_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint8) < b.lanes(np.uint8), np.int8))
+
+    def i8x16_gt_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int8) > b.lanes(np.int8), np.int8))
+
+    def i8x16_gt_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint8) > b.lanes(np.uint8), np.int8))
+
+    def i8x16_le_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int8) <= b.lanes(np.int8), np.int8))
+
+    def i8x16_le_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint8) <= b.lanes(np.uint8), np.int8))
+
+    def i8x16_ge_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int8) >= b.lanes(np.int8), np.int8))
+
+    def i8x16_ge_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint8) >= b.lanes(np.uint8), np.int8))
+
+    def i16x8_eq(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint16) == b.lanes(np.uint16), np.int16))
+
+    def i16x8_ne(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint16) != b.lanes(np.uint16), np.int16))
+
+    def i16x8_lt_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int16) < b.lanes(np.int16), np.int16))
+
+    def i16x8_lt_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint16) < b.lanes(np.uint16), np.int16))
+
+    def i16x8_gt_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int16) > b.lanes(np.int16), np.int16))
+
+    def i16x8_gt_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint16) > b.lanes(np.uint16), np.int16))
+
+    def i16x8_le_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int16) <= b.lanes(np.int16), np.int16))
+
+    def i16x8_le_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint16) <= b.lanes(np.uint16), np.int16))
+
+    def i16x8_ge_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int16) >= b.lanes(np.int16), np.int16))
+
+    def i16x8_ge_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint16) >= b.lanes(np.uint16), np.int16))
+
+    def i32x4_eq(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint32) == b.lanes(np.uint32), np.int32))
+
+    def i32x4_ne(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint32) != b.lanes(np.uint32), np.int32))
+
+    def i32x4_lt_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int32) < b.lanes(np.int32), np.int32))
+
+    def i32x4_lt_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint32) < b.lanes(np.uint32), np.int32))
+
+    def i32x4_gt_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int32) > b.lanes(np.int32), np.int32))
+
+    def i32x4_gt_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint32) > b.lanes(np.uint32), np.int32))
+
+    def i32x4_le_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int32) <= b.lanes(np.int32), np.int32))
+
+    def i32x4_le_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint32) <= b.lanes(np.uint32), np.int32))
+
+    def i32x4_ge_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int32) >= b.lanes(np.int32), np.int32))
+
+    def i32x4_ge_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint32) >= b.lanes(np.uint32), np.int32))
+
+    def i64x2_eq(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint64) == b.lanes(np.uint64), np.int64))
+
+    def i64x2_ne(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.uint64) != b.lanes(np.uint64), np.int64))
+
+    def i64x2_lt_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int64) < b.lanes(np.int64), np.int64))
+
+    def i64x2_gt_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int64) > b.lanes(np.int64), np.int64))
+
+    def i64x2_le_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int64) <= b.lanes(np.int64), np.int64))
+
+    def i64x2_ge_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.int64) >= b.lanes(np.int64), np.int64))
+
+    def f32x4_eq(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float32) == b.lanes(np.float32), np.int32))
+
+    def f32x4_ne(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float32) != b.lanes(np.float32), np.int32))
+
+    def f32x4_lt(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float32) < b.lanes(np.float32), np.int32))
+
+    def f32x4_gt(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float32) > b.lanes(np.float32), np.int32))
+
+    def f32x4_le(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float32) <= b.lanes(np.float32), np.int32))
+
+    def f32x4_ge(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float32) >= b.lanes(np.float32), np.int32))
+
+    def f64x2_eq(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float64) == b.lanes(np.float64), np.int64))
+
+    def f64x2_ne(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float64) != b.lanes(np.float64), np.int64))
+
+    def f64x2_lt(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float64) < b.lanes(np.float64), np.int64))
+
+    def f64x2_gt(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float64) > b.lanes(np.float64), np.int64))
+
+    def f64x2_le(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float64) <= b.lanes(np.float64), np.int64))
+
+    def f64x2_ge(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_mask(a.lanes(np.float64) >= b.lanes(np.float64), np.int64))
+
+    # Vector Bitwise Instructions
+
+    def v128_not(self):
+        a = self.stack.v128()
+        self.stack.push(V128(~a.value))
+
+    def v128_and(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128(a.value & b.value))
+
+    def v128_andnot(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128(a.value & ~b.value))
+
+    def v128_or(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128(a.value | b.value))
+
+    def v128_xor(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128(a.value ^ b.value))
+
+    def v128_bitselect(self):
+        c, b, a = self.stack.v128(), self.stack.v128(), self.stack.v128()
+        self.stack.push(V128((a.value & c.value) | (b.value & ~c.value)))
+
+    def v128_any_true(self):
+        a = self.stack.v128()
+        self.stack.push(I32.from_bool(bool(a.value.any())))
+
+    # Vector Integer Instructions
+
+    def i8x16_abs(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.abs(a.lanes(np.int8))))
+
+    def i8x16_neg(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(-a.lanes(np.int8)))
+
+    def i8x16_popcnt(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.unpackbits(a.value).reshape(16, 8).sum(axis=1).astype(np.uint8)))
+
+    def i8x16_all_true(self):
+        a = self.stack.v128()
+        self.stack.push(I32.from_bool(bool(a.lanes(np.uint8).all())))
+
+    def i8x16_bitmask(self):
+        a = self.stack.v128()
+        self.stack.push(self.bitmask(a.lanes(np.int8)))
+
+    def i8x16_narrow_i16x8_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = np.concatenate([a.lanes(np.int16), b.lanes(np.int16)])
+        self.stack.push(V128.from_lanes(np.clip(data, -0x80, 0x7F).astype(np.int8)))
+
+    def i8x16_narrow_i16x8_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = np.concatenate([a.lanes(np.int16), b.lanes(np.int16)])
+        self.stack.push(V128.from_lanes(np.clip(data, 0, 0xFF).astype(np.uint8)))
+
+    def i8x16_shl(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint8) << (int(b) % 8)))
+
+    def i8x16_shr_s(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int8) >> (int(b) % 8)))
+
+    def i8x16_shr_u(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint8) >> (int(b) % 8)))
+
+    def i8x16_add(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint8) + b.lanes(np.uint8)))
+
+    def i8x16_add_sat_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.int8).astype(np.int16) + b.lanes(np.int8)
+        self.stack.push(V128.from_lanes(np.clip(data, -0x80, 0x7F).astype(np.int8)))
+
+    def i8x16_add_sat_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.uint8).astype(np.uint16) + b.lanes(np.uint8)
+        self.stack.push(V128.from_lanes(np.minimum(data, 0xFF).astype(np.uint8)))
+
+    def i8x16_sub(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint8) - b.lanes(np.uint8)))
+
+    def i8x16_sub_sat_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.int8).astype(np.int16) - b.lanes(np.int8)
+        self.stack.push(V128.from_lanes(np.clip(data, -0x80, 0x7F).astype(np.int8)))
+
+    def i8x16_sub_sat_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.uint8).astype(np.int16) - b.lanes(np.uint8)
+        self.stack.push(V128.from_lanes(np.clip(data, 0, 0xFF).astype(np.uint8)))
+
+    def i8x16_min_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.minimum(a.lanes(np.int8), b.lanes(np.int8))))
+
+    def i8x16_min_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.minimum(a.lanes(np.uint8), b.lanes(np.uint8))))
+
+    def i8x16_max_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.maximum(a.lanes(np.int8), b.lanes(np.int8))))
+
+    def i8x16_max_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.maximum(a.lanes(np.uint8), b.lanes(np.uint8))))
+
+    def i8x16_avgr_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = (a.lanes(np.uint8).astype(np.uint16) + b.lanes(np.uint8) + 1) >> 1
+        self.stack.push(V128.from_lanes(data.astype(np.uint8)))
+
+    def i16x8_extadd_pairwise_i8x16_s(self):
+        a = self.stack.v128()
+        data = a.lanes(np.int8).astype(np.int16)
+        self.stack.push(V128.from_lanes(data[0::2] + data[1::2]))
+
+    def i16x8_extadd_pairwise_i8x16_u(self):
+        a = self.stack.v128()
+        data = a.lanes(np.uint8).astype(np.uint16)
+        self.stack.push(V128.from_lanes(data[0::2] + data[1::2]))
+
+    def i32x4_extadd_pairwise_i16x8_s(self):
+        a = self.stack.v128()
+        data = a.lanes(np.int16).astype(np.int32)
+        self.stack.push(V128.from_lanes(data[0::2] + data[1::2]))
+
+    def i32x4_extadd_pairwise_i16x8_u(self):
+        a = self.stack.v128()
+        data = a.lanes(np.uint16).astype(np.uint32)
+        self.stack.push(V128.from_lanes(data[0::2] + data[1::2]))
+
+    def i16x8_abs(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.abs(a.lanes(np.int16))))
+
+    def i16x8_neg(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(-a.lanes(np.int16)))
+
+    def i16x8_q15mulr_sat_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = (a.lanes(np.int16).astype(np.int32) * b.lanes(np.int16) + 0x4000) >> 15
+        self.stack.push(V128.from_lanes(np.clip(data, -0x8000, 0x7FFF).astype(np.int16)))
+
+    def i16x8_all_true(self):
+        a = self.stack.v128()
+        self.stack.push(I32.from_bool(bool(a.lanes(np.uint16).all())))
+
+    def i16x8_bitmask(self):
+        a = self.stack.v128()
+        self.stack.push(self.bitmask(a.lanes(np.int16)))
+
+    def i16x8_narrow_i32x4_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = np.concatenate([a.lanes(np.int32), b.lanes(np.int32)])
+        self.stack.push(V128.from_lanes(np.clip(data, -0x8000, 0x7FFF).astype(np.int16)))
+
+    def i16x8_narrow_i32x4_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = np.concatenate([a.lanes(np.int32), b.lanes(np.int32)])
+        self.stack.push(V128.from_lanes(np.clip(data, 0, 0xFFFF).astype(np.uint16)))
+
+    def i16x8_extend_low_i8x16_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int8)[:8].astype(np.int16)))
+
+    def i16x8_extend_high_i8x16_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int8)[8:].astype(np.int16)))
+
+    def i16x8_extend_low_i8x16_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint8)[:8].astype(np.uint16)))
+
+    def i16x8_extend_high_i8x16_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint8)[8:].astype(np.uint16)))
+
+    def i16x8_shl(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16) << (int(b) % 16)))
+
+    def i16x8_shr_s(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int16) >> (int(b) % 16)))
+
+    def i16x8_shr_u(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16) >> (int(b) % 16)))
+
+    def i16x8_add(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16) + b.lanes(np.uint16)))
+
+    def i16x8_add_sat_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.int16).astype(np.int32) + b.lanes(np.int16)
+        self.stack.push(V128.from_lanes(np.clip(data, -0x8000, 0x7FFF).astype(np.int16)))
+
+    def i16x8_add_sat_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.uint16).astype(np.uint32) + b.lanes(np.uint16)
+        self.stack.push(V128.from_lanes(np.minimum(data, 0xFFFF).astype(np.uint16)))
+
+    def i16x8_sub(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16) - b.lanes(np.uint16)))
+
+    def i16x8_sub_sat_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.int16).astype(np.int32) - b.lanes(np.int16)
+        self.stack.push(V128.from_lanes(np.clip(data, -0x8000, 0x7FFF).astype(np.int16)))
+
+    def i16x8_sub_sat_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.uint16).astype(np.int32) - b.lanes(np.uint16)
+        self.stack.push(V128.from_lanes(np.clip(data, 0, 0xFFFF).astype(np.uint16)))
+
+    def i16x8_mul(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16) * b.lanes(np.uint16)))
+
+    def i16x8_min_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.minimum(a.lanes(np.int16), b.lanes(np.int16))))
+
+    def i16x8_min_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.minimum(a.lanes(np.uint16), b.lanes(np.uint16))))
+
+    def i16x8_max_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.maximum(a.lanes(np.int16), b.lanes(np.int16))))
+
+    def i16x8_max_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.maximum(a.lanes(np.uint16), b.lanes(np.uint16))))
+
+    def i16x8_avgr_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = (a.lanes(np.uint16).astype(np.uint32) + b.lanes(np.uint16) + 1) >> 1
+        self.stack.push(V128.from_lanes(data.astype(np.uint16)))
+
+    def i16x8_extmul_low_i8x16_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int8)[:8].astype(np.int16) * b.lanes(np.int8)[:8]))
+
+    def i16x8_extmul_high_i8x16_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int8)[8:].astype(np.int16) * b.lanes(np.int8)[8:]))
+
+    def i16x8_extmul_low_i8x16_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint8)[:8].astype(np.uint16) * b.lanes(np.uint8)[:8]))
+
+    def i16x8_extmul_high_i8x16_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint8)[8:].astype(np.uint16) * b.lanes(np.uint8)[8:]))
+
+    def i32x4_abs(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.abs(a.lanes(np.int32))))
+
+    def i32x4_neg(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(-a.lanes(np.int32)))
+
+    def i32x4_all_true(self):
+        a = self.stack.v128()
+        self.stack.push(I32.from_bool(bool(a.lanes(np.uint32).all())))
+
+    def i32x4_bitmask(self):
+        a = self.stack.v128()
+        self.stack.push(self.bitmask(a.lanes(np.int32)))
+
+    def i32x4_extend_low_i16x8_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int16)[:4].astype(np.int32)))
+
+    def i32x4_extend_high_i16x8_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int16)[4:].astype(np.int32)))
+
+    def i32x4_extend_low_i16x8_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16)[:4].astype(np.uint32)))
+
+    def i32x4_extend_high_i16x8_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16)[4:].astype(np.uint32)))
+
+    def i32x4_shl(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32) << (int(b) % 32)))
+
+    def i32x4_shr_s(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int32) >> (int(b) % 32)))
+
+    def i32x4_shr_u(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32) >> (int(b) % 32)))
+
+    def i32x4_add(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32) + b.lanes(np.uint32)))
+
+    def i32x4_sub(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32) - b.lanes(np.uint32)))
+
+    def i32x4_mul(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32) * b.lanes(np.uint32)))
+
+    def i32x4_min_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.minimum(a.lanes(np.int32), b.lanes(np.int32))))
+
+    def i32x4_min_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.minimum(a.lanes(np.uint32), b.lanes(np.uint32))))
+
+    def i32x4_max_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.maximum(a.lanes(np.int32), b.lanes(np.int32))))
+
+    def i32x4_max_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(np.maximum(a.lanes(np.uint32), b.lanes(np.uint32))))
+
+    def i32x4_dot_i16x8_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        data = a.lanes(np.int16).astype(np.int64) * b.lanes(np.int16)
+        self.stack.push(V128.from_lanes((data[0::2] + data[1::2]).astype(np.int32)))
+
+    def i32x4_extmul_low_i16x8_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int16)[:4].astype(np.int32) * b.lanes(np.int16)[:4]))
+
+    def i32x4_extmul_high_i16x8_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int16)[4:].astype(np.int32) * b.lanes(np.int16)[4:]))
+
+    def i32x4_extmul_low_i16x8_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16)[:4].astype(np.uint32) * b.lanes(np.uint16)[:4]))
+
+    def i32x4_extmul_high_i16x8_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint16)[4:].astype(np.uint32) * b.lanes(np.uint16)[4:]))
+
+    def i64x2_abs(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.abs(a.lanes(np.int64))))
+
+    def i64x2_neg(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(-a.lanes(np.int64)))
+
+    def i64x2_all_true(self):
+        a = self.stack.v128()
+        self.stack.push(I32.from_bool(bool(a.lanes(np.uint64).all())))
+
+    def i64x2_bitmask(self):
+        a = self.stack.v128()
+        self.stack.push(self.bitmask(a.lanes(np.int64)))
+
+    def i64x2_extend_low_i32x4_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int32)[:2].astype(np.int64)))
+
+    def i64x2_extend_high_i32x4_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int32)[2:].astype(np.int64)))
+
+    def i64x2_extend_low_i32x4_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32)[:2].astype(np.uint64)))
+
+    def i64x2_extend_high_i32x4_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32)[2:].astype(np.uint64)))
+
+    def i64x2_shl(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint64) << (int(b) % 64)))
+
+    def i64x2_shr_s(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int64) >> (int(b) % 64)))
+
+    def i64x2_shr_u(self):
+        b, a = self.stack.i32(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint64) >> (int(b) % 64)))
+
+    def i64x2_add(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint64) + b.lanes(np.uint64)))
+
+    def i64x2_sub(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint64) - b.lanes(np.uint64)))
+
+    def i64x2_mul(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint64) * b.lanes(np.uint64)))
+
+    def i64x2_extmul_low_i32x4_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int32)[:2].astype(np.int64) * b.lanes(np.int32)[:2]))
+
+    def i64x2_extmul_high_i32x4_s(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int32)[2:].astype(np.int64) * b.lanes(np.int32)[2:]))
+
+    def i64x2_extmul_low_i32x4_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32)[:2].astype(np.uint64) * b.lanes(np.uint32)[:2]))
+
+    def i64x2_extmul_high_i32x4_u(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32)[2:].astype(np.uint64) * b.lanes(np.uint32)[2:]))
+
+    # Vector Floating-Point Instructions
+
+    def f32x4_ceil(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.ceil(a.lanes(np.float32))))
+
+    def f32x4_floor(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.floor(a.lanes(np.float32))))
+
+    def f32x4_trunc(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.trunc(a.lanes(np.float32))))
+
+    def f32x4_nearest(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.rint(a.lanes(np.float32))))
+
+    def f64x2_ceil(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.ceil(a.lanes(np.float64))))
+
+    def f64x2_floor(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.floor(a.lanes(np.float64))))
+
+    def f64x2_trunc(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.trunc(a.lanes(np.float64))))
+
+    def f64x2_nearest(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.rint(a.lanes(np.float64))))
+
+    def f32x4_abs(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32) & np.uint32(0x7FFFFFFF)))
+
+    def f32x4_neg(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32) ^ np.uint32(0x80000000)))
+
+    def f32x4_sqrt(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.sqrt(a.lanes(np.float32))))
+
+    def f32x4_add(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float32) + b.lanes(np.float32)))
+
+    def f32x4_sub(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float32) - b.lanes(np.float32)))
+
+    def f32x4_mul(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float32) * b.lanes(np.float32)))
+
+    def f32x4_div(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float32) / b.lanes(np.float32)))
+
+    def f32x4_min(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(self.float_min(a.lanes(np.float32), b.lanes(np.float32))))
+
+    def f32x4_max(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(self.float_max(a.lanes(np.float32), b.lanes(np.float32))))
+
+    def f32x4_pmin(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        sa, sb = a.lanes(np.float32), b.lanes(np.float32)
+        self.stack.push(V128.from_lanes(np.where(sb < sa, sb, sa)))
+
+    def f32x4_pmax(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        sa, sb = a.lanes(np.float32), b.lanes(np.float32)
+        self.stack.push(V128.from_lanes(np.where(sa < sb, sb, sa)))
+
+    def f64x2_abs(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint64) & np.uint64(0x7FFFFFFFFFFFFFFF)))
+
+    def f64x2_neg(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint64) ^ np.uint64(0x8000000000000000)))
+
+    def f64x2_sqrt(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(np.sqrt(a.lanes(np.float64))))
+
+    def f64x2_add(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float64) + b.lanes(np.float64)))
+
+    def f64x2_sub(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float64) - b.lanes(np.float64)))
+
+    def f64x2_mul(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float64) * b.lanes(np.float64)))
+
+    def f64x2_div(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float64) / b.lanes(np.float64)))
+
+    def f64x2_min(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(self.float_min(a.lanes(np.float64), b.lanes(np.float64))))
+
+    def f64x2_max(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        self.stack.push(V128.from_lanes(self.float_max(a.lanes(np.float64), b.lanes(np.float64))))
+
+    def f64x2_pmin(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        sa, sb = a.lanes(np.float64), b.lanes(np.float64)
+        self.stack.push(V128.from_lanes(np.where(sb < sa, sb, sa)))
+
+    def f64x2_pmax(self):
+        b, a = self.stack.v128(), self.stack.v128()
+        sa, sb = a.lanes(np.float64), b.lanes(np.float64)
+        self.stack.push(V128.from_lanes(np.where(sa < sb, sb, sa)))
+
+    # Vector Conversion Instructions
+
+    def f32x4_demote_f64x2_zero(self):
+        a = self.stack.v128()
+        data = a.lanes(np.float64).astype(np.float32)
+        self.stack.push(V128.from_lanes(np.concatenate([data, np.zeros(2, dtype=np.float32)])))
+
+    def f64x2_promote_low_f32x4(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.float32)[:2].astype(np.float64)))
+
+    def i32x4_trunc_sat_f32x4_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(self.trunc_sat(a.lanes(np.float32), np.int32)))
+
+    def i32x4_trunc_sat_f32x4_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(self.trunc_sat(a.lanes(np.float32), np.uint32)))
+
+    def f32x4_convert_i32x4_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int32).astype(np.float32)))
+
+    def f32x4_convert_i32x4_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32).astype(np.float32)))
+
+    def i32x4_trunc_sat_f64x2_s_zero(self):
+        a = self.stack.v128()
+        data = self.trunc_sat(a.lanes(np.float64), np.int32)
+        self.stack.push(V128.from_lanes(np.concatenate([data, np.zeros(2, dtype=np.int32)])))
+
+    def i32x4_trunc_sat_f64x2_u_zero(self):
+        a = self.stack.v128()
+        data = self.trunc_sat(a.lanes(np.float64), np.uint32)
+        self.stack.push(V128.from_lanes(np.concatenate([data, np.zeros(2, dtype=np.uint32)])))
+
+    def f64x2_convert_low_i32x4_s(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.int32)[:2].astype(np.float64)))
+
+    def f64x2_convert_low_i32x4_u(self):
+        a = self.stack.v128()
+        self.stack.push(V128.from_lanes(a.lanes(np.uint32)[:2].astype(np.float64)))
@@ -1,14 +1,12 @@
-from typing import TypeVar
-
 from src.wasm.type.base import AnyType
 from src.wasm.type.numeric.numpy.float import F32, F64
 from src.wasm.type.numeric.numpy.int import I32, I64
+from src.wasm.type.numeric.numpy.v128 import V128
 from src.wasm.type.ref.base import RefType
 
 
 class NumericStack:
     value: list[AnyType]
-    T = TypeVar("T", bound=AnyType)
 
     def __init__(self, value: list[AnyType]):
         self.value = value
@@ -32,29 +30,29 @@ class NumericStack:
     def __len__(self):
         return len(self.value)
 
-    def __pop(self, value: type[T], read_only=False, key=-1) -> T:
-        item = self.any(read_only, key)
-        if not isinstance(item, value):
-            raise Exception("invalid type")
-        return item
+    # 検証済みのコードでは型が保証されているため、型を確認せずに取り出す
+    # 型の確認は `NumericStackDebug` で行う
 
     def bool(self, read_only=False, key=-1) -> bool:
-        return bool(self.__pop(I32, read_only, key))
+        return bool((self.value[key] if read_only else self.value.pop()).value)
 
     def int(self, read_only=False, key=-1) -> int:
-        return int(self.__pop(I32, read_only, key))
+        return int((self.value[key] if read_only else self.value.pop()).value)
 
     def i32(self, read_only=False, key=-1) -> I32:
-        return self.__pop(I32, read_only, key)
+        return self.value[key] if read_only else self.value.pop()  # type: ignore
 
     def i64(self, read_only=False, key=-1) -> I64:
-        return self.__pop(I64, read_only, key)
+        return self.value[key] if read_only else self.value.pop()  # type: ignore
 
     def f32(self, read_only=False, key=-1) -> F32:
-        return self.__pop(F32, read_only, key)
+        return self.value[key] if read_only else self.value.pop()  # type: ignore
 
     def f64(self, read_only=False, key=-1) -> F64:
-        return self.__pop(F64, read_only, key)
+        return self.value[key] if read_only else self.value.pop()  # type: ignore
+
+    def v128(self, read_only=False, key=-1) -> V128:
+        return self.value[key] if read_only else self.value.pop()  # type: ignore
 
     def ref(self, read_only=False, key=-1) -> RefType:
-        return self.__pop(RefType, read_only, key)
+        return self.value[key] if read_only else self.value.pop()  # type: ignore
@@ -1,11 +1,20 @@
+import codecs
+import errno
+import heapq
+import inspect
 import io
 import logging
+import mmap
+import os
 import random
+import select
+import selectors
 import socket as sk
+import stat
 import sys
 import time
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, TextIO, Union
 
 import numpy as np
 
@@ -14,47 +23,167 @@ from src.wasm.optimizer.optimizer import WasmOptimizer
 from src.wasm.optimizer.struct import CodeSectionOptimize, TypeSectionOptimize, WasmSectionsOptimize
 from src.wasm.runtime.exec import WasmExec
 from src.wasm.runtime.export import WasmExport, WasmExportFunction
-from src.wasm.runtime.screen.screen import Screen
 from src.wasm.type.base import AnyType
+from src.wasm.type.bytes.numpy.base import NumpyBytesType
 from src.wasm.type.numeric.base import NumericType
-from src.wasm.type.numeric.numpy.int import I8, I32, I64
+from src.wasm.type.numeric.numpy.int import I8, I32, I64, UnsignedIntType
+
+if TYPE_CHECKING:
+    # 画面出力は pygame を使うため、型チェックの時だけ読み込む
+    from src.wasm.runtime.screen.screen import Screen
 
 
 class WasiResult:
     SUCCESS = (I32.from_int(0),)
+    ACCES = (I32.from_int(2),)
+    AGAIN = (I32.from_int(6),)
     BADF = (I32.from_int(8),)
+    EXIST = (I32.from_int(20),)
+    FAULT = (I32.from_int(21),)
     INVAL = (I32.from_int(28),)
+    IO = (I32.from_int(29),)
+    ISDIR = (I32.from_int(31),)
+    LOOP = (I32.from_int(32),)
     NOENT = (I32.from_int(44),)
+    NOTDIR = (I32.from_int(54),)
+    NOTCAPABLE = (I32.from_int(76),)
+
+    @classmethod
+    def from_error(cls, e: OSError) -> tuple[I32]:
+        """ホストの OSError を WASI のエラーにする"""
+        return {
+            errno.EACCES: cls.ACCES,
+            errno.EAGAIN: cls.AGAIN,
+            errno.EWOULDBLOCK: cls.AGAIN,
+            errno.EPERM: cls.ACCES,
+            errno.EEXIST: cls.EXIST,
+            errno.EISDIR: cls.ISDIR,
+            errno.ELOOP: cls.LOOP,
+            errno.ENOENT: cls.NOENT,
+            errno.ENOTDIR: cls.NOTDIR,
+        }.get(e.errno or 0, cls.IO)
 
 
 class FileType:
+    UNKNOWN = 0
     DIR = 3
     REG = 4
+    SYMLINK = 7
+
+    @classmethod
+    def from_mode(cls, mode: int) -> int:
+        """`os.stat` の st_mode からファイルの種類を返す"""
+        if stat.S_ISDIR(mode):
+            return cls.DIR
+        if stat.S_ISREG(mode):
+            return cls.REG
+        if stat.S_ISLNK(mode):
+            return cls.SYMLINK
+        return cls.UNKNOWN
+
+
+class LookupFlags:
+    SYMLINK_FOLLOW = 1
+
+
+class OFlags:
+    CREAT = 1
+    DIRECTORY = 2
+    EXCL = 4
+    TRUNC = 8
+
+
+class Rights:
+    FD_WRITE = 1 << 6
+
+
+class FdFlags:
+    NONBLOCK = 4
+
+
+class Clock:
+    """clockid ごとの時計"""
+
+    REALTIME = 0
+    MONOTONIC = 1
+
+    NOW: dict[int, Callable[[], int]] = {
+        REALTIME: time.time_ns,
+        MONOTONIC: time.monotonic_ns,
+        2: time.process_time_ns,
+        3: time.thread_time_ns,
+    }
+
+
+class Poll:
+    """poll_oneoff の subscription と event の構造"""
+
+    CLOCK = 0
+    FD_READ = 1
+    FD_WRITE = 2
+    ABSTIME = 1
+
+    # fd の購読では id の位置に fd が入る
+    SUBSCRIPTION = np.dtype(
+        {
+            "names": ["userdata", "tag", "id", "timeout", "flags"],
+            "formats": ["<u8", "u1", "<u4", "<u8", "<u2"],
+            "offsets": [0, 8, 16, 24, 40],
+            "itemsize": 48,
+        }
+    )
+    EVENT = np.dtype(
+        {
+            "names": ["userdata", "error", "type"],
+            "formats": ["<u8", "<u2", "u1"],
+            "offsets": [0, 8, 10],
+            "itemsize": 32,
+        }
+    )
+
+    @staticmethod
+    def mask(tag: int) -> int:
+        """fd の購読の種類に対応する selectors のイベント"""
+        return selectors.EVENT_READ if tag == Poll.FD_READ else selectors.EVENT_WRITE
 
 
 class WasiExportHelperUtil:
     logger = NestedLogger(logging.getLogger(__name__))
 
     @classmethod
-    def export(cls, ins: "WasiBase", namespace: str) -> list[WasmExport]:
-        value = ins.__class__.__dict__.values()
+    def export(cls, ins: "WasiBase", namespace: str, log: bool = __debug__) -> list[WasmExport]:
+        """インスタンスのメソッドをホスト関数としてエクスポートする
+
+        継承したメソッドも含める。`init`、`_` で始まるメソッド、コルーチンはエクスポートしない。
+        `log` が真の場合は fd_write 以外の呼び出しをログに出力する。
+        `signature` で型を宣言したメソッドは、Python の int/float で引数と戻り値を受け渡す。
+        """
+        methods: dict[str, Callable] = {}
+        for klass in reversed(ins.__class__.__mro__):
+            methods.update(klass.__dict__)
         data: list[WasmExport] = []
-        for v in value:
-            if isinstance(v, Callable) and v.__name__ != "init":
-                ignore = ["return"]
-                annotations: list[type[NumericType]] = [v for k, v in v.__annotations__.items() if k not in ignore]
-                ret = [v for k, v in v.__annotations__.items() if k == "return"]
-
-                returns: list[type[NumericType]] = ret[0].__args__ if ret else []
-
-                def call(args: list[AnyType], ins=ins, name=v.__name__, annotations=annotations):
-                    if name != "fd_write":
-                        WasiExportHelperUtil.logger.debug(f"call: {name}")
-                    args_int = [
-                        x if issubclass(annotations[i], NumericType) else annotations[i](x) for i, x in enumerate(args)
-                    ]
-
-                    return getattr(ins, name)(*args_int) or []
+        for v in methods.values():
+            if (
+                isinstance(v, Callable)
+                and v.__name__ != "init"
+                and not v.__name__.startswith("_")
+                and not inspect.iscoroutinefunction(v)
+            ):
+                signature: Optional[tuple[tuple[type[NumericType], ...], tuple[type[NumericType], ...]]]
+                signature = getattr(v, "wasm_signature", None)
+                if signature is not None:
+                    annotations, returns = list(signature[0]), list(signature[1])
+                    call = cls.bind_raw(getattr(ins, v.__name__), signature[1], log=log)
+                else:
+                    ignore = ["return"]
+                    annotations = [v for k, v in v.__annotations__.items() if k not in ignore]
+                    ret = [v for k, v in v.__annotations__.items() if k == "return"]
+
+                    returns = ret[0].__args__ if ret else []
+
+                    # 引数の変換 (NumericType はそのまま渡すため None) とメソッドは事前に決めておく
+                    converters = tuple(None if issubclass(x, NumericType) else x for x in annotations)
+                    call = cls.bind(getattr(ins, v.__name__), converters, log=log and v.__name__ != "fd_write")
 
                 data.append(
                     WasmExport(
@@ -79,6 +208,90 @@ class WasiExportHelperUtil:
 
         return data
 
+    @classmethod
+    def bind(
+        cls, method: Callable, converters: tuple[Optional[Callable[[AnyType], Any]], ...], log: bool
+    ) -> Callable[[list[AnyType]], list[AnyType]]:
+        """ホスト関数の呼び出しを生成する。よくある引数の型の組み合わせは変換を省略する"""
+        if all(x is None for x in converters):
+
+            def call(args: list[AnyType]):
+                return method(*args) or []
+
+        elif all(x is int for x in converters):
+
+            def call(args: list[AnyType]):
+                return method(*map(int, args)) or []
+
+        else:
+
+            def call(args: list[AnyType]):
+                return method(*[x if c is None else c(x) for c, x in zip(converters, args)]) or []
+
+        return cls.logged(call, method.__name__) if log else call
+
+    @staticmethod
+    def signature(params: Sequence[type[NumericType]], results: Sequence[type[NumericType]] = ()):
+        """ホスト関数の Wasm の型を宣言するデコレータ
+
+        宣言した関数は引数を Python の int (符号なし) か float で受け取り、戻り値を int/float で返す。
+        戻り値が複数の場合はタプル、無い場合は None を返す。int の戻り値は型のビット幅に切り詰める。
+
+            @WasiExportHelperUtil.signature([I32, I32], [I32])
+            def add(self, a, b):
+                return a + b
+        """
+
+        def decorator(func: Callable):
+            func.wasm_signature = (tuple(params), tuple(results))  # type: ignore
+            return func
+
+        return decorator
+
+    @classmethod
+    def bind_raw(
+        cls, method: Callable, results: Sequence[type[NumericType]], log: bool
+    ) -> Callable[[list[AnyType]], list[AnyType]]:
+        """`signature` で宣言したホスト関数の呼び出しを生成する"""
+
+        def to_wasm(t: type[NumericType]) -> Callable[[Any], AnyType]:
+            if issubclass(t, UnsignedIntType):
+                mask = (1 << t.get_length()) - 1
+                return lambda x: t.from_int(x & mask)
+            return t.from_int
+
+        converters = [to_wasm(x) for x in results]
+        if len(converters) == 0:
+
+            def call(args: list[AnyType]):
+                method(*[x.value.item() for x in args])
+                return []
+
+        elif len(converters) == 1:
+            convert = converters[0]
+
+            def call(args: list[AnyType]):
+                return [convert(method(*[x.value.item() for x in args]))]
+
+        else:
+
+            def call(args: list[AnyType]):
+                return [c(x) for c, x in zip(converters, method(*[x.value.item() for x in args]))]
+
+        return cls.logged(call, method.__name__) if log else call
+
+    @classmethod
+    def logged(
+        cls, call: Callable[[list[AnyType]], list[AnyType]], name: str
+    ) -> Callable[[list[AnyType]], list[AnyType]]:
+        """呼び出しをログに出力するようにする"""
+
+        def call_log(args: list[AnyType]):
+            cls.logger.debug(f"call: {name}")
+            return call(args)
+
+        return call_log
+
     @classmethod
     def dummy(cls, opt: WasmSectionsOptimize) -> list[WasmExport]:
         data: list[WasmExport] = []
@@ -102,9 +315,117 @@ class WasiExportHelperUtil:
         raise Exception("not implemented wasi function: " + name)
 
 
-def stdout_write(data: bytes):
-    sys.stdout.write(data.decode())
-    sys.stdout.flush()
+class CallbackWriter(io.RawIOBase):
+    """書き込んだバイト列をコールバックに渡すファイル。`io.BufferedWriter` と組み合わせて使う"""
+
+    def __init__(self, callback: Callable[[bytes], None]):
+        self.callback = callback
+
+    def writable(self):
+        return True
+
+    def write(self, b) -> int:
+        self.callback(bytes(b))
+        return len(b)
+
+
+def iovec(memory: NumpyBytesType, iovs: int, iovs_len: int) -> Optional[list[memoryview]]:
+    """iovec の配列をまとめて読み込み、指している線形メモリの範囲をコピーせずに返す。メモリの外を指す場合は None"""
+    end = len(memory.value)
+    if iovs + 8 * iovs_len > end:
+        return None
+    vec = memory[iovs : iovs + 8 * iovs_len].view("<u4").reshape(-1, 2).tolist()
+    if any(off + size > end for off, size in vec):
+        return None
+    view = memoryview(memory.value)
+    return [view[off : off + size] for off, size in vec]
+
+
+def sock_recv_into(socket: sk.socket, views: list[memoryview]) -> int:
+    """iovec にまとめて受信する。`recvmsg_into` が無い環境 (Windows) では1つずつ受信する
+
+    2つ目以降はすぐに読める場合だけ受信するため、受信できたデータがあればそれ以上は待たない。
+    """
+    if hasattr(socket, "recvmsg_into"):
+        return socket.recvmsg_into(views)[0]
+    total = 0
+    for view in views:
+        if total and not select.select([socket], [], [], 0)[0]:
+            break
+        size = socket.recv_into(view)
+        total += size
+        if size < len(view):
+            break
+    return total
+
+
+def sock_sendmsg(socket: sk.socket, views: list[memoryview]) -> int:
+    """iovec をまとめて送信する。`sendmsg` が無い環境 (Windows) では1つずつ送り、一部しか送れなければ止める"""
+    if hasattr(socket, "sendmsg"):
+        return socket.sendmsg(views)
+    total = 0
+    for view in views:
+        try:
+            size = socket.send(view)
+        except BlockingIOError:
+            if total == 0:
+                raise
+            break
+        total += size
+        if size < len(view):
+            break
+    return total
+
+
+def store_filestat(memory: NumpyBytesType, buf: int, type: int, size: int, st: Optional[os.stat_result] = None):
+    """filestat 構造体を書き込む。`st` が無い場合は種類とサイズ以外を仮の値にする"""
+    dev, ino, nlink = (st.st_dev, st.st_ino, st.st_nlink) if st else (1, 1, 1)
+    times = (st.st_atime_ns, st.st_mtime_ns, st.st_ctime_ns) if st else (0, 0, 0)
+    memory[buf : buf + 64] = 0
+    memory[buf : buf + 16] = np.array([dev, ino], dtype="<u8").view(np.uint8)
+    memory[buf + 16] = type
+    memory[buf + 24 : buf + 64] = np.array([nlink, size, *times], dtype="<u8").view(np.uint8)
+
+
+class MmapReader(io.BufferedIOBase):
+    """読み込み専用のファイルを mmap して読み込む"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = len(self.map) if size is None or size < 0 else min(self.pos + size, len(self.map))
+        data = self.map[self.pos : end]
+        self.pos = max(self.pos, end)
+        return data
+
+    def readinto(self, buffer) -> int:
+        size = max(min(len(buffer), len(self.map) - self.pos), 0)
+        with memoryview(self.map) as view:
+            buffer[:size] = view[self.pos : self.pos + size]
+        self.pos += size
+        return size
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = [0, self.pos, len(self.map)][whence]
+        self.pos = max(base + offset, 0)
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+    def close(self):
+        if not self.closed:
+            self.map.close()
+        super().close()
 
 
 @dataclass
@@ -116,32 +437,166 @@ class FSModel:
     buffer: Optional[io.BufferedIOBase] = None
     dirname: Optional[str] = None
     sock: Optional[sk.socket] = None
+    host: Optional[str] = None
+    mode: str = "rb"
 
 
 class FS:
-    files: dict[str, FSModel]
+    """パスとfdの両方から引けるファイルの表
 
-    def __init__(self) -> None:
-        self.files = {
-            "<stdin>": FSModel(fd=0, type=FileType.REG, write=stdout_write, exists=False),
-            "<stdout>": FSModel(fd=1, type=FileType.REG, write=stdout_write, exists=False),
-            "<stderr>": FSModel(fd=2, type=FileType.REG, write=stdout_write, exists=False),
-            "/": FSModel(fd=3, type=FileType.DIR, write=stdout_write, dirname="/", exists=False),
-        }
+    `files` はパスから、`fds` はfdからファイルを引く。どちらも `add` と `remove` で更新する。
+    `remove` で空いたfdは `next_fd` で小さい順に再利用する。
+
+    `preopen` でホストのディレクトリを公開すると、その下のファイルは `path_open` で開かれ、初めて読み書きする時に
+    OSのファイルを開く。`mmap_size` 以上の読み込み専用のファイルは mmap する。
 
-    def next_fd(self):
-        return len(self.files) + 1
+    標準入出力にはバイナリのファイルか、コールバック (出力のみ) を指定できる。省略した場合はホストの標準入出力を使う。
+    出力はバッファリングし、`flush` (proc_exit やゲストが入力を待つ時、`close` で呼ばれる) でまとめて書き出す。
+    """
+
+    files: dict[str, FSModel]
+    fds: dict[int, FSModel]
+
+    def __init__(
+        self,
+        mmap_size: Optional[int] = None,
+        stdin: Optional[io.IOBase] = None,
+        stdout: Union[io.IOBase, Callable[[bytes], None], None] = None,
+        stderr: Union[io.IOBase, Callable[[bytes], None], None] = None,
+    ) -> None:
+        self.mmap_size = mmap_size
+        self.files = {}
+        self.fds = {}
+        self.paths: dict[int, str] = {}
+        self.free_fds: list[int] = []
+        self.end_fd = 0
+
+        self.sinks = [self.sink(stdout, sys.stdout), self.sink(stderr, sys.stderr)]
+        stdin = stdin or getattr(sys.stdin, "buffer", None)
+        self.add("<stdin>", FSModel(fd=0, type=FileType.REG, buffer=stdin, exists=False))  # type: ignore
+        self.add("<stdout>", FSModel(fd=1, type=FileType.REG, buffer=self.sinks[0], exists=False))
+        self.add("<stderr>", FSModel(fd=2, type=FileType.REG, buffer=self.sinks[1], exists=False))
+        self.add("/", FSModel(fd=3, type=FileType.DIR, dirname="/", exists=False))
+
+    @staticmethod
+    def sink(target: Union[io.IOBase, Callable[[bytes], None], None], default: TextIO) -> io.BufferedIOBase:
+        """出力先をバッファリングするバイナリのファイルにする。テキストのストリームには UTF-8 として書き込む"""
+        if target is None:
+            if hasattr(default, "buffer"):
+                return default.buffer  # type: ignore
+            target = default  # type: ignore
+        if target is default or isinstance(target, io.TextIOBase):
+            # テキストしか書き込めない場合は、マルチバイト文字の途中で区切られても良いように少しずつデコードする
+            text: TextIO = target  # type: ignore
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+            def write(b: bytes):
+                text.write(decoder.decode(b))
+
+            target = write
+        if isinstance(target, io.RawIOBase):
+            # FileIO やパイプは書き込みごとにシステムコールになるため、バッファリングする
+            return io.BufferedWriter(target)
+        if isinstance(target, io.IOBase):
+            return target  # type: ignore
+        return io.BufferedWriter(CallbackWriter(target))  # type: ignore
+
+    def flush(self):
+        """標準出力と標準エラー出力を書き出す"""
+        for sink in self.sinks:
+            if not sink.closed:
+                sink.flush()
+
+    def close(self):
+        """出力を書き出し、ホストのファイルを閉じる"""
+        self.flush()
+        for fd in [fd for fd, f in self.fds.items() if f.host is not None and f.buffer is not None]:
+            self.remove(fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def size(self, f: FSModel) -> int:
+        """マウントしたファイルのサイズを返す。シークできない場合は 0"""
+        fh = f.buffer
+        if fh is None or not fh.seekable():
+            return 0
+        cur = fh.tell()
+        size = fh.seek(0, 2)
+        fh.seek(cur, 0)
+        return size
+
+    def next_fd(self) -> int:
+        """使われていない最小のfdを返す"""
+        while self.free_fds and self.free_fds[0] in self.fds:
+            heapq.heappop(self.free_fds)
+        if self.free_fds:
+            return self.free_fds[0]
+        while self.end_fd in self.fds:
+            self.end_fd += 1
+        return self.end_fd
 
     def mount(self, path: str, file: io.BufferedIOBase, fd: Optional[int] = None, exists: bool = True):
-        new_fd = fd or self.next_fd()
-        self.files[path] = FSModel(fd=new_fd, type=FileType.REG, buffer=file, exists=exists)
+        new_fd = self.next_fd() if fd is None else fd
+        self.add(path, FSModel(fd=new_fd, type=FileType.REG, buffer=file, exists=exists))
+
+    def preopen(self, path: str, host: str, fd: Optional[int] = None):
+        """ホストのディレクトリを `path` として公開する
+
+        wasi-libc は fd 3 から BADF が返るまで順に preopen を探すため、`mount` より先に呼び出す。
+        """
+        new_fd = self.next_fd() if fd is None else fd
+        model = FSModel(fd=new_fd, type=FileType.DIR, dirname=path, host=os.path.realpath(host), exists=True)
+        self.add(path, model)
+
+    def resolve(self, dirfd: int, path: str, follow: bool = True) -> Optional[str]:
+        """preopen したディレクトリからの相対パスをホストのパスにする。ディレクトリの外を指す場合は None
+
+        シンボリックリンクを解決してから確認する。`follow` が偽の場合、最後の要素のリンクは解決しない。
+        """
+        d = self.fds.get(dirfd)
+        if d is None or d.type != FileType.DIR or d.host is None:
+            return None
+        host = os.path.normpath(os.path.join(d.host, path))
+        if host == d.host:
+            return host
+        if follow:
+            host = os.path.realpath(host)
+        else:
+            host = os.path.join(os.path.realpath(os.path.dirname(host)), os.path.basename(host))
+        if os.path.commonpath([host, d.host]) != d.host:
+            return None
+        return host
+
+    def open(self, f: FSModel) -> Optional[io.BufferedIOBase]:
+        """ファイルを返す。ホストのファイルはここで初めて開く"""
+        if f.buffer is None and f.host is not None and f.type == FileType.REG:
+            if f.mode == "rb" and self.mmap_size is not None and os.path.getsize(f.host) >= max(self.mmap_size, 1):
+                f.buffer = MmapReader(f.host)
+            else:
+                f.buffer = open(f.host, f.mode)  # type: ignore
+        return f.buffer
 
     def add(self, name: str, n: FSModel):
+        if name in self.files:
+            self.remove(self.files[name].fd)
+        if n.fd in self.fds:
+            self.remove(n.fd)
         self.files[name] = n
+        self.fds[n.fd] = n
+        self.paths[n.fd] = name
 
-    @property
-    def fds(self):
-        return {v.fd: v for (k, v) in self.files.items()}
+    def remove(self, fd: int):
+        """fdを閉じて、再利用できるようにする"""
+        f = self.fds[fd]
+        if f.host is not None and f.buffer is not None:
+            f.buffer.close()
+        del self.files[self.paths.pop(fd)]
+        del self.fds[fd]
+        heapq.heappush(self.free_fds, fd)
 
 
 class WasiBase:
@@ -152,27 +607,42 @@ class WasiBase:
 
 
 class Wasi(WasiBase):
+    """wasi_snapshot_preview1 の実装
+
+    出力はバッファリングするため、`with` で実行して終了時に書き出す。
+    `_start` は終了コードが 0 の場合 proc_exit を呼ばずに戻るため、書き出さないと出力が失われることがある。
+    """
+
     fs: FS
-    screen: Optional[Screen]
+    screen: Optional["Screen"]
     environ: dict[str, str]
 
     def init(
         self,
         exec: WasmExec,
         fs: Optional[FS] = None,
-        screen: Optional[Screen] = None,
+        screen: Optional["Screen"] = None,
         environ: Optional[dict[str, str]] = None,
+        seed: Optional[int] = None,
     ):
         self.exec = exec
         self.fs = fs or FS()
         self.screen = screen
         self.environ = environ or {}
+        # seed を指定すると random_get は再現できる疑似乱数を返す
+        self.random = None if seed is None else random.Random(seed)
         if screen:
             self.screen = screen
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fs.close()
+
     def args_sizes_get(self, argc: int, buf_szv: int) -> tuple[I32]:
-        self.exec.memory[argc : argc + 4] = I32.from_int(3).to_bytes()[0:4]
-        self.exec.memory[buf_szv : buf_szv + 4] = I32.from_int(32).to_bytes()[0:4]
+        self.exec.memory.u32[argc] = 3
+        self.exec.memory.u32[buf_szv] = 32
         return WasiResult.SUCCESS
 
     def args_get(self, argv: int, buf: I32) -> tuple[I32]:
@@ -182,8 +652,8 @@ class Wasi(WasiBase):
         return WasiResult.SUCCESS
 
     def environ_sizes_get(self, envc: int, buf_sz: int) -> tuple[I32]:
-        self.exec.memory[envc : envc + 4] = I32.from_int(len(self.environ)).to_bytes()[0:4]
-        self.exec.memory[buf_sz : buf_sz + 4] = I32.from_int(32).to_bytes()[0:4]
+        self.exec.memory.u32[envc] = len(self.environ)
+        self.exec.memory.u32[buf_sz] = 32
 
         return WasiResult.SUCCESS
 
@@ -194,13 +664,13 @@ class Wasi(WasiBase):
         return WasiResult.SUCCESS
 
     def fd_prestat_get(self, fd: int, buf: int) -> tuple[I32]:
-        if fd != 3:
+        f = self.fs.fds.get(fd)
+        if f is None or f.dirname is None:
             return WasiResult.BADF
 
-        assert self.fs.fds[fd].dirname
-        name_len = len(self.fs.fds[fd].dirname or "")
-        self.exec.memory[buf : buf + 4] = I32.from_int(0).to_bytes()[0:4]
-        self.exec.memory[buf + 4 : buf + 8] = I32.from_int(name_len).to_bytes()[0:4]
+        name_len = len(f.dirname.encode())
+        self.exec.memory.u32[buf] = 0
+        self.exec.memory.u32[buf + 4] = name_len
 
         return WasiResult.SUCCESS
 
@@ -209,10 +679,10 @@ class Wasi(WasiBase):
             return WasiResult.BADF
 
         f = self.fs.fds[fd]
-        self.exec.memory[result : result + 1] = I32.from_int(f.type).to_bytes()[0:1]
-        self.exec.memory[result + 1 : result + 2] = I32.from_int(0).to_bytes()[0:1]
-        self.exec.memory[result + 2 : result + 10] = I64.from_int(I64.get_max()).to_bytes()[0:8]
-        self.exec.memory[result + 10 : result + 18] = I64.from_int(I64.get_max()).to_bytes()[0:8]
+        self.exec.memory.u8[result] = f.type
+        self.exec.memory.u8[result + 1] = 0
+        self.exec.memory.u64[result + 2] = I64.get_max()
+        self.exec.memory.u64[result + 10] = I64.get_max()
 
         return WasiResult.SUCCESS
 
@@ -224,29 +694,22 @@ class Wasi(WasiBase):
 
     def path_filestat_get(self, fd: int, flags: int, path: int, path_len: int, buff: int) -> tuple[I32]:
         path_str = self.exec.memory[path : path + path_len].tobytes().decode()
-        if path_str not in self.fs.files or not self.fs.files[path_str].exists:
+        if path_str not in self.fs.files:
+            follow = bool(flags & LookupFlags.SYMLINK_FOLLOW)
+            host = self.fs.resolve(fd, path_str, follow=follow)
+            if host is None:
+                return WasiResult.NOTCAPABLE if fd in self.fs.fds else WasiResult.BADF
+            try:
+                st = os.stat(host) if follow else os.lstat(host)
+            except FileNotFoundError:
+                return WasiResult.NOENT
+            store_filestat(self.exec.memory, buff, FileType.from_mode(st.st_mode), st.st_size, st)
+            return WasiResult.SUCCESS
+        if not self.fs.files[path_str].exists:
             return WasiResult.BADF
 
         f = self.fs.files[path_str]
-        # if "size" in f:
-        #     size = f["size"]
-        # elif "file" in f:
-        fh = f.buffer
-        assert fh
-        cur = fh.tell()
-        fh.seek(0, 2)
-        size = fh.tell()
-        fh.seek(cur, 0)
-
-        self.exec.memory[buff : buff + 8] = I64.from_int(1).to_bytes()[0:8]
-        self.exec.memory[buff + 8 : buff + 16] = I64.from_int(1).to_bytes()[0:8]
-        self.exec.memory[buff + 16 : buff + 17] = I32.from_int(f.type).to_bytes()[0:1]
-        self.exec.memory[buff + 17 : buff + 24] = I64.from_int(1).to_bytes()[0:7]
-        self.exec.memory[buff + 24 : buff + 32] = I64.from_int(size).to_bytes()[0:8]
-        self.exec.memory[buff + 32 : buff + 40] = I64.from_int(0).to_bytes()[0:8]
-        self.exec.memory[buff + 40 : buff + 48] = I64.from_int(0).to_bytes()[0:8]
-        self.exec.memory[buff + 48 : buff + 56] = I64.from_int(0).to_bytes()[0:8]
-
+        store_filestat(self.exec.memory, buff, f.type, self.fs.size(f))
         return WasiResult.SUCCESS
 
     def path_open(
@@ -263,12 +726,39 @@ class Wasi(WasiBase):
     ) -> tuple[I32]:
         path_name = self.exec.memory[path : path + path_len].tobytes().decode()
         if path_name not in self.fs.files.keys():
-            return WasiResult.NOENT
+            # preopen したホストのディレクトリから開く
+            host = self.fs.resolve(dirfd, path_name, follow=bool(dirflags & LookupFlags.SYMLINK_FOLLOW))
+            if host is None:
+                return WasiResult.NOTCAPABLE if dirfd in self.fs.fds else WasiResult.NOENT
+            if os.path.islink(host):
+                # O_NOFOLLOW と同じく、最後の要素がリンクの場合は開かない
+                return WasiResult.LOOP
+            if oflags & OFlags.CREAT and oflags & OFlags.EXCL and os.path.lexists(host):
+                return WasiResult.EXIST
+            # TRUNC だけでは作成しない
+            exists = os.path.exists(host)
+            if not exists and not oflags & OFlags.CREAT:
+                return WasiResult.NOENT
+            try:
+                if not exists or oflags & OFlags.TRUNC:
+                    open(host, "wb").close()
+            except OSError as e:
+                return WasiResult.from_error(e)
+
+            type = FileType.DIR if os.path.isdir(host) else FileType.REG
+            if oflags & OFlags.DIRECTORY and type != FileType.DIR:
+                return WasiResult.NOTDIR
+            writable = oflags & (OFlags.CREAT | OFlags.TRUNC) or fs_rights_base & Rights.FD_WRITE
+            new_fd = self.fs.next_fd()
+            mode = "r+b" if writable and type == FileType.REG else "rb"
+            self.fs.add(f"<fd:{new_fd}>", FSModel(fd=new_fd, type=type, host=host, mode=mode, exists=True))
+            self.exec.memory.u32[fd] = new_fd
+            return WasiResult.SUCCESS
         else:
             f = self.fs.files[path_name]
             f.exists = True
             fd_val = f.fd
-            self.exec.memory[fd : fd + 4] = I32.from_int(fd_val).to_bytes()[0:4]
+            self.exec.memory.u32[fd] = fd_val
 
             return WasiResult.SUCCESS
 
@@ -276,19 +766,33 @@ class Wasi(WasiBase):
         if fd not in self.fs.fds:
             return WasiResult.BADF
 
-        f = self.fs.fds[fd].buffer
+        try:
+            f = self.fs.open(self.fs.fds[fd])
+        except OSError as e:
+            return WasiResult.from_error(e)
         if not f:
             return WasiResult.INVAL
 
         f.seek(offset, whence)
         res = f.tell()
-        self.exec.memory[result : result + 8] = I64.from_int(res).to_bytes()[0:8]
+        self.exec.memory.u64[result] = res
         return WasiResult.SUCCESS
 
     def fd_close(self, fd: int):
         if fd not in self.fs.fds:
             return WasiResult.BADF
 
+        socket = self.fs.fds[fd].sock
+        if socket:
+            socket.close()
+            self.fs.remove(fd)
+            return WasiResult.SUCCESS
+
+        # ホストのファイルは閉じる
+        if self.fs.fds[fd].host is not None:
+            self.fs.remove(fd)
+            return WasiResult.SUCCESS
+
         f = self.fs.fds[fd].buffer
         if not f:
             return WasiResult.INVAL
@@ -297,89 +801,202 @@ class Wasi(WasiBase):
         return WasiResult.SUCCESS
 
     def fd_read(self, fd: int, iovs: int, iovs_len: int, nread: int):
-        data_sz = 0
-        for i in range(iovs_len):
-            iov = iovs + 8 * i
-            off = I32.from_bits(self.exec.memory[iov : iov + 4])
-            size = I32.from_bits(self.exec.memory[iov + 4 : iov + 8])
-            data_sz += int(size)
-
-        data: bytes
-        if fd in self.fs.fds:
-            b = self.fs.fds[fd]
-            if b.buffer:
-                data = b.buffer.read(data_sz)
-
-        # if not data:
-        #     return WasiResult.BADF
-
+        f = self.fs.fds.get(fd)
+        if f is None:
+            return WasiResult.BADF
+        views = iovec(self.exec.memory, iovs, iovs_len)
+        if views is None:
+            return WasiResult.FAULT
+        try:
+            buffer = self.fs.open(f)
+        except OSError as e:
+            return WasiResult.from_error(e)
+        if not buffer:
+            return WasiResult.INVAL
+        if fd == 0:
+            # 入力を待つ前に、プロンプトなどの出力を書き出す
+            self.fs.flush()
+
+        # 線形メモリに直接読み込む。足りない場合は残りの iovec を読まずに返す
+        # 標準入力はパイプや端末でも iovec が埋まるまで待たないように、届いている分だけ読む
+        interactive = fd == 0 and hasattr(buffer, "readinto1")
+        readinto = buffer.readinto1 if interactive else buffer.readinto
         total_size = 0
-        for i in range(iovs_len):
-            iov = iovs + 8 * i
-            max_space = int(I32.from_bits(self.exec.memory[iov + 4 : iov + 8]))
-            space = min(len(data) - total_size, max_space)
-            off = I32.from_bits(self.exec.memory[iov : iov + 4])
-            size = I32.from_int(space)
-            d = data[total_size : total_size + int(size)]
-            self.exec.memory.store(int(off), d)
-            total_size += len(d)
-
-        self.exec.memory[nread : nread + 4] = I32.from_int(total_size).to_bytes()[0:4]
+        try:
+            for view in views:
+                size = readinto(view) or 0
+                total_size += size
+                if size < len(view) or interactive:
+                    break
+        except io.UnsupportedOperation:
+            return WasiResult.BADF
+        except OSError as e:
+            return WasiResult.from_error(e)
+
+        self.exec.memory.u32[nread] = total_size
         return WasiResult.SUCCESS
 
     def fd_write(self, fd: int, iovs: int, iovs_len: int, nwritten: int) -> tuple[I32]:
-        data = b""
-        for i in range(iovs_len):
-            iov = iovs + 8 * i
-            off = I32.from_bits(self.exec.memory[iov : iov + 4])
-            size = I32.from_bits(self.exec.memory[iov + 4 : iov + 8])
-            data += self.exec.memory[int(off) : int(off) + int(size)].tobytes()
-
-        if fd not in self.fs.fds:
+        f = self.fs.fds.get(fd)
+        if f is None:
             return WasiResult.BADF
 
-        if self.fs.fds[fd].write:
-            self.fs.fds[fd].write(data)  # type: ignore
-        elif self.fs.fds[fd].buffer:
-            self.fs.fds[fd].buffer.write(data)  # type: ignore
-
-        self.exec.memory[nwritten : nwritten + 4] = I32.from_int(len(data)).to_bytes()[0:4]
-
-        if self.screen:
+        data = iovec(self.exec.memory, iovs, iovs_len)
+        if data is None:
+            return WasiResult.FAULT
+        if f.write:
+            f.write(data[0].tobytes() if len(data) == 1 else b"".join(data))
+        else:
+            try:
+                if self.fs.open(f):
+                    f.buffer.writelines(data)  # type: ignore
+            except io.UnsupportedOperation:
+                return WasiResult.BADF
+            except OSError as e:
+                return WasiResult.from_error(e)
+
+        self.exec.memory.u32[nwritten] = sum(len(x) for x in data)
+
+        # 画面の更新はフレームが書き込まれた時だけ行う
+        if self.screen and f.buffer is self.screen.f_scr:
             self.screen.update_screen()
 
         return WasiResult.SUCCESS
 
     def clock_time_get(self, clk_id: int, precision: int, result: int) -> tuple[I32]:
-        t = int(time.time_ns())
-        self.exec.memory[result : result + 8] = I64.from_int(t).to_bytes()[0:8]
+        if clk_id not in Clock.NOW:
+            return WasiResult.INVAL
+        self.exec.memory.u64[result] = Clock.NOW[clk_id]()
         return WasiResult.SUCCESS
 
     def proc_exit(self, a: int):
+        self.fs.flush()
         sys.exit(a)
 
-    def fd_filestat_get(self, a: I32, b: I32):
+    def fd_filestat_get(self, fd: int, buf: int):
+        f = self.fs.fds.get(fd)
+        if f is None:
+            return WasiResult.BADF
+
+        if f.host is not None:
+            try:
+                st = os.stat(f.host)
+            except OSError as e:
+                return WasiResult.from_error(e)
+            store_filestat(self.exec.memory, buf, FileType.from_mode(st.st_mode), st.st_size, st)
+        else:
+            store_filestat(self.exec.memory, buf, f.type, self.fs.size(f))
         return WasiResult.SUCCESS
 
-    # def poll_oneoff(self, in_ptr: int, out_ptr: int, n_subscriptions: int, n_events_ptr: int) -> tuple[I32]:
-    #     self.exec.memory[n_events_ptr : n_events_ptr + 4] = I32.from_int(1).to_bytes()[0:4]
-    #     self.exec.memory[out_ptr : out_ptr + 8] = I64.from_int(0).to_bytes()[0:8]
-    #     self.exec.memory[out_ptr + 8 : out_ptr + 10] = I16.from_int(0).to_bytes()[0:2]
-    #     self.exec.memory[out_ptr + 10 : out_ptr + 11] = I8.from_int(0).to_bytes()[0:1]
-    #     self.exec.memory[out_ptr + 11 : out_ptr + 19] = I64.from_int(1).to_bytes()[0:8]
-    #     self.exec.memory[out_ptr + 19 : out_ptr + 27] = I64.from_int(0).to_bytes()[0:8]
+    def fd_readdir(self, fd: int, buf: int, buf_len: int, cookie: int, bufused: int) -> tuple[I32]:
+        f = self.fs.fds.get(fd)
+        if f is None:
+            return WasiResult.BADF
+        if f.type != FileType.DIR or f.host is None:
+            return WasiResult.NOTDIR
+
+        # dirent (d_next: u64, d_ino: u64, d_namlen: u32, d_type: u8) と名前を cookie 番目から並べる
+        # preopen したディレクトリの ".." は、ホストの親ディレクトリを見せずに自身を指す
+        parent = f.host if f.dirname is not None else os.path.dirname(f.host)
+        entries = [(".", os.stat(f.host)), ("..", os.stat(parent))]
+        entries += [(x.name, x.stat(follow_symlinks=False)) for x in sorted(os.scandir(f.host), key=lambda x: x.name)]
+        data = bytearray()
+        for i, (name, st) in enumerate(entries[cookie:], start=cookie + 1):
+            name_bytes = name.encode()
+            data += np.array([i, st.st_ino], dtype="<u8").tobytes()
+            data += np.array([len(name_bytes), FileType.from_mode(st.st_mode)], dtype="<u4").tobytes()
+            data += name_bytes
+            if len(data) >= buf_len:
+                break
+
+        # 入り切らない場合は buf_len まで書き込み、続きがあることを示す
+        size = min(len(data), buf_len)
+        self.exec.memory[buf : buf + size] = np.frombuffer(data, dtype=np.uint8, count=size)
+        self.exec.memory.u32[bufused] = size
+        return WasiResult.SUCCESS
+
+    def poll_oneoff(self, in_ptr: int, out_ptr: int, n_subscriptions: int, n_events_ptr: int) -> tuple[I32]:
+        if n_subscriptions == 0:
+            return WasiResult.INVAL
+
+        subscriptions = self.exec.memory[in_ptr : in_ptr + Poll.SUBSCRIPTION.itemsize * n_subscriptions]
+        now = time.monotonic_ns()
+
+        # (userdata, error, type) の一覧。ソケット以外のfdは常に読み書きできるものとする
+        events: list[tuple[int, int, int]] = []
+        clocks: list[tuple[int, int]] = []
+        sockets: dict[sk.socket, list[tuple[int, int]]] = {}
+        for userdata, tag, id, timeout, flags in subscriptions.view(Poll.SUBSCRIPTION).tolist():
+            if tag == Poll.CLOCK:
+                if flags & Poll.ABSTIME:
+                    # 絶対時刻は clock_time_get と同じ時計で残り時間にする
+                    timeout -= Clock.NOW.get(id, time.monotonic_ns)()
+                clocks.append((userdata, now + timeout))
+            elif id not in self.fs.fds:
+                events.append((userdata, int(WasiResult.BADF[0]), tag))
+            elif self.fs.fds[id].sock is None:
+                events.append((userdata, 0, tag))
+            else:
+                sockets.setdefault(self.fs.fds[id].sock, []).append((userdata, tag))  # type: ignore
+
+        # 準備ができているものがあれば待たない
+        wait: Optional[float] = None
+        if events:
+            wait = 0
+        elif clocks:
+            wait = max(min(x[1] for x in clocks) - now, 0) / 1e9
+
+        if wait != 0:
+            self.fs.flush()
+
+        masks: dict[Any, int] = {}
+        for socket, subs in sockets.items():
+            for _, tag in subs:
+                masks[socket] = masks.get(socket, 0) | Poll.mask(tag)
+        for socket, mask in self._select(masks, wait).items():
+            events += [(userdata, 0, tag) for userdata, tag in sockets[socket] if mask & Poll.mask(tag)]
+
+        now = time.monotonic_ns()
+        events += [(userdata, 0, Poll.CLOCK) for userdata, deadline in clocks if deadline <= now]
+
+        self.exec.memory.store(out_ptr, np.array(events, dtype=Poll.EVENT).tobytes())
+        self.exec.memory.u32[n_events_ptr] = len(events)
+        return WasiResult.SUCCESS
 
-    #     return WasiResult.SUCCESS
+    def _select(self, files: dict[Any, int], wait: Optional[float]) -> dict[Any, int]:
+        """`files` のいずれかが読み書きできるか、`wait` 秒経つまで待つ。`wait` が None の場合は時間制限なし
+
+        `files` はファイルオブジェクトと `selectors.EVENT_READ`/`EVENT_WRITE` の組で、
+        読み書きできるものと、そのイベントを返す
+        """
+        if not files:
+            if wait:
+                time.sleep(wait)
+            return {}
+        with selectors.DefaultSelector() as selector:
+            for file, mask in files.items():
+                selector.register(file, mask)
+            return {key.fileobj: mask for key, mask in selector.select(wait)}
 
     def path_create_directory(self, a: I32, b: I32, c: I32):
         raise Exception("not implemented")
 
-    def fd_fdstat_set_flags(self, a: I32, b: I32):
+    def fd_fdstat_set_flags(self, fd: int, flags: int):
+        f = self.fs.fds.get(fd)
+        if f is None:
+            return WasiResult.BADF
+
+        # ソケットはノンブロッキングにでき、読み書きできない場合は AGAIN を返す
+        if f.sock is not None:
+            f.sock.setblocking(not flags & FdFlags.NONBLOCK)
         return WasiResult.SUCCESS
 
-    def random_get(self, a: I32, b: int):
-        rand = random.randint(0, 2**32 - 1)
-        self.exec.memory[b : b + 4] = I32.from_int(rand).to_bytes()[0:4]
+    def random_get(self, buf: int, buf_len: int):
+        if buf + buf_len > len(self.exec.memory):
+            return WasiResult.FAULT
+
+        data = os.urandom(buf_len) if self.random is None else self.random.randbytes(buf_len)
+        self.exec.memory[buf : buf + buf_len] = np.frombuffer(data, dtype=np.uint8)
         return WasiResult.SUCCESS
 
     def sock_open(self, family: int, sock_type: int, ro_fd_pr: int) -> tuple[I32]:
@@ -387,7 +1004,7 @@ class Wasi(WasiBase):
         fd = self.fs.next_fd()
 
         self.fs.add(f"<socket:{fd}>", FSModel(fd=fd, type=FileType.REG, sock=socket, exists=True))
-        self.exec.memory[ro_fd_pr : ro_fd_pr + 4] = I32.from_int(fd).to_bytes()[0:4]
+        self.exec.memory.u32[ro_fd_pr] = fd
         return WasiResult.SUCCESS
 
     def sock_setsockopt(
@@ -439,11 +1056,15 @@ class Wasi(WasiBase):
         socket = self.fs.fds[fd].sock
         assert socket
 
-        child_socket, addr = socket.accept()
+        self.fs.flush()
+        try:
+            child_socket, addr = socket.accept()
+        except BlockingIOError:
+            return WasiResult.AGAIN
         child_fd = self.fs.next_fd()
         self.fs.add(f"<socket:{child_fd}>", FSModel(fd=child_fd, type=FileType.REG, sock=child_socket, exists=True))
 
-        self.exec.memory[ro_fd_ptr : ro_fd_ptr + 4] = I32.from_int(child_fd).to_bytes()[0:4]
+        self.exec.memory.u32[ro_fd_ptr] = child_fd
 
         return WasiResult.SUCCESS
 
@@ -455,9 +1076,9 @@ class Wasi(WasiBase):
         addr = addr.split(".")
         addr = [int(x) for x in addr]
 
-        self.exec.memory[address_ptr : address_ptr + 4] = I32.from_int(len(addr)).to_bytes()[0:4]
-        self.exec.memory[address_type_ptr : address_type_ptr + 4] = I32.from_int(sk.AF_INET).to_bytes()[0:4]
-        self.exec.memory[port_ptr : port_ptr + 4] = I32.from_int(port).to_bytes()[0:4]
+        self.exec.memory.u32[address_ptr] = len(addr)
+        self.exec.memory.u32[address_type_ptr] = sk.AF_INET
+        self.exec.memory.u32[port_ptr] = port
 
         return WasiResult.SUCCESS
 
@@ -473,41 +1094,30 @@ class Wasi(WasiBase):
         socket = self.fs.fds[fd].sock
         assert socket
 
-        data = b""
-        for i in range(ri_data_len):
-            iov = ri_data + 8 * i
-            off = I32.from_bits(self.exec.memory[iov : iov + 4])
-            size = I32.from_bits(self.exec.memory[iov + 4 : iov + 8])
-            data += socket.recv(int(size))
+        views = iovec(self.exec.memory, ri_data, ri_data_len)
+        if views is None:
+            return WasiResult.FAULT
+        self.fs.flush()
+        try:
+            total_size = sock_recv_into(socket, views)
+        except BlockingIOError:
+            return WasiResult.AGAIN
 
-        total_size = 0
-        for i in range(ri_data_len):
-            iov = ri_data + 8 * i
-            max_space = int(I32.from_bits(self.exec.memory[iov + 4 : iov + 8]))
-            space = min(len(data) - total_size, max_space)
-            off = I32.from_bits(self.exec.memory[iov : iov + 4])
-            size = I32.from_int(space)
-            d = data[total_size : total_size + int(size)]
-            self.exec.memory.store(int(off), d)
-            total_size += len(d)
-
-        self.exec.memory[ro_data_len : ro_data_len + 4] = I32.from_int(total_size).to_bytes()[0:4]
+        self.exec.memory.u32[ro_data_len] = total_size
         return WasiResult.SUCCESS
 
     def sock_send(self, fd: int, si_data_ptr: int, si_data_len: int, si_flags: int, so_data_len_ptr: int) -> tuple[I32]:
         socket = self.fs.fds[fd].sock
         assert socket
 
-        loop = self.exec.memory[si_data_ptr : si_data_ptr + si_data_len]
-
-        data = b""
-        for i in range(len(loop)):
-            iov = si_data_ptr + 8 * i
-            off = I32.from_bits(self.exec.memory[iov : iov + 4])
-            size = I32.from_bits(self.exec.memory[iov + 4 : iov + 8])
-            data += self.exec.memory[int(off) : int(off) + int(size)].tobytes()
-
-        socket.send(data)
+        views = iovec(self.exec.memory, si_data_ptr, si_data_len)
+        if views is None:
+            return WasiResult.FAULT
+        try:
+            size = sock_sendmsg(socket, views)
+        except BlockingIOError:
+            return WasiResult.AGAIN
+        self.exec.memory.u32[so_data_len_ptr] = size
         return WasiResult.SUCCESS
 
 
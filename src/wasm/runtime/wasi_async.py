@@ -0,0 +1,195 @@
+import asyncio
+import concurrent.futures
+import io
+import os
+import selectors
+import socket as sk
+import stat
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional
+
+from src.wasm.runtime.error.error import WasmInterruptedError
+from src.wasm.runtime.exec import WasmExec
+from src.wasm.runtime.wasi import FS, Wasi
+from src.wasm.type.base import AnyType
+from src.wasm.type.numeric.numpy.int import I32
+
+if TYPE_CHECKING:
+    from src.wasm.runtime.screen.screen import Screen
+
+
+class AsyncWasi(Wasi):
+    """asyncio のイベントループと組み合わせて使う Wasi
+
+    `start` はゲストを専用のスレッドで実行し、完了を待つコルーチンを返す。ゲストが止まる待ち合わせ
+    (poll_oneoff、標準入力、ブロッキングモードのソケットの accept/recv/send) は、イベントループで待つ。
+    これにより1つのイベントループで複数のインスタンスを並行に実行できる。タスクがキャンセルされると、
+    待ち合わせを解除してゲストを中断する。ソケットを監視できないイベントループ (Windows の ProactorEventLoop)
+    では、ゲストのスレッドで中断要求を確認しながら待つ。
+
+    インタプリタはホストのスタックで再帰するため、ゲストそのものをコルーチンとして中断することはしない。
+    """
+
+    def init(
+        self,
+        exec: WasmExec,
+        fs: Optional[FS] = None,
+        screen: Optional["Screen"] = None,
+        environ: Optional[dict[str, str]] = None,
+        seed: Optional[int] = None,
+    ):
+        super().init(exec, fs=fs, screen=screen, environ=environ, seed=seed)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.waiting: Optional[concurrent.futures.Future] = None
+        # イベントループが add_reader/add_writer に対応しているか
+        self.readers = True
+
+    async def start(self, field: bytes, param: list[AnyType], **kwargs) -> list[AnyType]:
+        """エントリーポイントを別のスレッドで実行し、戻り値を返す。引数は `WasmExec.start` と同じ"""
+        loop = self.loop = asyncio.get_running_loop()
+        done: asyncio.Future[list[AnyType]] = loop.create_future()
+
+        def settle(fn: Callable[[Any], None], value: Any):
+            if not done.done():
+                fn(value)
+
+        def run():
+            try:
+                res = self.exec.start(field, param, **kwargs)
+                loop.call_soon_threadsafe(settle, done.set_result, res)
+            except BaseException as e:
+                loop.call_soon_threadsafe(settle, done.set_exception, e)
+            finally:
+                # _start は proc_exit を呼ばずに戻ることがあるため、ここで出力を書き出す
+                self.fs.flush()
+
+        threading.Thread(target=run, daemon=True).start()
+        try:
+            return await done
+        except asyncio.CancelledError:
+            # ゲストが実行中の場合だけ中断し、止まるまで待ってから次の実行を受け付ける
+            if not done.done():
+                self.exec.interrupt()
+                if self.waiting is not None:
+                    self.waiting.cancel()
+                await asyncio.wait([done])
+            if not done.cancelled():
+                done.exception()
+            raise
+
+    def _wait(self, socket: sk.socket, write: bool):
+        """ソケットが読み書きできるまで待つ。ノンブロッキングのソケットは待たない"""
+        if socket.getblocking():
+            self._select({socket: selectors.EVENT_WRITE if write else selectors.EVENT_READ}, None)
+
+    def _blocks(self, buffer: Any) -> bool:
+        """標準入力の読み込みがブロックするか調べる。イベントループで監視できない入力は待たずに読む"""
+        if self.loop is None or os.name != "posix" or not isinstance(buffer, io.BufferedReader):
+            return False
+        try:
+            fileno = buffer.fileno()
+        except (OSError, ValueError):
+            return False
+        if stat.S_ISREG(os.fstat(fileno).st_mode) or not os.get_blocking(fileno):
+            return False
+
+        # 読み込み済みのデータがあれば待たない
+        os.set_blocking(fileno, False)
+        try:
+            return not buffer.peek(1)
+        finally:
+            os.set_blocking(fileno, True)
+
+    def _select(self, files: dict[Any, int], wait: Optional[float]) -> dict[Any, int]:
+        loop = self.loop
+        if loop is None or not files and wait is None:
+            return super()._select(files, wait)
+
+        if self.readers:
+            try:
+                return self._on_loop(self._ready(files, wait))
+            except NotImplementedError:
+                self.readers = False
+
+        # イベントループで待てない場合は、このスレッドで中断要求を確認しながら待つ
+        deadline = None if wait is None else time.monotonic() + wait
+        while True:
+            if self.exec.interrupted:
+                raise WasmInterruptedError()
+            left = 0.1 if deadline is None else min(max(deadline - time.monotonic(), 0), 0.1)
+            ready = super()._select(files, left)
+            if ready or deadline is not None and time.monotonic() >= deadline:
+                return ready
+
+    async def _ready(self, files: dict[Any, int], wait: Optional[float]) -> dict[Any, int]:
+        """イベントループで `files` を監視し、読み書きできるものとそのイベントを返す"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        ready: dict[Any, int] = {}
+
+        def notify(file: Any, mask: int):
+            ready[file] = ready.get(file, 0) | mask
+            if not future.done():
+                future.set_result(None)
+
+        added: list[tuple[Callable[[Any], bool], Any]] = []
+        try:
+            for file, mask in files.items():
+                if mask & selectors.EVENT_READ:
+                    loop.add_reader(file, notify, file, selectors.EVENT_READ)
+                    added.append((loop.remove_reader, file))
+                if mask & selectors.EVENT_WRITE:
+                    loop.add_writer(file, notify, file, selectors.EVENT_WRITE)
+                    added.append((loop.remove_writer, file))
+            await asyncio.wait([future], timeout=wait)
+        finally:
+            for remove, file in added:
+                remove(file)
+        return ready
+
+    def _on_loop(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """ゲストのスレッドからイベントループでコルーチンを実行し、結果を待つ。キャンセルされるとゲストを中断する"""
+        assert self.loop
+        self.waiting = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            # 待ち始める前に中断された場合も、ここで止める
+            if self.exec.interrupted:
+                self.waiting.cancel()
+            return self.waiting.result()
+        except concurrent.futures.CancelledError:
+            # 中断要求は、最も外側の呼び出しを抜けるときに WasmExec が解除する
+            raise WasmInterruptedError()
+        finally:
+            self.waiting = None
+
+    def fd_read(self, fd: int, iovs: int, iovs_len: int, nread: int):
+        f = self.fs.fds.get(fd)
+        if fd == 0 and f is not None and self._blocks(f.buffer):
+            # 入力を待つ前に、プロンプトなどの出力を書き出す
+            self.fs.flush()
+            self._select({f.buffer: selectors.EVENT_READ}, None)
+        return super().fd_read(fd, iovs, iovs_len, nread)
+
+    def sock_accept(self, fd: int, ro_fd_ptr: int) -> tuple[I32]:
+        socket = self.fs.fds[fd].sock
+        assert socket
+
+        self._wait(socket, write=False)
+        return super().sock_accept(fd, ro_fd_ptr)
+
+    def sock_recv(
+        self, fd: int, ri_data: int, ri_data_len: int, ri_flag: int, ro_data_len: int, ro_flag: int
+    ) -> tuple[I32]:
+        socket = self.fs.fds[fd].sock
+        assert socket
+
+        self._wait(socket, write=False)
+        return super().sock_recv(fd, ri_data, ri_data_len, ri_flag, ro_data_len, ro_flag)
+
+    def sock_send(self, fd: int, si_data_ptr: int, si_data_len: int, si_flags: int, so_data_len_ptr: int) -> tuple[I32]:
+        socket = self.fs.fds[fd].sock
+        assert socket
+
+        self._wait(socket, write=True)
+        return super().sock_send(fd, si_data_ptr, si_data_len, si_flags, so_data_len_ptr)
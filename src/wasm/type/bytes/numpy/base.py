@@ -1,12 +1,73 @@
+import struct
+from functools import cached_property
+from typing import Union
+
 import numpy as np
 
 from src.wasm.type.bytes.base import BytesType
 
 
+class NumpyBytesView:
+    """線形メモリを、バイト単位のアドレスで指定した型の値として読み書きする
+
+    `memory.u32[addr] = x` のように使う。値はリトルエンディアンで、Python の int/float で受け渡しする。
+    """
+
+    def __init__(self, memory: "NumpyBytesType", format: str):
+        self.memory = memory
+        self.struct = struct.Struct(format)
+
+    def __getitem__(self, addr: int) -> Union[int, float]:
+        return self.struct.unpack_from(self.memory.value, addr)[0]
+
+    def __setitem__(self, addr: int, value: Union[int, float]):
+        self.struct.pack_into(self.memory.value, addr, value)
+
+
 class NumpyBytesType(BytesType):
     def __init__(self, value: np.ndarray):
         self.value = value
 
+    @cached_property
+    def u8(self):
+        return NumpyBytesView(self, "<B")
+
+    @cached_property
+    def i8(self):
+        return NumpyBytesView(self, "<b")
+
+    @cached_property
+    def u16(self):
+        return NumpyBytesView(self, "<H")
+
+    @cached_property
+    def i16(self):
+        return NumpyBytesView(self, "<h")
+
+    @cached_property
+    def u32(self):
+        return NumpyBytesView(self, "<I")
+
+    @cached_property
+    def i32(self):
+        return NumpyBytesView(self, "<i")
+
+    @cached_property
+    def u64(self):
+        return NumpyBytesView(self, "<Q")
+
+    @cached_property
+    def i64(self):
+        return NumpyBytesView(self, "<q")
+
+    @cached_property
+    def f32(self):
+        return NumpyBytesView(self, "<f")
+
+    @cached_property
+    def f64(self):
+        return NumpyBytesView(self, "<d")
+
     @classmethod
     def from_str(cls, value: bytes):
         return cls(np.frombuffer(value, dtype=np.uint8))
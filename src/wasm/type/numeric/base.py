@@ -1,3 +1,4 @@
+import sys
 from typing import Union
 
 from src.wasm.type.base import AnyType
@@ -93,12 +94,10 @@ class NumericType(AnyType):
         return self.__class__.from_value(self.value ^ other.value)
 
     def __rshift__(self, other: "NumericType"):
-        length = self.__class__.from_int(self.__class__.get_length())
-        return self.__class__.from_value(self.value >> (other.value % length.value))
+        return self.__class__.from_value(self.value >> (other.value % self.__class__.get_length()))
 
     def __lshift__(self, other: "NumericType"):
-        length = self.__class__.from_int(self.__class__.get_length())
-        return self.__class__.from_value(self.value << (other.value % length.value))
+        return self.__class__.from_value(self.value << (other.value % self.__class__.get_length()))
 
     def __abs__(self):
         return self.__class__.from_value(self.value.__abs__())
@@ -118,28 +117,48 @@ class NumericType(AnyType):
     def __round__(self):
         return self.__class__.from_value(self.value.__round__())
 
+    @classmethod
+    def from_unsigned(cls, value: int):
+        """符号なし整数として表したビット列から値を生成する"""
+        if value > cls.get_max():
+            value -= 1 << cls.get_length()
+        return cls.from_int(value)
+
+    def to_unsigned(self) -> int:
+        """ビット列を符号なし整数として取得する"""
+        return int(self.value) & ((1 << self.__class__.get_length()) - 1)
+
+    @staticmethod
+    def bit_count(value: int) -> int:
+        return bin(value).count("1")
+
+    if sys.version_info >= (3, 10):
+        bit_count = staticmethod(int.bit_count)
+
     def clz(self):
-        if self.value == 0:
-            return self.__class__.from_int(self.__class__.get_length())
-        data = bin(self.value)[2:].zfill(self.__class__.get_length())
-        return self.__class__.from_int(data.index("1"))
+        length = self.__class__.get_length()
+        return self.__class__.from_int(length - self.to_unsigned().bit_length())
 
     def ctz(self):
-        if self.value == 0:
+        value = self.to_unsigned()
+        if value == 0:
             return self.__class__.from_int(self.__class__.get_length())
-        data = bin(self.value)[2:].zfill(self.__class__.get_length())
-        return self.__class__.from_int(data[::-1].index("1"))
+        return self.__class__.from_int((value & -value).bit_length() - 1)
 
     def popcnt(self):
-        return self.__class__.from_int(bin(self.value).count("1"))
+        return self.__class__.from_int(self.bit_count(self.to_unsigned()))
 
     def rotl(self, other: "NumericType"):
-        length = self.__class__.from_int(self.__class__.get_length())
-        return self << other | (self >> length - other)
+        length = self.__class__.get_length()
+        value, shift = self.to_unsigned(), int(other.value) & (length - 1)
+        value = (value << shift | value >> (length - shift)) & ((1 << length) - 1)
+        return self.__class__.from_unsigned(value)
 
     def rotr(self, other: "NumericType"):
-        length = self.__class__.from_int(self.__class__.get_length())
-        return self >> other | (self << length - other)
+        length = self.__class__.get_length()
+        value, shift = self.to_unsigned(), int(other.value) & (length - 1)
+        value = (value >> shift | value << (length - shift)) & ((1 << length) - 1)
+        return self.__class__.from_unsigned(value)
 
     def min(self, other: "NumericType"):
         return self if self.value < other.value else other
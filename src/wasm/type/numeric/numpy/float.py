@@ -10,7 +10,7 @@ from src.wasm.type.numeric.numpy.int import I32
 class FloatType(NumpyNumericType):
     @classmethod
     def from_bool(cls, value: bool):
-        return I32.from_int(1 if value else 0)
+        return I32.TRUE if value else I32.FALSE
 
     def __floor__(self):
         return self.__class__.from_value(np.floor(self.value))
@@ -10,7 +10,7 @@ class UnsignedIntType(NumpyNumericType):
 
     @classmethod
     def from_bool(cls, value: bool):
-        return I32.from_int(1 if value else 0)
+        return I32.TRUE if value else I32.FALSE
 
     @classmethod
     def get_min(cls):
@@ -29,7 +29,7 @@ class SignedIntType(NumpyNumericType):
 
     @classmethod
     def from_bool(cls, value: bool):
-        return I32.from_int(1 if value else 0)
+        return I32.TRUE if value else I32.FALSE
 
     def __truediv__(self, other: "SignedIntType"):
         return self.__floordiv__(other)
@@ -127,6 +127,11 @@ class I16(UnsignedIntType):
 class I32(UnsignedIntType):
     """32bit符号なし整数型"""
 
+    # 頻出する小さい値と真偽値は共有のインスタンスを使う
+    SMALL: dict[int, "I32"] = {}
+    TRUE: "I32"
+    FALSE: "I32"
+
     def __init__(self, value: np.uint32):
         self.value = value
 
@@ -140,7 +145,8 @@ class I32(UnsignedIntType):
 
     @classmethod
     def from_int(cls, value: int):
-        return cls(np.uint32(value))
+        res = cls.SMALL.get(value)
+        return res if res is not None else cls(np.uint32(value))
 
     @classmethod
     def from_str(cls, value: Union[str, bytes]):
@@ -166,6 +172,9 @@ class I32(UnsignedIntType):
 class I64(UnsignedIntType):
     """64bit符号なし整数型"""
 
+    # 頻出する小さい値は共有のインスタンスを使う
+    SMALL: dict[int, "I64"] = {}
+
     def __init__(self, value: np.uint64):
         self.value = value
 
@@ -179,7 +188,8 @@ class I64(UnsignedIntType):
 
     @classmethod
     def from_int(cls, value: int):
-        return cls(np.uint64(value))
+        res = cls.SMALL.get(value)
+        return res if res is not None else cls(np.uint64(value))
 
     @classmethod
     def from_str(cls, value: Union[str, bytes]):
@@ -337,3 +347,7 @@ class SignedI64(SignedIntType):
     def to_bits(self) -> bytes:
         return self.value.astype("<i8")
 
+
+I32.SMALL = {x: I32(np.uint32(x)) for x in range(65)}
+I32.TRUE, I32.FALSE = I32.SMALL[1], I32.SMALL[0]
+I64.SMALL = {x: I64(np.uint64(x)) for x in range(65)}
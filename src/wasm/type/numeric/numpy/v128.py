@@ -0,0 +1,80 @@
+from typing import Union
+
+import numpy as np
+
+from src.wasm.type.numeric.numpy.base import NumpyNumericType
+from src.wasm.type.numeric.numpy.int import I32
+
+
+class V128(NumpyNumericType):
+    """128bitのベクトル型
+
+    値は16バイトの np.uint8 配列で持ち、レーンごとの演算は `lanes` で任意の型の配列として参照して行う。
+    値は変更せず、演算結果は常に新しい配列にする。
+    """
+
+    def __init__(self, value: np.ndarray):
+        self.value = value
+
+    @classmethod
+    def from_null(cls):
+        return cls(np.zeros(16, dtype=np.uint8))
+
+    @classmethod
+    def astype(cls, value: NumpyNumericType):
+        return cls.from_bits(value.to_bits())
+
+    @classmethod
+    def from_int(cls, value: int):
+        return cls.from_bits((value & ((1 << 128) - 1)).to_bytes(16, "little"))
+
+    @classmethod
+    def from_str(cls, value: Union[str, bytes]):
+        return cls.from_int(int(value))
+
+    @classmethod
+    def from_bits(cls, bytes_value: Union[bytes, np.ndarray]):
+        return cls(np.frombuffer(bytes_value, dtype=np.uint8, count=16).copy())
+
+    @classmethod
+    def from_lanes(cls, value: np.ndarray):
+        """レーンの配列から値を生成する"""
+        return cls(np.ascontiguousarray(value).view(np.uint8))
+
+    @classmethod
+    def from_mask(cls, value: np.ndarray, dtype: type[np.signedinteger]):
+        """真偽値の配列から、真のレーンは全ビット1、偽のレーンは0の値を生成する"""
+        return cls.from_lanes(np.where(value, -1, 0).astype(dtype))
+
+    def lanes(self, dtype: type[np.generic]) -> np.ndarray:
+        """値を指定した型のレーンの配列として参照する"""
+        return self.value.view(dtype)
+
+    def to_bits(self) -> bytes:
+        return self.value.tobytes()
+
+    def to_bytes(self) -> np.ndarray:
+        return self.value
+
+    @classmethod
+    def get_length(cls):
+        return 128
+
+    def __int__(self):
+        return int.from_bytes(self.value.tobytes(), "little")
+
+    def __bool__(self):
+        return bool(self.value.any())
+
+    def __eq__(self, other: "V128"):
+        return I32.from_bool(bool(np.array_equal(self.value, other.value)))
+
+    def __ne__(self, other: "V128"):
+        return I32.from_bool(not np.array_equal(self.value, other.value))
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        cls_name = self.__class__.__name__
+        return f"{cls_name}(value=0x{int(self):032X})"
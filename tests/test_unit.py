@@ -1,14 +1,95 @@
+import asyncio
+import io
+import os
+import socket
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from typing import Optional
+from unittest import mock
 
 import numpy as np
 
 sys.path.append(str(Path(__file__).parent.parent))
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
+from src.tools.byte import ByteReader
+from src.wasm.loader.loader import WasmLoader
+from src.wasm.loader.name import WasmNameIndex
+from src.wasm.loader.struct import CodeInstruction
+from src.wasm.optimizer.bounds import WasmBoundsPass
+from src.wasm.optimizer.fold import WasmFoldPass
+from src.wasm.optimizer.idiom import WasmIdiomPass
+from src.wasm.optimizer.optimizer import WasmOptimizer
+from src.wasm.optimizer.struct import (
+    CodeInstructionByteLoop,
+    CodeInstructionInBounds,
+    CodeInstructionOptimize,
+    CodeSectionOptimize,
+    ExportSectionOptimize,
+    FunctionSectionOptimize,
+    MemorySectionOptimize,
+    TypeSectionOptimize,
+    WasmSectionsOptimize,
+)
+from src.wasm.runtime.check.code_exec import CodeSectionBlockDebug
+from src.wasm.runtime.check.stack import NumericStackDebug
+from src.wasm.runtime.entry import WasmExecEntry
+from src.wasm.runtime.error.error import (
+    WasmCallStackExhaustedError,
+    WasmIntegerDivideByZeroError,
+    WasmIntegerOverflowError,
+    WasmInterruptedError,
+    WasmOutOfFuelError,
+    WasmTypeMismatchError,
+)
+from src.wasm.runtime.stack import NumericStack
+from src.wasm.runtime.wasi import (
+    FS,
+    FileType,
+    FSModel,
+    MmapReader,
+    Poll,
+    Wasi,
+    WasiBase,
+    WasiExportHelperUtil,
+    sock_recv_into,
+    sock_sendmsg,
+)
+from src.wasm.runtime.wasi_async import AsyncWasi
+from src.wasm.type.bytes.numpy.base import NumpyBytesType
 from src.wasm.type.numeric.numpy.float import F64
-from src.wasm.type.numeric.numpy.int import I32, SignedI32
+from src.wasm.type.numeric.numpy.int import I32, I64, SignedI32
+from src.wasm.type.numeric.numpy.v128 import V128
+
+
+def op(opcode: int, *args, child=(), else_child=()) -> CodeInstructionOptimize:
+    return CodeInstructionOptimize(opcode=opcode, args=args, child=child, else_child=else_child)
+
+
+def module(
+    functions: list[tuple[bytes, list[int], list[int], list[CodeInstructionOptimize]]], memory: Optional[int] = None
+) -> WasmSectionsOptimize:
+    """(エクスポート名, 引数の型, 戻り値の型, 命令列) の関数と、`memory` ページの線形メモリを持つモジュール"""
+    return WasmSectionsOptimize(
+        import_section=[],
+        type_section=[TypeSectionOptimize(form=0x60, params=p, returns=r) for _, p, r, _ in functions],
+        function_section=[FunctionSectionOptimize(type=i) for i in range(len(functions))],
+        table_section=[],
+        memory_section=[] if memory is None else [MemorySectionOptimize(limits_min=memory, limits_max=None)],
+        start_section=[],
+        global_section=[],
+        element_section=[],
+        code_section=[CodeSectionOptimize(data=code, local=[]) for _, _, _, code in functions],
+        export_section=[
+            ExportSectionOptimize(field_name=ByteReader(name), kind=0x00, index=i)
+            for i, (name, _, _, _) in enumerate(functions)
+        ],
+        data_section=[],
+    )
 
 
 class TestUnit(unittest.TestCase):
@@ -106,3 +187,683 @@ class TestUnit(unittest.TestCase):
     def test_float_sqrt(self):
         a = F64(np.float64(-0.0))
         self.assertEqual(str(a.sqrt().value), str(a.value))
+
+    def test_optimizer_shared_leaf(self):
+        data = [
+            CodeInstruction(opcode=0x02, args=[0x40]),
+            CodeInstruction(opcode=0x20, args=[0]),
+            CodeInstruction(opcode=0x20, args=[0]),
+            CodeInstruction(opcode=0x6A, args=[]),
+            CodeInstruction(opcode=0x0B, args=[]),
+        ]
+        res = WasmOptimizer().expr(data)
+        self.assertEqual(len(res), 1)
+        self.assertEqual(len(res[0].child), 3)
+        self.assertIs(res[0].child[0], res[0].child[1])
+        self.assertIs(res[0].child[2].child, res[0].else_child)
+        self.assertFalse(hasattr(res[0], "__dict__"))
+
+    def test_loader_stream_skip_custom(self):
+        custom = bytes([4]) + b"test" + bytes(1000)
+        module = b"\0asm" + bytes([1, 0, 0, 0])
+        module += bytes([0]) + bytes([0xED, 0x07]) + custom
+        module += bytes([1, 5, 1, 0x60, 0, 1, 0x7F])
+
+        class Stream(io.BytesIO):
+            def seekable(self):
+                return False
+
+        for data in [WasmLoader().load(module), WasmLoader().load_file(Stream(module))]:
+            self.assertEqual(len(data.type_section), 1)
+            self.assertEqual(data.type_section[0].returns, [0x7F])
+
+    def test_name_index(self):
+        data = b"\x00\x02\x01m\x01\r\x02\x00\x03fib\x02\x05other\x02\x0b\x01\x00\x02\x00\x01n\x01\x03tmp"
+        names = WasmNameIndex(ByteReader(data))
+        self.assertEqual(names.module(), "m")
+        self.assertEqual(names.function(0), "fib")
+        self.assertEqual(names.function(2), "other")
+        self.assertIsNone(names.function(1))
+        self.assertEqual(names.local(0, 1), "tmp")
+        self.assertIsNone(WasmNameIndex().function(0))
+
+    def test_fold_const_and_dead_code(self):
+        code = [
+            CodeInstructionOptimize(opcode=0x41, args=[I32.from_int(2)]),
+            CodeInstructionOptimize(opcode=0x41, args=[I32.from_int(3)]),
+            CodeInstructionOptimize(opcode=0x6C),
+            CodeInstructionOptimize(opcode=0x41, args=[I32.from_int(1)]),
+            CodeInstructionOptimize(opcode=0x6A),
+            CodeInstructionOptimize(opcode=0x0F),
+            CodeInstructionOptimize(opcode=0x01),
+        ]
+        res = WasmFoldPass().run(code)
+        self.assertEqual([x.opcode for x in res], [0x41, 0x0F])
+        self.assertEqual(res[0].args[0].value, 7)
+
+        code = [
+            CodeInstructionOptimize(opcode=0x41, args=[I32.from_int(0)]),
+            CodeInstructionOptimize(
+                opcode=0x04,
+                args=[0x40],
+                child=[CodeInstructionOptimize(opcode=0x00)],
+                else_child=[CodeInstructionOptimize(opcode=0x01)],
+            ),
+        ]
+        self.assertEqual(WasmFoldPass().run(code), [])
+
+    def test_bounds_in_range(self):
+        code = [
+            CodeInstructionOptimize(opcode=0x41, args=[I32.from_int(65532)]),
+            CodeInstructionOptimize(opcode=0x28, args=[2, 0]),
+            CodeInstructionOptimize(opcode=0x41, args=[I32.from_int(65532)]),
+            CodeInstructionOptimize(opcode=0x28, args=[2, 4]),
+            CodeInstructionOptimize(opcode=0x20, args=[0]),
+            CodeInstructionOptimize(opcode=0x28, args=[2, 8]),
+            CodeInstructionOptimize(opcode=0x20, args=[0]),
+            CodeInstructionOptimize(opcode=0x20, args=[1]),
+            CodeInstructionOptimize(opcode=0x36, args=[2, 4]),
+            CodeInstructionOptimize(opcode=0x21, args=[0]),
+            CodeInstructionOptimize(opcode=0x20, args=[0]),
+            CodeInstructionOptimize(opcode=0x28, args=[2, 0]),
+        ]
+        res = WasmBoundsPass(64 * 1024).run(code)
+        in_bounds = [isinstance(x, CodeInstructionInBounds) for x in res if x.opcode in (0x28, 0x36)]
+        self.assertEqual(in_bounds, [True, False, False, True, False])
+
+    def test_check_division_trap(self):
+        def block(*args: int):
+            return CodeSectionBlockDebug(env=None, locals=[], stack=NumericStack([I32.from_int(x) for x in args]))  # type: ignore
+
+        err = np.geterr()
+        with self.assertRaises(WasmIntegerDivideByZeroError):
+            block(1, 0).i32_div_u()
+        with self.assertRaises(WasmIntegerOverflowError):
+            block(0x80000000, 0xFFFFFFFF).i32_div_s()
+        b = block(0x80000000, 0xFFFFFFFF)
+        b.i32_rem_s()
+        self.assertEqual(b.stack.value, [I32.from_int(0)])
+        self.assertEqual(np.geterr(), err)
+
+    def test_bit_operation(self):
+        a = I32.from_int(0x00F0F000)
+        self.assertEqual(a.clz().value, 8)
+        self.assertEqual(a.ctz().value, 12)
+        self.assertEqual(a.popcnt().value, 8)
+        self.assertEqual(I32.from_int(0).clz().value, 32)
+        self.assertEqual(I64.from_int(0).ctz().value, 64)
+        self.assertEqual(a.rotl(I32.from_int(12)).value, 0x0F000000 | 0xF)
+        self.assertEqual(a.rotr(I32.from_int(44)).value, 0x00000F0F)
+        self.assertEqual(I64.from_int(1).rotr(I64.from_int(1)).value, 1 << 63)
+        self.assertEqual(SignedI32.from_int(-1).rotl(I32.from_int(5)).value, -1)
+        self.assertEqual(SignedI32.from_int(-1).popcnt().value, 32)
+
+    def test_shared_constant(self):
+        self.assertIs(I32.from_int(1) < I32.from_int(2), I32.TRUE)
+        self.assertIs(F64.from_int(1) < F64.from_int(0), I32.FALSE)
+        self.assertIs(I64.from_int(3), I64.from_int(3))
+        self.assertEqual(I32.from_int(100000).value, 100000)
+
+        loader = WasmLoader()
+        a, b = loader.const(I32, -1), loader.const(I32, -1)
+        self.assertIs(a, b)
+        self.assertEqual(a.value, 0xFFFFFFFF)
+
+    def test_simd_lane_operation(self):
+        a = V128.from_lanes(np.array([1, 2, 0xFFFFFFFF, 4], dtype=np.uint32))
+        b = V128.from_lanes(np.array([10, 20, 1, 0x80000000], dtype=np.uint32))
+        block = CodeSectionBlockDebug(env=None, locals=[], stack=NumericStack([a, b]))  # type: ignore
+        block.i32x4_add()
+        self.assertEqual(list(block.stack.value[-1].lanes(np.uint32)), [11, 22, 0, 0x80000004])
+
+        block = CodeSectionBlockDebug(env=None, locals=[], stack=NumericStack([a, b]))  # type: ignore
+        block.i32x4_lt_s()
+        block.i32x4_bitmask()
+        self.assertEqual(block.stack.value, [I32.from_int(0b0111)])
+
+        data = bytes([0xFD, 0x0C]) + bytes(range(16)) + bytes([0x0B])
+        instruction = WasmLoader().code_section_instructions(ByteReader(data))
+        self.assertEqual(int(instruction[0].args[0]), int.from_bytes(bytes(range(16)), "little"))
+
+    def test_batch_map(self):
+        # x > 10 なら 100、そうでなければ x * 2 を返す
+        score = [
+            op(0x02, 0x7F, child=[
+                op(0x41, I32.from_int(100)),
+                op(0x20, 0), op(0x41, I32.from_int(10)), op(0x4B), op(0x0D, 0),
+                op(0x1A),
+                op(0x20, 0), op(0x41, I32.from_int(2)), op(0x6C),
+            ]),
+        ]  # fmt: skip
+        div = [op(0x41, I32.from_int(100)), op(0x20, 0), op(0x6E)]
+        instance = WasmExecEntry.entry(module([(b"score", [0x7F], [0x7F], score), (b"div", [0x7F], [0x7F], div)]))
+        res = instance.map(b"score", [[I32.from_int(x)] for x in [1, 10, 11, 50]])
+        self.assertEqual([int(x[0].value) for x in res], [2, 20, 100, 100])
+
+        res = instance.map(b"div", [[I32.from_int(x)] for x in [3, 7]])
+        self.assertEqual([int(x[0].value) for x in res], [33, 14])
+        self.assertEqual(instance.map(b"div", []), [])
+
+        # ホストのスタックが尽きる深さの再帰は、start と同じように実行する
+        depth = [
+            op(0x20, 0), op(0x45),
+            op(0x04, 0x7F, child=[op(0x41, I32.from_int(0))], else_child=[
+                op(0x20, 0), op(0x41, I32.from_int(1)), op(0x6B), op(0x10, 0),
+                op(0x41, I32.from_int(1)), op(0x6A),
+            ]),
+        ]  # fmt: skip
+        instance = WasmExecEntry.entry(module([(b"depth", [0x7F], [0x7F], depth)]))
+        self.assertEqual(instance.map(b"depth", [[I32.from_int(10)]])[0][0].value, 10)
+        with self.assertRaises(WasmCallStackExhaustedError):
+            instance.map(b"depth", [[I32.from_int(sys.getrecursionlimit())]])
+
+    def test_idiom_byte_fill(self):
+        # for (i = 0; i < n; i++) mem[100 + i] = v
+        loop = [
+            op(0x20, 0), op(0x20, 1), op(0x4F), op(0x0D, 1),
+            op(0x41, I32.from_int(100)), op(0x20, 0), op(0x6A), op(0x20, 2), op(0x3A, 0, 0),
+            op(0x20, 0), op(0x41, I32.from_int(1)), op(0x6A), op(0x21, 0),
+            op(0x0C, 0),
+        ]  # fmt: skip
+        res = WasmIdiomPass().run([op(0x02, 0x40, child=[op(0x03, 0x40, child=loop)])])
+        self.assertIsInstance(res[0], CodeInstructionByteLoop)
+        self.assertEqual((res[0].index, res[0].dst_offset), (0, 0))
+        self.assertIsNone(res[0].src)
+
+        # ループ変数を値として書き込む場合は対象外
+        loop[7] = op(0x20, 0)
+        res = WasmIdiomPass().run([op(0x02, 0x40, child=[op(0x03, 0x40, child=loop)])])
+        self.assertNotIsInstance(res[0], CodeInstructionByteLoop)
+
+    def test_tail_call(self):
+        # n == 0 なら acc、そうでなければ return_call count(n - 1, acc + 1)
+        count = [
+            op(0x20, 0), op(0x45),
+            op(0x04, 0x7F, child=[op(0x20, 1)], else_child=[
+                op(0x20, 0), op(0x41, I32.from_int(1)), op(0x6B),
+                op(0x20, 1), op(0x41, I32.from_int(1)), op(0x6A),
+                op(0x12, 0),
+            ]),
+        ]  # fmt: skip
+        depth = sys.getrecursionlimit() * 2
+        res = WasmExecEntry.entry(module([(b"count", [0x7F, 0x7F], [0x7F], count)])).start(
+            b"count", [I32.from_int(depth), I32.from_int(0)]
+        )
+        self.assertEqual(res[0].value, depth)
+
+    def test_fuel(self):
+        wasm = WasmExecEntry.entry(self.__countdown())
+
+        # 関数の呼び出しで1、9回の繰り返しで9を消費する
+        self.assertEqual(wasm.start(b"countdown", [I32.from_int(10)], fuel=100)[0].value, 0)
+        self.assertEqual(wasm.fuel, 90)
+
+        with self.assertRaises(WasmOutOfFuelError):
+            wasm.start(b"countdown", [I32.from_int(10)], fuel=5)
+        self.assertEqual(wasm.fuel, 0)
+
+        self.assertEqual(wasm.start(b"countdown", [I32.from_int(10)])[0].value, 0)
+        self.assertIsNone(wasm.fuel)
+
+    def test_interrupt(self):
+        wasm = WasmExecEntry.entry(self.__countdown())
+
+        with self.assertRaises(WasmInterruptedError):
+            wasm.start(b"countdown", [I32.from_int(0xFFFFFFFF)], timeout=0.05)
+
+        timer = threading.Timer(0.05, wasm.interrupt)
+        timer.start()
+        with self.assertRaises(WasmInterruptedError):
+            wasm.start(b"countdown", [I32.from_int(0xFFFFFFFF)])
+        timer.join()
+
+        self.assertEqual(wasm.start(b"countdown", [I32.from_int(10)], timeout=10)[0].value, 0)
+
+        # 呼び出しの後に届いた中断要求は、次の呼び出しに持ち越さない
+        wasm.interrupt()
+        self.assertEqual(wasm.start(b"countdown", [I32.from_int(5)])[0].value, 0)
+        self.assertFalse(wasm.metered)
+
+        # ホスト関数からの呼び出しは、外側の燃料から消費し、中断要求も外側に残す
+        with wasm.call(100, None):
+            self.assertEqual(wasm.start(b"countdown", [I32.from_int(10)])[0].value, 0)
+            self.assertEqual(wasm.fuel, 90)
+            with self.assertRaises(WasmOutOfFuelError):
+                wasm.start(b"countdown", [I32.from_int(1000)], fuel=1000)
+            self.assertEqual(wasm.fuel, 0)
+        with wasm.call(None, None):
+            wasm.interrupt()
+            with self.assertRaises(WasmInterruptedError):
+                wasm.start(b"countdown", [I32.from_int(10)])
+            self.assertTrue(wasm.interrupted)
+        self.assertFalse(wasm.interrupted)
+
+        # バッチ実行もループの繰り返しごとに実行期限を確認する
+        with self.assertRaises(WasmInterruptedError):
+            wasm.map(b"countdown", [[I32.from_int(0xFFFFFFFF)], [I32.from_int(1)]], timeout=0.05)
+
+    def test_stack_type_check(self):
+        stack = NumericStack([I32.from_int(3), F64.from_int(1.5)])
+        self.assertEqual(stack.i32(read_only=True, key=0).value, 3)
+        self.assertEqual(stack.f64().value, 1.5)
+        self.assertEqual(stack.int(), 3)
+
+        stack = NumericStackDebug([I32.from_int(1), F64.from_int(1.5)])
+        with self.assertRaises(WasmTypeMismatchError):
+            stack.i32()
+        self.assertTrue(stack.bool())
+
+    def test_fs_fd_table(self):
+        fs = FS()
+        fs.mount("./a", io.BytesIO(b"a"), fd=5)
+        self.assertEqual(fs.next_fd(), 4)
+        fs.mount("./b", io.BytesIO(b"b"))
+        self.assertEqual(fs.next_fd(), 6)
+        self.assertIs(fs.fds[5], fs.files["./a"])
+
+        fs.add("<socket:6>", FSModel(fd=6, type=FileType.REG, exists=True))
+        fs.remove(4)
+        self.assertNotIn("./b", fs.files)
+        self.assertEqual(fs.next_fd(), 4)
+        self.assertEqual(sorted(fs.fds), [0, 1, 2, 3, 5, 6])
+
+    def test_wasi_fd_write(self):
+        out = io.BytesIO()
+        fs = FS()
+        fs.mount("out", out, fd=5)
+        wasi = self.__wasi(fs)
+
+        memory = wasi.exec.memory
+        memory.store(0, np.array([16, 7, 32, 5], dtype="<u4").tobytes())
+        memory.store(16, b"Hello, ")
+        memory.store(32, b"World")
+        self.assertEqual(wasi.fd_write(5, 0, 2, 48), (I32.from_int(0),))
+        self.assertEqual(out.getvalue(), b"Hello, World")
+        self.assertEqual(int(I32.from_bits(memory[48:52])), 12)
+
+        self.assertEqual(wasi.fd_write(9, 0, 2, 48), (I32.from_int(8),))
+
+        # 線形メモリの外を指す iovec は、短く読み書きせずに FAULT を返す
+        memory.store(0, np.array([65536 - 4, 8], dtype="<u4").tobytes())
+        self.assertEqual(wasi.fd_write(5, 0, 1, 48), (I32.from_int(21),))
+        self.assertEqual(wasi.fd_read(5, 0, 1, 48), (I32.from_int(21),))
+        self.assertEqual(wasi.fd_write(5, 65536 - 4, 1, 48), (I32.from_int(21),))
+        self.assertEqual(out.getvalue(), b"Hello, World")
+
+        # マウントしたファイルも filestat を書き込む
+        self.assertEqual(wasi.fd_filestat_get(5, 200), (I32.from_int(0),))
+        self.assertEqual((memory.u8[216], memory.u64[224], memory.u64[232]), (FileType.REG, 1, 12))
+        memory.store(100, b"out")
+        memory[200:264] = 0xFF
+        self.assertEqual(wasi.path_filestat_get(3, 0, 100, 3, 200), (I32.from_int(0),))
+        self.assertEqual((memory.u8[216], memory.u64[224], memory.u64[232]), (FileType.REG, 1, 12))
+
+    def test_wasi_fd_read(self):
+        fs = FS()
+        fs.mount("in", io.BytesIO(b"Hello, World"), fd=5)
+        wasi = self.__wasi(fs)
+
+        memory = wasi.exec.memory
+        memory.store(0, np.array([16, 7, 32, 10], dtype="<u4").tobytes())
+        self.assertEqual(wasi.fd_read(5, 0, 2, 48), (I32.from_int(0),))
+        self.assertEqual(memory[16:23].tobytes() + memory[32:37].tobytes(), b"Hello, World")
+        self.assertEqual(int(I32.from_bits(memory[48:52])), 12)
+
+        # ソケットも iovec に直接受信する
+        a, b = socket.socketpair()
+        fs.add("<socket:6>", FSModel(fd=6, type=FileType.REG, sock=a, exists=True))
+        b.sendall(b"0123456789")
+        self.assertEqual(wasi.sock_recv(6, 0, 2, 0, 48, 52), (I32.from_int(0),))
+        self.assertEqual(memory[16:23].tobytes() + memory[32:35].tobytes(), b"0123456789")
+        self.assertEqual(int(I32.from_bits(memory[48:52])), 10)
+        a.close()
+        b.close()
+
+    def test_wasi_sock_fallback(self):
+        class PlainSocket:
+            """sendmsg/recvmsg_into の無い環境 (Windows) のソケット"""
+
+            def __init__(self, sock: socket.socket):
+                self.sock = sock
+
+            def fileno(self) -> int:
+                return self.sock.fileno()
+
+            def send(self, data) -> int:
+                return self.sock.send(data)
+
+            def recv_into(self, buffer) -> int:
+                return self.sock.recv_into(buffer)
+
+        a, b = socket.socketpair()
+        self.assertEqual(sock_sendmsg(PlainSocket(a), [memoryview(b"Hello, "), memoryview(b"World")]), 12)  # type: ignore
+        self.assertEqual(b.recv(100), b"Hello, World")
+
+        # 読めるだけ受信し、残りの iovec では待たない
+        buffer = bytearray(16)
+        view = memoryview(buffer)
+        b.sendall(b"0123456789")
+        self.assertEqual(sock_recv_into(PlainSocket(a), [view[0:4], view[4:8], view[8:16]]), 10)  # type: ignore
+        self.assertEqual(bytes(buffer[0:10]), b"0123456789")
+        a.close()
+        b.close()
+
+    def test_wasi_preopen(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.mkdir(os.path.join(tmp, "sub"))
+            with open(os.path.join(tmp, "sub", "a.txt"), "wb") as f:
+                f.write(b"Hello, World")
+
+            fs = FS(mmap_size=1)
+            fs.preopen("/data", tmp)
+            wasi = self.__wasi(fs)
+            memory = wasi.exec.memory
+            self.assertEqual(fs.next_fd(), 5)
+
+            # ホストのファイルを開いて読み込む
+            memory.store(100, b"sub/a.txt")
+            self.assertEqual(wasi.path_open(4, 0, 100, 9, 0, 0, 0, 0, 48), (I32.from_int(0),))
+            fd = int(I32.from_bits(memory[48:52]))
+            self.assertIsNone(fs.fds[fd].buffer)
+            memory.store(0, np.array([16, 32], dtype="<u4").tobytes())
+            self.assertEqual(wasi.fd_read(fd, 0, 1, 48), (I32.from_int(0),))
+            self.assertEqual(memory[16:28].tobytes(), b"Hello, World")
+            self.assertIsInstance(fs.fds[fd].buffer, MmapReader)
+
+            self.assertEqual(wasi.path_filestat_get(4, 1, 100, 9, 200), (I32.from_int(0),))
+            self.assertEqual(memory[216], FileType.REG)
+            self.assertEqual(int(I64.from_bits(memory[232:240])), 12)
+            self.assertEqual(wasi.fd_close(fd), (I32.from_int(0),))
+            self.assertNotIn(fd, fs.fds)
+
+            # ディレクトリの一覧
+            memory.store(100, b"sub")
+            self.assertEqual(wasi.path_open(4, 0, 100, 3, 2, 0, 0, 0, 48), (I32.from_int(0),))
+            fd = int(I32.from_bits(memory[48:52]))
+            self.assertEqual(wasi.fd_readdir(fd, 300, 256, 2, 48), (I32.from_int(0),))
+            self.assertEqual(int(I32.from_bits(memory[48:52])), 24 + 5)
+            self.assertEqual((memory[320], memory[324:329].tobytes()), (FileType.REG, b"a.txt"))
+
+            # preopen の外は開けない
+            memory.store(100, b"../a")
+            self.assertEqual(wasi.path_open(4, 0, 100, 4, 0, 0, 0, 0, 48), (I32.from_int(76),))
+
+            # ホストのエラーは WASI のエラーとして返す
+            memory.store(100, b"b.txt")
+            self.assertEqual(wasi.path_open(4, 0, 100, 5, 8, 0, 0, 0, 48), (I32.from_int(44),))
+            self.assertFalse(os.path.exists(os.path.join(tmp, "b.txt")))
+            memory.store(100, b"no/b.txt")
+            self.assertEqual(wasi.path_open(4, 0, 100, 8, 1, 0, 0, 0, 48), (I32.from_int(44),))
+            memory.store(100, b"sub")
+            self.assertIn(wasi.path_open(4, 0, 100, 3, 8, 0, 0, 0, 48), [(I32.from_int(31),), (I32.from_int(2),)])
+            fs.add("<dir>", FSModel(fd=20, type=FileType.REG, host=os.path.join(tmp, "sub"), exists=True))
+            self.assertIn(wasi.fd_read(20, 0, 1, 48), [(I32.from_int(31),), (I32.from_int(2),)])
+
+    def test_wasi_preopen_symlink(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root, outside = os.path.join(tmp, "root"), os.path.join(tmp, "outside")
+            os.mkdir(root)
+            os.mkdir(outside)
+            with open(os.path.join(outside, "secret"), "wb") as f:
+                f.write(b"SECRET")
+            try:
+                os.symlink(outside, os.path.join(root, "link"))
+            except OSError:
+                self.skipTest("symlink is not supported")
+
+            fs = FS()
+            fs.preopen("/data", root)
+            wasi = self.__wasi(fs)
+            memory = wasi.exec.memory
+
+            # リンクを辿ると preopen の外を指すものは開けない
+            memory.store(100, b"link/secret")
+            self.assertEqual(wasi.path_open(4, 1, 100, 11, 0, 0, 0, 0, 48), (I32.from_int(76),))
+            self.assertEqual(wasi.path_filestat_get(4, 1, 100, 11, 200), (I32.from_int(76),))
+            memory.store(100, b"link")
+            self.assertEqual(wasi.path_open(4, 1, 100, 4, 0, 0, 0, 0, 48), (I32.from_int(76),))
+            # 辿らない場合はリンクそのものを調べる
+            self.assertEqual(wasi.path_filestat_get(4, 0, 100, 4, 200), (I32.from_int(0),))
+            self.assertEqual(memory[216], FileType.SYMLINK)
+            self.assertEqual(wasi.path_open(4, 0, 100, 4, 0, 0, 0, 0, 48), (I32.from_int(32),))
+
+            # preopen したディレクトリの ".." は自身を指す
+            self.assertEqual(wasi.fd_readdir(4, 300, 256, 0, 48), (I32.from_int(0),))
+            self.assertEqual(memory[324:325].tobytes() + memory[349:351].tobytes(), b"...")
+            self.assertEqual(int(I64.from_bits(memory[333:341])), int(I64.from_bits(memory[308:316])))
+
+    def test_wasi_poll_oneoff(self):
+        a, b = socket.socketpair()
+        fs = FS()
+        fs.add("<socket:4>", FSModel(fd=4, type=FileType.REG, sock=a, exists=True))
+        wasi = self.__wasi(fs)
+        memory = wasi.exec.memory
+
+        # 10ms のタイマーと fd 4 の読み込み
+        subscriptions = np.zeros(2, dtype=Poll.SUBSCRIPTION)
+        subscriptions[0] = (1, Poll.CLOCK, 1, 10_000_000, 0)
+        subscriptions[1] = (2, Poll.FD_READ, 4, 0, 0)
+        memory.store(0, subscriptions.tobytes())
+
+        self.assertEqual(wasi.poll_oneoff(0, 200, 2, 400), (I32.from_int(0),))
+        self.assertEqual(int(I32.from_bits(memory[400:404])), 1)
+        self.assertEqual(memory[200:264].view(Poll.EVENT).tolist()[0], (1, 0, Poll.CLOCK))
+
+        b.sendall(b"x")
+        self.assertEqual(wasi.poll_oneoff(0, 200, 2, 400), (I32.from_int(0),))
+        self.assertEqual(int(I32.from_bits(memory[400:404])), 1)
+        self.assertEqual(memory[200:232].view(Poll.EVENT).tolist()[0], (2, 0, Poll.FD_READ))
+
+        # ノンブロッキングのソケットは読み込めない場合 AGAIN を返す
+        a.recv(1)
+        self.assertEqual(wasi.fd_fdstat_set_flags(4, 4), (I32.from_int(0),))
+        memory.store(0, np.array([16, 8], dtype="<u4").tobytes())
+        self.assertEqual(wasi.sock_recv(4, 0, 1, 0, 48, 52), (I32.from_int(6),))
+        a.close()
+        b.close()
+
+        # clock_time_get の単調時計で作った絶対時刻まで待つ
+        self.assertEqual(wasi.clock_time_get(1, 0, 500), (I32.from_int(0),))
+        subscriptions = np.zeros(1, dtype=Poll.SUBSCRIPTION)
+        subscriptions[0] = (3, Poll.CLOCK, 1, memory.u64[500] + 20_000_000, Poll.ABSTIME)
+        memory.store(0, subscriptions.tobytes())
+        start = time.monotonic()
+        self.assertEqual(wasi.poll_oneoff(0, 200, 1, 400), (I32.from_int(0),))
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(memory[200:232].view(Poll.EVENT).tolist()[0], (3, 0, Poll.CLOCK))
+
+    def test_wasi_async(self):
+        async def main():
+            # 2つのインスタンスを1つのイベントループで並行に実行する
+            a, b = AsyncWasi(), AsyncWasi()
+            a.init(exec=WasmExecEntry.entry(self.__countdown()))
+            b.init(exec=WasmExecEntry.entry(self.__countdown()))
+            res = await asyncio.gather(
+                a.start(b"countdown", [I32.from_int(100)]), b.start(b"countdown", [I32.from_int(200)])
+            )
+            self.assertEqual([x[0].value for x in res], [0, 0])
+
+            # キャンセルするとゲストを中断する
+            task = asyncio.create_task(a.start(b"countdown", [I32.from_int(0xFFFFFFFF)]))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual((await a.start(b"countdown", [I32.from_int(10)]))[0].value, 0)
+
+            # ソケットの受信はイベントループで待つ
+            left, right = socket.socketpair()
+            fs = FS()
+            fs.add("<socket:4>", FSModel(fd=4, type=FileType.REG, sock=left, exists=True))
+            wasi = AsyncWasi()
+            wasi.init(exec=self.__wasi(fs).exec, fs=fs)
+            wasi.loop = asyncio.get_running_loop()
+            wasi.exec.memory.store(0, np.array([16, 8], dtype="<u4").tobytes())
+            recv = asyncio.create_task(asyncio.to_thread(wasi.sock_recv, 4, 0, 1, 0, 48, 52))
+            await asyncio.sleep(0.05)
+            self.assertFalse(recv.done())
+            right.sendall(b"ping")
+            self.assertEqual(await recv, (I32.from_int(0),))
+            self.assertEqual(wasi.exec.memory[16:20].tobytes(), b"ping")
+
+            # ソケットを監視できないイベントループでは、ゲストのスレッドで待つ
+            with mock.patch.object(wasi.loop, "add_reader", side_effect=NotImplementedError):
+                recv = asyncio.create_task(asyncio.to_thread(wasi.sock_recv, 4, 0, 1, 0, 48, 52))
+                await asyncio.sleep(0.05)
+                self.assertFalse(recv.done())
+                right.sendall(b"pong")
+                self.assertEqual(await recv, (I32.from_int(0),))
+            self.assertFalse(wasi.readers)
+            self.assertEqual(wasi.exec.memory[16:20].tobytes(), b"pong")
+            left.close()
+            right.close()
+
+            # poll_oneoff のタイマーはイベントループで待ち、キャンセルするとゲストを中断する
+            wasi = AsyncWasi()
+            wasi.init(exec=self.__wasi(FS()).exec)
+            wasi.loop = asyncio.get_running_loop()
+            subscriptions = np.zeros(1, dtype=Poll.SUBSCRIPTION)
+            subscriptions[0] = (1, Poll.CLOCK, 1, 50_000_000, 0)
+            wasi.exec.memory.store(0, subscriptions.tobytes())
+            poll = asyncio.create_task(asyncio.to_thread(wasi.poll_oneoff, 0, 200, 1, 400))
+            await asyncio.sleep(0.01)
+            self.assertIsNotNone(wasi.waiting)
+            self.assertEqual(await poll, (I32.from_int(0),))
+            self.assertEqual(wasi.exec.memory[200:232].view(Poll.EVENT).tolist()[0], (1, 0, Poll.CLOCK))
+
+            subscriptions[0] = (1, Poll.CLOCK, 1, 10_000_000_000, 0)
+            wasi.exec.memory.store(0, subscriptions.tobytes())
+            poll = asyncio.create_task(asyncio.to_thread(wasi.poll_oneoff, 0, 200, 1, 400))
+            await asyncio.sleep(0.01)
+            assert wasi.waiting
+            wasi.waiting.cancel()
+            with self.assertRaises(WasmInterruptedError):
+                await poll
+            self.assertFalse(wasi.exec.interrupted)
+
+            # 標準入力もイベントループで待つ
+            r, w = os.pipe()
+            with open(r, "rb") as stdin:
+                wasi = AsyncWasi()
+                wasi.init(exec=self.__wasi(FS()).exec, fs=FS(stdin=stdin))
+                wasi.loop = asyncio.get_running_loop()
+                wasi.exec.memory.store(0, np.array([16, 8], dtype="<u4").tobytes())
+                read = asyncio.create_task(asyncio.to_thread(wasi.fd_read, 0, 0, 1, 48))
+                await asyncio.sleep(0.05)
+                self.assertFalse(read.done())
+                self.assertIsNotNone(wasi.waiting)
+                os.write(w, b"hi")
+                self.assertEqual(await read, (I32.from_int(0),))
+                self.assertEqual(wasi.exec.memory[16:18].tobytes(), b"hi")
+                self.assertEqual(int(I32.from_bits(wasi.exec.memory[48:52])), 2)
+                os.close(w)
+
+        asyncio.run(main())
+
+    def test_wasi_stdout_sink(self):
+        chunks: list[bytes] = []
+        stderr = io.BytesIO()
+        fs = FS(stdin=io.BufferedReader(io.BytesIO(b"")), stdout=chunks.append, stderr=stderr)
+        wasi = self.__wasi(fs)
+
+        # マルチバイト文字の途中で区切られても、バイト列のまま書き込む
+        text = "こんにちは".encode()
+        wasi.exec.memory.store(16, text)
+        for iov in [(16, 4), (20, len(text) - 4)]:
+            wasi.exec.memory.store(0, np.array(iov, dtype="<u4").tobytes())
+            self.assertEqual(wasi.fd_write(1, 0, 1, 48), (I32.from_int(0),))
+            self.assertEqual(wasi.fd_write(2, 0, 1, 48), (I32.from_int(0),))
+        self.assertEqual(chunks, [])
+        self.assertEqual(stderr.getvalue(), text)
+        self.assertEqual(wasi.fd_write(0, 0, 1, 48), (I32.from_int(8),))
+
+        # proc_exit で書き出す
+        with self.assertRaises(SystemExit):
+            wasi.proc_exit(0)
+        self.assertEqual(b"".join(chunks), text)
+
+        # テキストのストリームにはデコードして書き込む
+        stdout = io.StringIO()
+        wasi = self.__wasi(FS(stdout=stdout))
+        wasi.exec.memory.store(16, text)
+        for iov in [(16, 4), (20, len(text) - 4)]:
+            wasi.exec.memory.store(0, np.array(iov, dtype="<u4").tobytes())
+            self.assertEqual(wasi.fd_write(1, 0, 1, 48), (I32.from_int(0),))
+        wasi.fs.flush()
+        self.assertEqual(stdout.getvalue(), "こんにちは")
+
+        # 生のストリームはバッファリングし、with を抜けると書き出す
+        with tempfile.TemporaryFile() as tmp:
+            raw = io.FileIO(tmp.fileno(), "wb", closefd=False)
+            with self.__wasi(FS(stdout=raw)) as wasi:
+                self.assertIsInstance(wasi.fs.fds[1].buffer, io.BufferedWriter)
+                wasi.exec.memory.store(0, np.array([16, len(text)], dtype="<u4").tobytes())
+                self.assertEqual(wasi.fd_write(1, 0, 1, 48), (I32.from_int(0),))
+                self.assertEqual(os.fstat(tmp.fileno()).st_size, 0)
+            self.assertEqual(os.fstat(tmp.fileno()).st_size, len(text))
+
+    def test_wasi_random_get(self):
+        wasi = self.__wasi(FS())
+        memory = wasi.exec.memory
+        self.assertEqual(wasi.random_get(100, 4096), (I32.from_int(0),))
+        self.assertTrue(memory[100:4196].any())
+        self.assertFalse(memory[4196:4200].any())
+        self.assertEqual(wasi.random_get(len(memory) - 8, 16), (I32.from_int(21),))
+
+        # seed を指定すると同じ値になる
+        a, b = self.__wasi(FS(), seed=1), self.__wasi(FS(), seed=1)
+        a.random_get(0, 32)
+        b.random_get(0, 32)
+        self.assertEqual(a.exec.memory[0:32].tobytes(), b.exec.memory[0:32].tobytes())
+
+    def test_wasi_export_bind(self):
+        class Env(WasiBase):
+            def add(self, a: int, b: I64) -> tuple[I64]:
+                return (I64.from_int(a + int(b)),)
+
+            def nop(self, a: I32):
+                pass
+
+        export = {x.name: x.data for x in WasiExportHelperUtil.export(Env(), "env", log=False)}
+        self.assertEqual((export["add"].type.params, export["add"].type.returns), ([0x7F, 0x7E], [0x7E]))
+        self.assertEqual(export["add"].call([I32.from_int(1), I64.from_int(2)])[0].value, 3)
+        self.assertEqual(export["nop"].call([I32.from_int(1)]), [])
+
+        export = {x.name: x.data for x in WasiExportHelperUtil.export(Env(), "env", log=True)}
+        with self.assertLogs("src.wasm.runtime.wasi", level="DEBUG"):
+            export["nop"].call([I32.from_int(1)])
+
+    def test_wasi_export_signature(self):
+        class Env(WasiBase):
+            @WasiExportHelperUtil.signature([I32, F64], [I32, F64])
+            def scale(self, a, b):
+                return a - 2, a * b
+
+        export = {x.name: x.data for x in WasiExportHelperUtil.export(Env(), "env", log=False)}
+        self.assertEqual((export["scale"].type.params, export["scale"].type.returns), ([0x7F, 0x7C], [0x7F, 0x7C]))
+        a, b = export["scale"].call([I32.from_int(1), F64.from_int(1.5)])
+        self.assertEqual((a.value, b.value), (0xFFFFFFFF, 1.5))
+
+    def test_memory_typed_view(self):
+        memory = NumpyBytesType.from_size(16)
+        memory.u32[1] = 0xDEADBEEF
+        self.assertEqual(memory[1:5].tobytes(), b"\xef\xbe\xad\xde")
+        self.assertEqual(memory.i32[1], -559038737)
+        memory.grow(16)
+        memory.f64[24] = 2.5
+        self.assertEqual(memory.f64[24], 2.5)
+        self.assertEqual(memory.u8[24 + 7], 0x40)
+
+    def __countdown(self) -> WasmSectionsOptimize:
+        """n が 0 になるまでループする関数 countdown(n) だけのモジュール"""
+        countdown = [
+            op(0x03, 0x40, child=[op(0x20, 0), op(0x41, I32.from_int(1)), op(0x6B), op(0x22, 0), op(0x0D, 0)]),
+            op(0x20, 0),
+        ]
+        return module([(b"countdown", [0x7F], [0x7F], countdown)])
+
+    def __wasi(self, fs: FS, **kwargs) -> Wasi:
+        """1ページの線形メモリを持つ空のモジュールで Wasi を初期化する"""
+        wasi = Wasi()
+        wasi.init(exec=WasmExecEntry.entry(module([], memory=1)), fs=fs, **kwargs)
+        return wasi